@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+뉴스 수집 벤치마크 (네이버 뉴스 검색 API 스텁)
+로컬 HTTP 스텁 서버가 네이버 API와 같은 형식의 응답을 지정한 지연 시간 뒤에 반환하고,
+기존 방식(쿼리와 페이지를 순서대로 요청하며 매번 0.1초 대기)과
+collect_news_articles(쿼리 동시 수집 + 토큰 버킷 속도 제한)의 소요 시간과 수집 건수를 비교합니다.
+
+사용 예:
+    python benchmarks/benchmark_collection.py
+    python benchmarks/benchmark_collection.py --latency 0.2 --concurrency 1 4 8 --rate 10
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytz
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mlnews'))
+import daily_news_analyzer as analyzer # noqa: E402
+
+KST = pytz.timezone('Asia/Seoul')
+QUERIES = ['경제', '사회', '정치', '국제', '문화', 'IT', '과학', '부동산', '증시', '인공지능', '환경', '교육', '건강']
+STUB_TOTAL_ITEMS = 1000 # 쿼리당 스텁이 반환하는 최대 기사 수 (네이버 API 제한과 같음)
+
+def make_stub_handler(latency, minutes_per_article, now):
+    """쿼리마다 minutes_per_article분 간격으로 최신순 기사를 반환하는 요청 핸들러를 만듭니다."""
+    class NaverStubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            params = parse_qs(urlparse(self.path).query)
+            query = params.get('query', [''])[0]
+            display = int(params.get('display', ['10'])[0])
+            start = int(params.get('start', ['1'])[0])
+            time.sleep(latency) # 네트워크 왕복 + API 처리 시간
+            items = []
+            for position in range(start, min(start + display, STUB_TOTAL_ITEMS + 1)):
+                pub_date = now - timedelta(minutes=position * minutes_per_article)
+                items.append({
+                    'title': f"{query} 관련 기사 {position}",
+                    'originallink': f"https://news.example.com/{query}/{position}",
+                    'link': f"https://n.news.example.com/{query}/{position}",
+                    'description': f"{query} 분야의 주요 소식을 전하는 {position}번째 기사 본문입니다.",
+                    'pubDate': pub_date.strftime('%a, %d %b %Y %H:%M:%S %z')
+                })
+            body = json.dumps({'items': items}, ensure_ascii=False).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass # 요청 로그 생략
+
+    return NaverStubHandler
+
+def collect_sequentially(api_url, queries, filter_start_time):
+    """기존 수집 루프: 쿼리·페이지마다 새 requests.get을 보내고 고정 0.1초 대기"""
+    headers = {"X-Naver-Client-Id": "stub", "X-Naver-Client-Secret": "stub"}
+    articles = []
+    for query in queries:
+        for start in range(1, analyzer.NAVER_MAX_START + 1, 100):
+            response = requests.get(api_url, headers=headers, params={
+                'query': query, 'display': 100, 'start': start, 'sort': 'date'
+            })
+            items = response.json().get('items', [])
+            time.sleep(0.1)
+            if not items:
+                break
+            reached_window_boundary = False
+            for item in items:
+                parsed = analyzer.parse_naver_item(item, KST)
+                if parsed is None:
+                    continue
+                article, pub_date_kst = parsed
+                if pub_date_kst >= filter_start_time:
+                    articles.append(article)
+                else:
+                    reached_window_boundary = True
+            if reached_window_boundary:
+                break
+    return articles
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 뉴스 수집 벤치마크 (로컬 스텁 서버)")
+    parser.add_argument('--latency', type=float, default=0.15, help="스텁 응답 지연 (초, 기본값: 0.15)")
+    parser.add_argument('--minutes-per-article', type=float, default=3.0,
+                        help="스텁 기사 간 발행 시각 간격 (분, 기본값: 3 -> 쿼리당 24시간 기사 480개)")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8], help="동시 수집 쿼리 수 목록")
+    parser.add_argument('--rate', type=float, default=analyzer.NAVER_RATE_LIMIT_PER_SEC, help="초당 API 호출 한도")
+    parser.add_argument('--skip-sequential', action='store_true', help="기존 순차 수집 측정 생략")
+    args = parser.parse_args()
+
+    now = datetime.now(KST)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_stub_handler(args.latency, args.minutes_per_article, now))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}/v1/search/news.json"
+    filter_start_time = now - timedelta(hours=24)
+    print(f"스텁 서버: {api_url} (응답 지연 {args.latency}초, 쿼리 {len(QUERIES)}개)")
+
+    try:
+        if not args.skip_sequential:
+            started = time.perf_counter()
+            articles = collect_sequentially(api_url, QUERIES, filter_start_time)
+            elapsed = time.perf_counter() - started
+            print(f"[순차 + 0.1초 대기] {elapsed:.2f}초, 기사 {len(articles)}개")
+
+        for concurrency in args.concurrency:
+            client = analyzer.NaverNewsClient(client_id="stub", client_secret="stub", api_url=api_url, pool_size=concurrency)
+            rate_limiter = analyzer.TokenBucket(args.rate, args.rate)
+            started = time.perf_counter()
+            articles, _ = analyzer.collect_news_articles(
+                QUERIES, filter_start_time, max_concurrency=concurrency, rate_limiter=rate_limiter, client=client
+            )
+            elapsed = time.perf_counter() - started
+            print(f"[동시 수집 {concurrency}개, 초당 {args.rate:g}회] {elapsed:.2f}초, 기사 {len(articles)}개")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
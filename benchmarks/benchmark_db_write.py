@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+기사 저장 벤치마크 (로컬 MySQL)
+합성 기사 10,000개를 벤치마크 전용 데이터베이스에 저장하며 두 방식을 비교합니다.
+  - 행 단위: 기사마다 INSERT ... ON DUPLICATE KEY UPDATE를 보내고, 갱신된 행은 SELECT id WHERE link = %s로 ID 조회
+  - 일괄: batch_size 단위의 다중 행 INSERT ... ON DUPLICATE KEY UPDATE + WHERE link IN (...) ID 조회
+각 방식은 빈 테이블에 처음 저장(삽입)한 뒤 같은 기사를 다시 저장(갱신)하는 시간을 하나의 트랜잭션으로 측정합니다.
+마지막으로 save_results_to_mysql 전체(본문, 토픽 결과, 검색 색인, 집계 포함)의 소요 시간도 측정합니다.
+
+벤치마크 데이터베이스(기본값: news_analysis_bench)는 schema.sql로 새로 만들며, 실행이 끝나면 삭제합니다.
+
+사용 예:
+    python benchmarks/benchmark_db_write.py
+    python benchmarks/benchmark_db_write.py --articles 10000 --batch-sizes 100 500 1000 --keep-database
+"""
+
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pymysql
+
+# 분석기가 저장 후 쓰는 날짜별 색인 파일을 실제 위치 대신 임시 디렉터리에 쓰도록 임포트 전에 설정
+os.environ['NEWS_INDEX_DIR'] = tempfile.mkdtemp(prefix='news_index_bench_')
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'mlnews'))
+import daily_news_analyzer as analyzer # noqa: E402
+
+INSERT_ARTICLE_SQL = """
+INSERT INTO news_articles (title, link, pub_date, analysis_date)
+VALUES (%s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    title=VALUES(title),
+    pub_date=VALUES(pub_date);
+"""
+
+def connect(database=None):
+    return pymysql.connect(
+        host=analyzer.MYSQL_HOST,
+        user=analyzer.MYSQL_USER,
+        password=analyzer.MYSQL_PASSWORD,
+        db=database,
+        charset='utf8mb4',
+        cursorclass=pymysql.cursors.DictCursor,
+        autocommit=False
+    )
+
+def create_database(database):
+    """schema.sql의 데이터베이스 이름을 바꿔 벤치마크 데이터베이스를 새로 만듭니다."""
+    with open(os.path.join(REPO_DIR, 'schema.sql'), encoding='utf-8') as f:
+        schema = f.read()
+    schema = re.sub(r'--[^\n]*', '', schema).replace('news_analysis_db', database)
+    conn = connect()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS {database};")
+            for statement in schema.split(';'):
+                if statement.strip():
+                    cursor.execute(statement)
+        conn.commit()
+    finally:
+        conn.close()
+
+def drop_database(database):
+    conn = connect()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS {database};")
+    finally:
+        conn.close()
+
+def make_articles(count, analysis_date, suffix=''):
+    """(title, link, pub_date, analysis_date) 합성 기사 목록을 만듭니다."""
+    return [
+        (f"합성 기사 제목 {i}{suffix}", f"https://news.example.com/article/{i}", analysis_date - timedelta(minutes=i), analysis_date)
+        for i in range(count)
+    ]
+
+def write_row_by_row(conn, articles):
+    """행 단위 저장 (삽입 INSERT 1회, 갱신 시 ID 조회 SELECT 1회 추가)"""
+    article_ids = {}
+    with conn.cursor() as cursor:
+        for article in articles:
+            cursor.execute(INSERT_ARTICLE_SQL, article)
+            if cursor.lastrowid:
+                article_ids[article[1]] = cursor.lastrowid
+            else:
+                # ON DUPLICATE KEY UPDATE로 갱신된 행은 lastrowid가 0이므로 다시 조회
+                cursor.execute(
+                    "SELECT id FROM news_articles WHERE link = %s AND analysis_day = %s;", (article[1], article[3].date())
+                )
+                article_ids[article[1]] = cursor.fetchone()['id']
+    conn.commit()
+    return article_ids
+
+def write_in_batches(conn, articles, batch_size):
+    """일괄 저장 (save_results_to_mysql과 같은 다중 행 INSERT + WHERE link IN (...) 조회)"""
+    with conn.cursor() as cursor:
+        for batch in analyzer.iter_batches(articles, batch_size):
+            cursor.executemany(INSERT_ARTICLE_SQL, batch)
+        article_ids = analyzer.fetch_article_ids_by_link(cursor, [article[1] for article in articles], articles[0][3].date())
+    conn.commit()
+    return article_ids
+
+def truncate_articles(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("TRUNCATE TABLE news_articles;")
+    conn.commit()
+
+def measure(label, conn, write, articles, updated_articles):
+    """빈 테이블에 삽입한 뒤 같은 링크를 갱신하는 시간을 측정해 출력합니다."""
+    truncate_articles(conn)
+    started = time.perf_counter()
+    inserted_ids = write(conn, articles)
+    insert_time = time.perf_counter() - started
+    started = time.perf_counter()
+    updated_ids = write(conn, updated_articles)
+    update_time = time.perf_counter() - started
+    status = "일치" if inserted_ids == updated_ids and len(inserted_ids) == len(articles) else "불일치"
+    print(f"[{label}] 삽입 {insert_time:.2f}초 ({len(articles) / insert_time:.0f}행/초), "
+          f"갱신 {update_time:.2f}초 ({len(articles) / update_time:.0f}행/초), ID {status}")
+
+def make_analysis_frames(count, analysis_date, topics=20):
+    """save_results_to_mysql에 넘길 합성 doc_topic_df, topic_info_df를 만듭니다."""
+    doc_topic_df = pd.DataFrame({
+        'title': [f"합성 기사 제목 {i}" for i in range(count)],
+        'link': [f"https://news.example.com/full/{i}" for i in range(count)],
+        'pubDate': [(analysis_date - timedelta(minutes=i)).isoformat() for i in range(count)],
+        'original_text': [f"합성 기사 본문 {i} 경제 정책 발표" for i in range(count)],
+        'processed_text': [f"합성 기사 본문 경제 정책 발표 주제{i % topics}" for i in range(count)],
+        'processed_title': ["합성 기사 제목" for _ in range(count)],
+        'topic': [i % topics for i in range(count)],
+        'probability': [0.5 + (i % 50) / 100 for i in range(count)]
+    })
+    topic_info_df = pd.DataFrame({
+        'Topic': list(range(topics)),
+        'Count': [count // topics] * topics,
+        'Name': [f"{t}_경제_정책" for t in range(topics)],
+        'Representation': [['경제', '정책', f"주제{t}"] for t in range(topics)]
+    })
+    return doc_topic_df, topic_info_df
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 저장 벤치마크 (행 단위 vs 다중 행 일괄 저장)")
+    parser.add_argument('--articles', type=int, default=10000, help="합성 기사 수 (기본값: 10000)")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[100, analyzer.DB_WRITE_BATCH_SIZE, 1000],
+                        help="일괄 저장 batch_size 목록")
+    parser.add_argument('--database', default='news_analysis_bench', help="벤치마크 데이터베이스 이름")
+    parser.add_argument('--keep-database', action='store_true', help="실행 후 벤치마크 데이터베이스를 삭제하지 않음")
+    args = parser.parse_args()
+
+    analysis_date = datetime.now().replace(microsecond=0)
+    articles = make_articles(args.articles, analysis_date)
+    updated_articles = make_articles(args.articles, analysis_date, suffix=' (수정)')
+
+    create_database(args.database)
+    conn = connect(args.database)
+    try:
+        print(f"MySQL {analyzer.MYSQL_HOST}/{args.database}, 기사 {args.articles}개")
+        measure("행 단위", conn, write_row_by_row, articles, updated_articles)
+        for batch_size in args.batch_sizes:
+            measure(f"일괄 batch_size={batch_size}", conn,
+                    lambda c, rows: write_in_batches(c, rows, batch_size), articles, updated_articles)
+
+        truncate_articles(conn)
+        doc_topic_df, topic_info_df = make_analysis_frames(args.articles, analysis_date)
+        started = time.perf_counter()
+        analyzer.save_results_to_mysql(conn, doc_topic_df, topic_info_df, analysis_date)
+        print(f"[save_results_to_mysql 전체] {time.perf_counter() - started:.2f}초")
+    finally:
+        conn.close()
+        if not args.keep_database:
+            drop_database(args.database)
+        shutil.rmtree(os.environ['NEWS_INDEX_DIR'], ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
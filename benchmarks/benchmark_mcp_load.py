@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+MCP 도구 동시 호출 부하 테스트
+news_topic_mcp_server의 도구 함수를 한 이벤트 루프에서 동시에(기본 50개) 호출하여
+호출별 지연 시간의 p50/p99, 전체 소요 시간, 이벤트 루프 지연(최대 하트비트 지연)을 보고합니다.
+같은 호출을 하나씩 순서대로 실행한 총 시간과 비교하면 도구 호출이 실제로 겹쳐 실행되는지 확인할 수 있습니다.
+실제 DB(news_topic_mcp_server.py의 MySQL 설정)를 사용하며, --no-cache를 주면 응답 캐시를 쓰지 않습니다.
+(응답 캐시를 켜 두면 순차 실행은 동시 실행이 저장한 응답을 읽으므로, 두 방식을 비교할 때는 --no-cache를 사용하세요)
+
+사용 예:
+    python benchmarks/benchmark_mcp_load.py
+    python benchmarks/benchmark_mcp_load.py --calls 50 --no-cache
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mcp_servers'))
+import news_topic_mcp_server as server # noqa: E402
+
+HEARTBEAT_INTERVAL = 0.01 # 이벤트 루프 지연 측정 간격 (초)
+SEARCH_KEYWORDS = ['경제', '반도체', '인공지능', '부동산', '금리']
+
+def make_calls(count, latest_date):
+    """도구별 호출 (도구 이름, 코루틴 함수, 인자)를 섞어 count개 만듭니다."""
+    start_date = (datetime.strptime(latest_date, '%Y-%m-%d') - timedelta(days=6)).strftime('%Y-%m-%d')
+    templates = [
+        ("get_available_analysis_dates", server.get_available_analysis_dates, lambda i: ()),
+        ("get_news_analysis_data", server.get_news_analysis_data, lambda i: (start_date, latest_date)),
+        ("get_news_analysis_data(keyword)", server.get_news_analysis_data,
+         lambda i: (start_date, latest_date, SEARCH_KEYWORDS[i % len(SEARCH_KEYWORDS)])),
+        ("get_topic_keyword_frequency", server.get_topic_keyword_frequency, lambda i: (latest_date, i % 5)),
+        ("get_topic_trends", server.get_topic_trends, lambda i: (7,)),
+    ]
+    calls = []
+    for i in range(count):
+        name, tool, make_args = templates[i % len(templates)]
+        calls.append((name, tool, make_args(i)))
+    return calls
+
+async def timed_call(tool, args):
+    started = time.perf_counter()
+    response = await tool(*args)
+    return time.perf_counter() - started, server.is_error_response(response)
+
+async def heartbeat(stop_event, lags):
+    """HEARTBEAT_INTERVAL마다 깨어나 예정보다 늦은 시간을 기록합니다. (블로킹 호출이 루프를 막으면 커짐)"""
+    while not stop_event.is_set():
+        expected = time.perf_counter() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(time.perf_counter() - expected)
+
+async def run_concurrently(calls):
+    stop_event = asyncio.Event()
+    lags = []
+    heartbeat_task = asyncio.create_task(heartbeat(stop_event, lags))
+    started = time.perf_counter()
+    results = await asyncio.gather(*(timed_call(tool, args) for _, tool, args in calls))
+    elapsed = time.perf_counter() - started
+    stop_event.set()
+    await heartbeat_task
+    return results, elapsed, max(lags, default=0.0)
+
+async def run_sequentially(calls):
+    started = time.perf_counter()
+    results = [await timed_call(tool, args) for _, tool, args in calls]
+    return results, time.perf_counter() - started
+
+def summarize(label, calls, results, elapsed):
+    latencies = np.array([latency for latency, _ in results]) * 1000
+    errors = sum(1 for _, is_error in results if is_error)
+    print(f"[{label}] 호출 {len(results)}개, 전체 {elapsed:.2f}초, "
+          f"p50 {np.percentile(latencies, 50):.1f}ms, p99 {np.percentile(latencies, 99):.1f}ms, 오류 {errors}개")
+    by_tool = {}
+    for (name, _, _), (latency, _) in zip(calls, results):
+        by_tool.setdefault(name, []).append(latency * 1000)
+    for name, values in by_tool.items():
+        print(f"    {name}: {len(values)}회, p50 {np.percentile(values, 50):.1f}ms, 최대 {max(values):.1f}ms")
+
+async def main_async(args):
+    if args.no_cache:
+        server.response_cache.ttl = -1 # 저장된 응답이 항상 만료된 것으로 처리
+    dates = json.loads(await server.get_available_analysis_dates()).get('available_dates') or []
+    if not dates:
+        print("분석된 날짜가 없습니다. 분석 작업을 먼저 실행하세요.")
+        return
+    calls = make_calls(args.calls, dates[0])
+    print(f"최근 분석 날짜 {dates[0]}, 연결 풀 {server.DB_POOL_SIZE}개, 응답 캐시 {'끔' if args.no_cache else '켬'}")
+
+    results, elapsed, max_lag = await run_concurrently(calls)
+    summarize(f"동시 {args.calls}개", calls, results, elapsed)
+    print(f"    이벤트 루프 최대 지연: {max_lag * 1000:.1f}ms")
+    if not args.skip_sequential:
+        results, elapsed = await run_sequentially(calls)
+        summarize("순차", calls, results, elapsed)
+    print(f"연결 풀 지표: {server.db_manager.pool.metrics()}")
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP 도구 동시 호출 부하 테스트")
+    parser.add_argument('--calls', type=int, default=50, help="동시에 보낼 도구 호출 수 (기본값: 50)")
+    parser.add_argument('--no-cache', action='store_true', help="응답 캐시를 사용하지 않음")
+    parser.add_argument('--skip-sequential', action='store_true', help="순차 실행 비교 생략")
+    args = parser.parse_args()
+    try:
+        asyncio.run(main_async(args))
+    finally:
+        server.db_executor.shutdown(wait=False)
+        server.encoder_executor.shutdown(wait=False)
+        server.db_manager.pool.close_all()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+한국어 전처리 처리량 벤치마크
+합성 한국어 기사 코퍼스를 preprocess_documents로 전처리하며 워커 수(기본 1/2/4/8)별 처리량(문서/초)을 측정합니다.
+워커 풀은 미리 만들어(Okt 로드 포함) 시작 시간과 처리 시간을 따로 보고하고, 캐시는 사용하지 않습니다.
+모든 워커 수에서 결과가 직렬 처리 결과와 같은 순서·내용인지도 확인합니다.
+
+사용 예:
+    python benchmarks/benchmark_preprocess.py
+    python benchmarks/benchmark_preprocess.py --documents 5000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mlnews'))
+import daily_news_analyzer as analyzer # noqa: E402
+
+SUBJECTS = ['정부는', '한국은행이', '삼성전자가', '서울시는', '연구진은', '국회는', '교육부가', '시민단체는', '증권가에서는', '전문가들은']
+OBJECTS = ['기준금리를', '반도체 수출을', '부동산 대책을', '인공지능 규제를', '기후 변화 대응을', '의료 개혁안을',
+           '청년 일자리 정책을', '물가 안정 방안을', '전기차 보조금을', '디지털 교육 과정을']
+PREDICATES = ['발표했다', '검토하고 있다', '강화하기로 했다', '비판했다', '논의했다', '추진한다고 밝혔다', '확대할 계획이다', '발표할 예정이다']
+MODIFIERS = ['올해', '지난주', '최근', '내년부터', '다음 달', '이번 분기에', '장기적으로', '단계적으로']
+
+def make_corpus(documents, sentences_per_document, seed=0):
+    """주어·목적어·서술어를 조합한 합성 기사 본문 목록을 만듭니다. (길이는 실제 API description보다 긴 편)"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(documents):
+        sentences = [
+            f"{rng.choice(MODIFIERS)} {rng.choice(SUBJECTS)} {rng.choice(OBJECTS)} {rng.choice(PREDICATES)}."
+            for _ in range(sentences_per_document)
+        ]
+        corpus.append(' '.join(sentences))
+    return corpus
+
+def main():
+    parser = argparse.ArgumentParser(description="한국어 전처리 처리량 벤치마크 (워커 수별)")
+    parser.add_argument('--documents', type=int, default=2000, help="합성 문서 수 (기본값: 2000)")
+    parser.add_argument('--sentences', type=int, default=8, help="문서당 문장 수 (기본값: 8)")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help="측정할 워커 수 목록")
+    parser.add_argument('--chunksize', type=int, default=analyzer.PREPROCESS_CHUNK_SIZE, help="워커에 한 번에 전달할 문서 수")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.documents, args.sentences)
+    print(f"합성 코퍼스: 문서 {len(corpus)}개, 평균 {sum(map(len, corpus)) / len(corpus):.0f}자, CPU {os.cpu_count()}개")
+
+    # 기준: 현재 프로세스에서 직렬 처리 (Okt 로드 시간은 제외)
+    started = time.perf_counter()
+    analyzer.get_okt()
+    load_time = time.perf_counter() - started
+    started = time.perf_counter()
+    expected = analyzer.preprocess_documents(corpus, workers=1, cache=None)
+    elapsed = time.perf_counter() - started
+    print(f"[직렬] Okt 로드 {load_time:.2f}초, 처리 {elapsed:.2f}초 ({len(corpus) / elapsed:.0f}문서/초)")
+
+    for workers in args.workers:
+        started = time.perf_counter()
+        pool = analyzer.create_preprocess_pool(workers)
+        # 모든 워커가 initializer(Okt 로드)를 마치도록 워커 수만큼 작은 작업을 먼저 실행
+        analyzer.preprocess_documents(corpus[:workers], pool=pool, chunksize=1, cache=None)
+        startup_time = time.perf_counter() - started
+        try:
+            started = time.perf_counter()
+            results = analyzer.preprocess_documents(corpus, pool=pool, chunksize=args.chunksize, cache=None)
+            elapsed = time.perf_counter() - started
+        finally:
+            pool.shutdown()
+        status = "일치" if results == expected else "불일치"
+        print(f"[워커 {workers}개] 풀 시작 {startup_time:.2f}초, 처리 {elapsed:.2f}초 "
+              f"({len(corpus) / elapsed:.0f}문서/초), 직렬 결과와 {status}")
+
+if __name__ == "__main__":
+    main()
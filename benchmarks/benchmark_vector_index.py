@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+관련 기사 검색용 IVF 색인 벤치마크
+군집 구조가 있는 합성 임베딩(기본 100,000개, 768차원)을 분석기의 write_vector_shard로 날짜 샤드에 저장하고,
+MCP 서버의 VectorShard.search(nprobe별)와 전체 벡터에 대한 코사인 brute-force 검색의
+recall@k와 질의당 지연 시간(p50/p99)을 비교합니다.
+
+사용 예:
+    python benchmarks/benchmark_vector_index.py
+    python benchmarks/benchmark_vector_index.py --vectors 100000 --dim 768 --nprobe 1 4 8 16 32
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..', 'mlnews'))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..', 'mcp_servers'))
+import daily_news_analyzer as analyzer # noqa: E402
+from vector_index import VectorShard # noqa: E402
+
+def make_vectors(count, dim, clusters, spread, seed=0):
+    """clusters개의 중심 주변에 퍼진 정규화된 합성 임베딩을 만듭니다. (같은 주제 기사끼리 가까운 실제 분포를 흉내)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=count)
+    vectors = centers[labels] + spread * rng.standard_normal((count, dim)).astype(np.float32)
+    return analyzer.normalize_rows(vectors)
+
+def make_queries(vectors, count, noise, seed=1):
+    """
+    저장된 벡터 일부에 잡음을 더한 질의 (관련 기사 검색처럼 비슷한 기사가 반드시 있는 질의)
+    noise는 정규화된 벡터 길이 대비 잡음 벡터 길이의 비율입니다.
+    """
+    rng = np.random.default_rng(seed)
+    picked = vectors[rng.choice(len(vectors), size=count, replace=False)]
+    scale = noise / np.sqrt(vectors.shape[1])
+    return analyzer.normalize_rows(picked + scale * rng.standard_normal(picked.shape).astype(np.float32))
+
+def brute_force_search(vectors, article_ids, query, top_k):
+    similarities = vectors @ query
+    best = np.argpartition(-similarities, top_k)[:top_k]
+    best = best[np.argsort(-similarities[best])]
+    return [int(article_ids[i]) for i in best]
+
+def percentiles(latencies):
+    latencies = np.asarray(latencies) * 1000
+    return np.percentile(latencies, 50), np.percentile(latencies, 99)
+
+def main():
+    parser = argparse.ArgumentParser(description="IVF 색인 recall/지연 시간 벤치마크 (brute-force 코사인 대비)")
+    parser.add_argument('--vectors', type=int, default=100000, help="합성 벡터 수 (기본값: 100000)")
+    parser.add_argument('--dim', type=int, default=768, help="임베딩 차원 (기본값: 768, ko-sbert-nli와 같음)")
+    parser.add_argument('--clusters', type=int, default=1000, help="합성 데이터의 군집 수")
+    parser.add_argument('--spread', type=float, default=2.0, help="군집 중심에서 벡터가 퍼진 정도 (클수록 군집이 겹쳐 IVF recall이 낮아짐)")
+    parser.add_argument('--queries', type=int, default=200, help="질의 수")
+    parser.add_argument('--query-noise', type=float, default=0.5, help="질의에 더할 잡음 (벡터 길이 대비 비율)")
+    parser.add_argument('--top-k', type=int, default=10, help="recall@k의 k (기본값: 10)")
+    parser.add_argument('--nprobe', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32], help="비교할 IVF 목록 수 목록")
+    args = parser.parse_args()
+
+    embeddings = make_vectors(args.vectors, args.dim, args.clusters, args.spread)
+    article_ids = np.arange(1, args.vectors + 1, dtype=np.int32)
+    queries = make_queries(embeddings, args.queries, noise=args.query_noise)
+    directory = tempfile.mkdtemp(prefix='vector_index_bench_')
+    try:
+        started = time.perf_counter()
+        day_dir = analyzer.write_vector_shard(directory, date.today(), article_ids, embeddings)
+        build_time = time.perf_counter() - started
+        shard = VectorShard(day_dir)
+        print(f"벡터 {args.vectors}개 x {args.dim}차원, IVF 목록 {len(shard.centroids)}개, 색인 생성 {build_time:.1f}초")
+
+        # 기준: 샤드의 전체 벡터(메모리에 올린 상태)와 코사인 유사도 비교
+        vectors = np.asarray(shard.vectors)
+        ids = np.asarray(shard.article_ids)
+        truth, latencies = [], []
+        for query in queries:
+            started = time.perf_counter()
+            truth.append(set(brute_force_search(vectors, ids, query, args.top_k)))
+            latencies.append(time.perf_counter() - started)
+        p50, p99 = percentiles(latencies)
+        print(f"[brute-force] recall@{args.top_k} 1.000, p50 {p50:.2f}ms, p99 {p99:.2f}ms")
+
+        shard.search(queries[0], args.top_k, args.nprobe[0]) # mmap 페이지를 미리 읽어 첫 질의 지연 제외
+        for nprobe in args.nprobe:
+            hits, latencies = 0, []
+            for query, expected in zip(queries, truth):
+                started = time.perf_counter()
+                results = shard.search(query, args.top_k, nprobe)
+                latencies.append(time.perf_counter() - started)
+                hits += len(expected & {article_id for article_id, _ in results})
+            p50, p99 = percentiles(latencies)
+            recall = hits / (len(queries) * args.top_k)
+            print(f"[IVF nprobe={nprobe}] recall@{args.top_k} {recall:.3f}, p50 {p50:.2f}ms, p99 {p99:.2f}ms")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+뉴스 기사 키워드 검색
+daily_news_analyzer.py가 저장한 역색인(분석 날짜, 토큰, 기사 ID, 빈도)을 조회하여
+키워드가 포함된 기사를 TF-IDF 점수 순으로 반환합니다. (news_topic_mcp_server.py, mysql_news_analysis.py에서 사용)
+
+역색인은 두 곳에 있습니다.
+  - 분석 날짜별 파일 (POSTINGS_INDEX_DIR/<YYYY-MM-DD>/): mmap으로 읽어 토큰 하나의 posting만 접근
+  - article_terms 테이블: 파일이 없는 날짜(다른 호스트에서 분석했거나 파일을 지운 경우)에 사용
+LIKE '%키워드%' 검색과 달리 토큰의 posting만 읽으므로,
+조회 기간이 같으면 전체 기사 수가 늘어나도 검색 시간이 거의 변하지 않습니다.
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import threading
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+SEARCH_RESULT_LIMIT = 100 # 검색 결과 기본 최대 기사 수 (페이지를 넘길 때는 after로 다음 순위부터 다시 조회)
+MAX_QUERY_TERMS = 10 # 검색어에서 사용할 최대 토큰 수
+
+# daily_news_analyzer.py의 전처리 설정과 같아야 검색어 토큰이 색인 토큰(Okt norm/stem 결과)과 일치함
+STOPWORDS = frozenset(['은', '는', '이', '가', '을', '를', '에', '에서', '와', '과', '하다', '이다', '되다', '되', '것', '수', '고', '다', '습니다', '등', '있다', '있', '으로', '에게', '하여', '이번', '지난', '말', '기자', '사진', '씨', '명', '년', '월', '일', '오전', '오후', '시', '분', '초', '지난달', '이번달', '새로운', '각각', '오직', '특히', '점', '또한', '통해', '이번', '그간', '따라', '대한', '관련', '때문', '로부터', '까지', '바로', '또한', '물론', '대비', '위해', '으로'])
+KEEP_POS_TAGS = ('Noun', 'Verb', 'Adjective', 'Exclamation', 'Josa')
+
+logger = logging.getLogger(__name__)
+
+# 분석기(daily_news_analyzer.py)가 날짜별 색인 파일을 쓰는 공유 위치 (NEWS_INDEX_DIR 환경 변수, 기본값: mlnews/cache)
+NEWS_INDEX_DIR = os.environ.get(
+    'NEWS_INDEX_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'mlnews', 'cache')
+)
+POSTINGS_INDEX_DIR = os.path.join(NEWS_INDEX_DIR, 'postings')
+
+class PostingsIndex:
+    """분석 날짜 하나의 역색인 파일을 mmap으로 읽습니다. (파일 형식은 daily_news_analyzer.write_postings_index 참고)"""
+    def __init__(self, day_dir):
+        self.day_dir = day_dir
+        with open(os.path.join(day_dir, 'terms.json'), encoding='utf-8') as f:
+            self.terms = json.load(f)
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.offsets = np.load(os.path.join(day_dir, 'offsets.npy'), mmap_mode='r')
+        self.postings_article_ids = np.load(os.path.join(day_dir, 'postings_article_ids.npy'), mmap_mode='r')
+        self.postings_tf = np.load(os.path.join(day_dir, 'postings_tf.npy'), mmap_mode='r')
+        self.article_ids = np.load(os.path.join(day_dir, 'article_ids.npy'), mmap_mode='r')
+        self.article_topics = np.load(os.path.join(day_dir, 'article_topics.npy'), mmap_mode='r')
+
+    @property
+    def article_count(self):
+        return len(self.article_ids)
+
+    def postings(self, term):
+        """토큰의 (기사 ID 배열, 빈도 배열)을 반환합니다. 없는 토큰이면 빈 배열."""
+        i = self.term_index.get(term)
+        if i is None:
+            return self.postings_article_ids[:0], self.postings_tf[:0]
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+        return self.postings_article_ids[start:end], self.postings_tf[start:end]
+
+    def topic_article_ids(self, topic_id):
+        return np.asarray(self.article_ids[self.article_topics == topic_id])
+
+_postings_indexes = {} # 날짜 문자열 -> (manifest 수정 시각, PostingsIndex)
+_postings_indexes_lock = threading.Lock()
+
+def get_postings_index(analysis_day, directory=None):
+    """날짜의 역색인 파일을 열어 반환합니다. 파일이 없으면 None. (분석 작업이 파일을 교체하면 다시 엶)"""
+    day_str = analysis_day.isoformat() if isinstance(analysis_day, date) else str(analysis_day)
+    day_dir = os.path.join(directory or POSTINGS_INDEX_DIR, day_str)
+    try:
+        manifest_mtime = os.path.getmtime(os.path.join(day_dir, 'manifest.json'))
+    except OSError:
+        return None
+    with _postings_indexes_lock:
+        cached = _postings_indexes.get(day_str)
+        if cached is not None and cached[0] == manifest_mtime:
+            return cached[1]
+    try:
+        index = PostingsIndex(day_dir)
+    except (OSError, ValueError):
+        return None # 분석 작업이 파일을 교체하는 중
+    with _postings_indexes_lock:
+        _postings_indexes[day_str] = (manifest_mtime, index)
+    return index
+
+def iter_days(start_date, end_date):
+    """start_date ~ end_date (YYYY-MM-DD 문자열 또는 date)의 날짜를 차례로 반환합니다."""
+    start = start_date if isinstance(start_date, date) else datetime.strptime(start_date, '%Y-%m-%d').date()
+    end = end_date if isinstance(end_date, date) else datetime.strptime(end_date, '%Y-%m-%d').date()
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+def clean_text(text):
+    """daily_news_analyzer.clean_text와 같은 정제 (HTML 태그, 한글/로마자 이외의 문자 제거)"""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'[^가-힣a-zA-Z\s]', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+def extract_alpha_terms(text):
+    """daily_news_analyzer.extract_alpha_terms와 같은 영문 토큰 (소문자)"""
+    return [term.lower() for term in re.findall(r'[A-Za-z]{2,}', text)]
+
+class QueryTokenizer:
+    """
+    검색어를 분석기와 같은 Okt 설정(norm, stem, 품사/불용어 필터)으로 형태소 분석합니다.
+    Okt(JVM)는 처음 사용할 때 한 번만 로드하며, konlpy를 쓸 수 없으면 한글 단어를 공백 기준으로 나눕니다.
+    (이 경우 활용형 검색어는 색인 토큰과 일치하지 않을 수 있음)
+    """
+    def __init__(self):
+        self._okt = None
+        self._unavailable = False
+        self._lock = threading.Lock()
+
+    def _get_okt(self):
+        if self._okt is None and not self._unavailable:
+            try:
+                from konlpy.tag import Okt # 검색 도구를 처음 호출할 때만 임포트
+                self._okt = Okt()
+            except Exception as e:
+                self._unavailable = True
+                logger.warning(f"Okt를 사용할 수 없어 검색어를 공백 기준으로 나눕니다: {e}")
+        return self._okt
+
+    def warm_up(self):
+        with self._lock:
+            self._get_okt()
+
+    def tokenize(self, cleaned_text):
+        """정제된 텍스트의 한국어 토큰 목록을 반환합니다. (영문 토큰은 extract_alpha_terms로 따로 추출)"""
+        with self._lock:
+            okt = self._get_okt()
+            if okt is None:
+                return [term for term in re.findall(r'[가-힣]+', cleaned_text) if len(term) > 1 and term not in STOPWORDS]
+            return [
+                word for word, pos in okt.pos(cleaned_text, norm=True, stem=True)
+                if pos in KEEP_POS_TAGS and word not in STOPWORDS and len(word) > 1
+            ]
+
+query_tokenizer = QueryTokenizer()
+
+def tokenize_query(keyword):
+    """
+    검색어를 article_terms의 토큰과 같은 형태로 나눕니다.
+    (분석기와 같은 clean_text, Okt 형태소 분석, 불용어/한 글자 토큰 제외 + 소문자 영문 토큰)
+    """
+    if not keyword:
+        return []
+    cleaned = clean_text(keyword)
+    terms = []
+    for term in query_tokenizer.tokenize(cleaned) + extract_alpha_terms(cleaned):
+        if term not in terms:
+            terms.append(term)
+    return terms[:MAX_QUERY_TERMS]
+
+def search_rank_key(article_id, analysis_day, score):
+    """관련도 순 정렬 키 (점수 내림차순, 점수가 같으면 분석 날짜·기사 ID 내림차순으로 순서를 고정)"""
+    return (-score, -analysis_day.toordinal(), -article_id)
+
+def search_articles(cursor, keyword, start_date, end_date, topic_id=None, limit=SEARCH_RESULT_LIMIT, after=None,
+                    exclude_topic=None):
+    """
+    기간(start_date ~ end_date) 안에서 키워드 토큰이 포함된 기사를 찾아
+    [(article_id, analysis_day, score), ...]를 점수 내림차순으로 최대 limit개 반환합니다.
+    점수는 토큰별 tf * idf의 합이며, idf는 같은 기간의 기사 수 기준으로 계산합니다.
+    topic_id가 주어지면 해당 토픽에 할당된 기사만 검색하고,
+    exclude_topic(예: 노이즈 토픽 -1)이 주어지면 그 토픽에 할당된 기사(토픽 할당이 없는 기사 포함)를 순위에서 제외합니다.
+    (페이지를 고른 뒤 걸러내면 페이지가 비거나 짧아지므로 순위를 매기기 전에 제외)
+    after(이전 페이지의 마지막 (article_id, analysis_day, score))가 주어지면 그 다음 순위의 기사부터 반환합니다. (keyset)
+    """
+    terms = tokenize_query(keyword)
+    if not terms:
+        return []
+
+    # 역색인 파일이 있는 날짜는 파일에서, 나머지 날짜는 article_terms 테이블에서 posting을 읽음
+    postings = [] # (term, analysis_day, article_id, tf)
+    total_articles = 0
+    db_days = []
+    for day in iter_days(start_date, end_date):
+        index = get_postings_index(day)
+        if index is None:
+            db_days.append(day)
+            continue
+        total_articles += index.article_count
+        topic_ids = index.topic_article_ids(topic_id) if topic_id is not None else None
+        # 토픽 할당이 없는 기사는 article_topics가 -1이므로 exclude_topic=-1이면 함께 제외됨
+        excluded_ids = index.topic_article_ids(exclude_topic) if exclude_topic is not None else None
+        for term in terms:
+            article_ids, tfs = index.postings(term)
+            if topic_ids is not None:
+                mask = np.isin(article_ids, topic_ids)
+                article_ids, tfs = article_ids[mask], tfs[mask]
+            if excluded_ids is not None:
+                mask = ~np.isin(article_ids, excluded_ids)
+                article_ids, tfs = article_ids[mask], tfs[mask]
+            postings.extend((term, day, int(article_id), int(tf)) for article_id, tf in zip(article_ids, tfs))
+
+    if db_days:
+        db_postings, db_article_count = fetch_db_postings(cursor, terms, db_days, topic_id, exclude_topic)
+        postings.extend(db_postings)
+        total_articles += db_article_count
+    if not postings:
+        return []
+    total_articles = max(total_articles, 1)
+
+    # 페이지마다 점수를 다시 계산하므로 기사별 토큰 점수를 항상 같은 순서(검색어 토큰 순)로 더해 같은 값이 나오게 함
+    term_order = {term: i for i, term in enumerate(terms)}
+    postings.sort(key=lambda posting: term_order[posting[0]])
+
+    document_frequency = {}
+    for term, _, _, _ in postings:
+        document_frequency[term] = document_frequency.get(term, 0) + 1
+
+    scores = {}
+    for term, analysis_day, article_id, tf in postings:
+        idf = math.log((total_articles + 1) / (document_frequency[term] + 1)) + 1
+        article_key = (article_id, analysis_day)
+        scores[article_key] = scores.get(article_key, 0.0) + tf * idf
+
+    ranked = ((article_id, analysis_day, score) for (article_id, analysis_day), score in scores.items())
+    if after is not None:
+        after_key = search_rank_key(*after)
+        ranked = (item for item in ranked if search_rank_key(*item) > after_key)
+    return heapq.nsmallest(limit, ranked, key=lambda item: search_rank_key(*item))
+
+def fetch_db_postings(cursor, terms, days, topic_id=None, exclude_topic=None):
+    """
+    article_terms 테이블에서 지정된 날짜들의 posting을 읽어
+    ([(term, analysis_day, article_id, tf), ...], 해당 날짜들의 기사 수)를 반환합니다.
+    topic_id/exclude_topic이 주어지면 topic_results와 조인하여 토픽이 할당된 기사만 남깁니다.
+    """
+    placeholders = ', '.join(['%s'] * len(terms))
+    day_placeholders = ', '.join(['%s'] * len(days))
+    sql = """
+    SELECT at.term, at.analysis_day, at.article_id, at.tf
+    FROM article_terms at
+    """
+    params = []
+    if topic_id is not None or exclude_topic is not None:
+        sql += """
+    JOIN topic_results tr ON tr.article_id = at.article_id AND tr.analysis_day = at.analysis_day
+    """
+        if topic_id is not None:
+            sql += " AND tr.topic_id = %s"
+            params.append(topic_id)
+        if exclude_topic is not None:
+            sql += " AND tr.topic_id != %s"
+            params.append(exclude_topic)
+    sql += f"""
+    WHERE at.term IN ({placeholders}) AND at.analysis_day IN ({day_placeholders})
+    """
+    params.extend(terms)
+    params.extend(days)
+    cursor.execute(sql, params)
+    postings = [(row['term'], row['analysis_day'], row['article_id'], row['tf']) for row in cursor.fetchall()]
+
+    cursor.execute(
+        f"SELECT COUNT(*) AS cnt FROM news_articles WHERE analysis_day IN ({day_placeholders});", days
+    )
+    return postings, cursor.fetchone()['cnt']
@@ -9,6 +9,11 @@ import warnings
 import asyncio
 from typing import Any, Dict, List, Optional
 
+from article_search import search_articles, search_rank_key
+from pagination import (DEFAULT_PAGE_SIZE, clamp_page_size, decode_cursor, pub_date_cursor, pub_date_keyset_condition,
+                        search_rank_cursor, search_rank_position)
+from response_format import shape_response
+
 warnings.filterwarnings('ignore')
 
 # --- MySQL DB 설정 (본인의 정보로 변경) ---
@@ -40,7 +45,7 @@ def fetch_analysis_dates_from_db():
         return []
     try:
         with conn.cursor() as cursor:
-            cursor.execute("SELECT DISTINCT DATE(analysis_date) AS analysis_date FROM news_articles ORDER BY analysis_date DESC;")
+            cursor.execute("SELECT DISTINCT analysis_day AS analysis_date FROM news_articles ORDER BY analysis_day DESC;")
             results = cursor.fetchall()
             return [row['analysis_date'].strftime('%Y-%m-%d') for row in results]
     except Exception as e:
@@ -63,24 +68,46 @@ def convert_to_json_serializable(obj):
     else:
         return obj
 
-def fetch_data_for_analysis(start_date_str: str, end_date_str: str, topic_id: int = None, keyword: str = None):
+def fetch_data_for_analysis(start_date_str: str, end_date_str: str, topic_id: int = None, keyword: str = None,
+                            cursor: str = None, page_size: int = DEFAULT_PAGE_SIZE):
     """
-    지정된 날짜 범위, 토픽 ID, 키워드에 따라 뉴스 기사, 토픽 결과, 토픽 정보를 가져옵니다.
+    지정된 날짜 범위, 토픽 ID, 키워드에 따라 뉴스 기사, 토픽 결과, 토픽 정보를 한 페이지(page_size개)씩 가져옵니다.
     이 함수는 '오늘의 토픽', '기간별 트렌드', '과거 토픽', '특정 키워드/토픽 기사 목록'에 사용됩니다.
+    최신순 목록은 (pub_date, id), 키워드 검색 결과는 (관련도 점수, 분석 날짜, id) 기준 keyset으로 나누며,
+    다음 페이지가 있으면 결과의 next_cursor를 cursor로 다시 전달하면 됩니다.
     """
+    try:
+        position = decode_cursor(cursor)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    page_size = clamp_page_size(page_size)
+
     conn = get_db_connection()
     if not conn:
         return {"status": "error", "message": "DB 연결 실패."}
 
     try:
-        with conn.cursor() as cursor:
+        with conn.cursor() as db_cursor:
+            # 키워드 검색은 역색인에서 이전 페이지 마지막 기사 다음 순위의 기사를 page_size + 1개 고른 뒤, 이번 페이지의 기사만 조회
+            # (아래 쿼리가 노이즈 토픽(-1)을 제외하므로 순위도 노이즈가 아닌 기사로만 매김)
+            search_scores = None
+            next_cursor = None
+            if keyword:
+                page_articles = search_articles(
+                    db_cursor, keyword, start_date_str, end_date_str, topic_id=topic_id,
+                    limit=page_size + 1, after=search_rank_position(position), exclude_topic=-1
+                )
+                if len(page_articles) > page_size:
+                    page_articles = page_articles[:page_size]
+                    next_cursor = search_rank_cursor(*page_articles[-1])
+                search_scores = {(article_id, analysis_day): score for article_id, analysis_day, score in page_articles}
+
             sql = """
             SELECT
-                DATE(na.analysis_date) AS analysis_day,
+                na.analysis_day,
                 na.id AS article_id,
                 na.title,
                 na.link,
-                na.description,
                 na.pub_date,
                 tr.topic_id,
                 tr.probability,
@@ -89,11 +116,12 @@ def fetch_data_for_analysis(start_date_str: str, end_date_str: str, topic_id: in
             FROM
                 news_articles na
             JOIN
-                topic_results tr ON na.id = tr.article_id
+                topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
             LEFT JOIN
-                topic_info ti ON tr.topic_id = ti.topic_id AND DATE(ti.analysis_date) = DATE(na.analysis_date)
+                topic_info ti ON ti.analysis_day = na.analysis_day AND ti.topic_id = tr.topic_id
             WHERE
-                DATE(na.analysis_date) BETWEEN %s AND %s
+                na.analysis_day BETWEEN %s AND %s
+                AND tr.topic_id != -1
             """
             params = [start_date_str, end_date_str]
 
@@ -101,55 +129,71 @@ def fetch_data_for_analysis(start_date_str: str, end_date_str: str, topic_id: in
                 sql += " AND tr.topic_id = %s"
                 params.append(topic_id)
             
-            if keyword:
-                sql += " AND (na.title LIKE %s OR na.description LIKE %s)"
-                params.append(f"%{keyword}%")
-                params.append(f"%{keyword}%")
+            if search_scores is not None:
+                article_ids = sorted({article_id for article_id, _ in search_scores}) or [0] # 검색 결과가 없으면 일치하는 ID 없음
+                sql += f" AND na.id IN ({', '.join(['%s'] * len(article_ids))})"
+                params.extend(article_ids)
 
-            sql += " ORDER BY na.analysis_date DESC, tr.probability DESC;"
+            if search_scores is None:
+                # 마지막으로 반환한 (pub_date, id) 다음부터 page_size + 1행만 읽음 (다음 페이지 유무 확인용 1행)
+                keyset_condition, keyset_params = pub_date_keyset_condition(position)
+                sql += keyset_condition
+                params.extend(keyset_params)
+                sql += " ORDER BY na.pub_date DESC, na.id DESC LIMIT %s;"
+                params.append(page_size + 1)
             
-            cursor.execute(sql, tuple(params))
-            data = cursor.fetchall()
+            db_cursor.execute(sql, tuple(params))
+            data = db_cursor.fetchall()
+
+            if search_scores is not None:
+                # (id, analysis_day)로 검색 결과만 남기고 관련도 순으로 정렬
+                # (점수는 다음 페이지 cursor를 만들 때 그대로 써야 하므로 반올림하지 않음)
+                data = [row for row in data if (row['article_id'], row['analysis_day']) in search_scores]
+                for row in data:
+                    row['search_score'] = search_scores[(row['article_id'], row['analysis_day'])]
+                data.sort(key=lambda row: search_rank_key(row['article_id'], row['analysis_day'], row['search_score']))
+            elif len(data) > page_size:
+                data = data[:page_size]
+                next_cursor = pub_date_cursor(data[-1], id_key='article_id')
 
             if not data:
                 msg = f"선택된 조건 ({start_date_str} ~ {end_date_str}"
                 if topic_id is not None: msg += f", 토픽 ID: {topic_id}"
                 if keyword: msg += f", 키워드: '{keyword}'"
                 msg += ")에 대한 데이터가 없습니다."
-                return {"status": "success", "message": msg}
+                # 검색 결과가 조회 중에 사라진 경우 등 이번 페이지만 비었을 수 있으므로 다음 페이지 cursor는 유지
+                return {"status": "success", "message": msg, "next_cursor": next_cursor}
 
-            # 데이터 처리 - 노이즈 토픽(-1) 필터링
+            # 데이터 처리 (노이즈 토픽(-1)은 쿼리에서 제외, 다음 페이지 cursor를 만든 뒤 날짜 객체를 문자열로 변환)
             filtered_data = []
             for row in data:
-                if row['topic_id'] != -1:
-                    # 날짜 객체를 문자열로 변환
-                    if row['analysis_day']:
-                        row['analysis_day'] = row['analysis_day'].strftime('%Y-%m-%d')
-                    if row['pub_date']:
-                        row['pub_date'] = row['pub_date'].strftime('%Y-%m-%d %H:%M:%S')
-                    
-                    # representation 문자열을 리스트로 변환
-                    if row['representation']:
-                        try:
-                            if isinstance(row['representation'], str):
-                                row['representation'] = json.loads(row['representation'])
-                            elif not isinstance(row['representation'], list):
-                                row['representation'] = []
-                        except:
+                if row['analysis_day']:
+                    row['analysis_day'] = row['analysis_day'].strftime('%Y-%m-%d')
+                if row['pub_date']:
+                    row['pub_date'] = row['pub_date'].strftime('%Y-%m-%d %H:%M:%S')
+                
+                # representation 문자열을 리스트로 변환
+                if row['representation']:
+                    try:
+                        if isinstance(row['representation'], str):
+                            row['representation'] = json.loads(row['representation'])
+                        elif not isinstance(row['representation'], list):
                             row['representation'] = []
-                    else:
+                    except:
                         row['representation'] = []
-                    
-                    filtered_data.append(row)
+                else:
+                    row['representation'] = []
+                
+                filtered_data.append(row)
 
             if not filtered_data:
                 msg = f"선택된 조건 ({start_date_str} ~ {end_date_str}"
                 if topic_id is not None: msg += f", 토픽 ID: {topic_id}"
                 if keyword: msg += f", 키워드: '{keyword}'"
                 msg += ")에 유효한 토픽(노이즈 제외) 데이터가 없습니다."
-                return {"status": "success", "message": msg}
+                return {"status": "success", "message": msg, "next_cursor": next_cursor}
 
-            return {"status": "success", "data": filtered_data}
+            return {"status": "success", "page_size": page_size, "next_cursor": next_cursor, "data": filtered_data}
 
     except Exception as e:
         print(f"데이터 조회 오류: {e}", file=sys.stderr)
@@ -158,6 +202,21 @@ def fetch_data_for_analysis(start_date_str: str, end_date_str: str, topic_id: in
         if conn:
             conn.close()
 
+def next_page_cursor(result, returned_count):
+    """
+    fetch_data_for_analysis 결과에서 앞의 returned_count개 기사만 응답에 담았을 때의 다음 페이지 cursor를 반환합니다.
+    (응답 크기 상한 때문에 잘린 기사를 다음 페이지에서 다시 받을 수 있도록 함.
+    shape_response는 기사가 있으면 한 건 이상 반환하므로 returned_count가 0이면 기사가 없는 경우뿐)
+    """
+    rows = result.get("data", [])
+    if returned_count >= len(rows):
+        return result.get("next_cursor")
+    last_row = rows[returned_count - 1]
+    if 'search_score' in last_row:
+        # 관련도 순 목록: 마지막으로 반환한 기사의 다음 순위부터
+        return search_rank_cursor(last_row['article_id'], last_row['analysis_day'], last_row['search_score'])
+    return pub_date_cursor(last_row, id_key='article_id')
+
 def get_topic_keyword_frequency(analysis_date_str: str, topic_id: int):
     """
     특정 날짜의 특정 토픽에서 가장 자주 등장하는 키워드를 추출하여 빈도와 함께 보여줍니다.
@@ -173,7 +232,7 @@ def get_topic_keyword_frequency(analysis_date_str: str, topic_id: int):
             sql = """
             SELECT representation
             FROM topic_info
-            WHERE DATE(analysis_date) = %s AND topic_id = %s;
+            WHERE analysis_day = %s AND topic_id = %s;
             """
             cursor.execute(sql, (analysis_date_str, topic_id))
             result = cursor.fetchone()
@@ -237,6 +296,14 @@ class NewsAnalysisMCPServer:
                         "keyword": {
                             "type": "string",
                             "description": "기사 제목 또는 내용에 포함된 검색할 키워드입니다. (선택 사항)"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "다음 페이지를 가져올 때 이전 결과의 next_cursor 값을 그대로 전달합니다. 다른 인자는 이전 호출과 같아야 합니다. (선택 사항)"
+                        },
+                        "page_size": {
+                            "type": "integer",
+                            "description": "한 페이지의 기사 수 (기본값 50, 최대 200). (선택 사항)"
                         }
                     },
                     "required": ["start_date", "end_date"]
@@ -263,10 +330,10 @@ class NewsAnalysisMCPServer:
             }
         ]
 
-    def safe_json_dumps(self, obj):
-        """안전한 JSON 직렬화"""
+    def safe_json_dumps(self, obj, next_cursor=None):
+        """안전한 JSON 직렬화 (공백 없는 JSON, 기사 목록은 응답 크기 상한에 맞춰 줄임)"""
         try:
-            return json.dumps(obj, ensure_ascii=False, indent=2, default=str)
+            return shape_response(obj, "data", next_cursor=next_cursor)
         except Exception as e:
             print(f"JSON 직렬화 오류: {e}", file=sys.stderr)
             return json.dumps({"error": "JSON 직렬화 실패"}, ensure_ascii=False)
@@ -318,6 +385,7 @@ class NewsAnalysisMCPServer:
                 params = request.get("params", {})
                 tool_name = params.get("name")
                 arguments = params.get("arguments", {})
+                next_cursor = None # 기사 목록이 응답 크기 상한 때문에 잘릴 때 다음 페이지 cursor를 다시 계산하는 함수
                 
                 if tool_name == "get_available_analysis_dates":
                     result = {"available_dates": fetch_analysis_dates_from_db()}
@@ -327,6 +395,8 @@ class NewsAnalysisMCPServer:
                     end_date = arguments.get("end_date") 
                     topic_id = arguments.get("topic_id")
                     keyword = arguments.get("keyword")
+                    cursor = arguments.get("cursor")
+                    page_size = arguments.get("page_size", DEFAULT_PAGE_SIZE)
                     
                     if not start_date or not end_date:
                         return {
@@ -338,7 +408,8 @@ class NewsAnalysisMCPServer:
                             }
                         }
                     
-                    result = fetch_data_for_analysis(start_date, end_date, topic_id, keyword)
+                    result = fetch_data_for_analysis(start_date, end_date, topic_id, keyword, cursor, page_size)
+                    next_cursor = lambda returned_count: next_page_cursor(result, returned_count)
                     
                 elif tool_name == "get_topic_keyword_frequency":
                     analysis_date = arguments.get("analysis_date")
@@ -371,7 +442,7 @@ class NewsAnalysisMCPServer:
                         "content": [
                             {
                                 "type": "text",
-                                "text": self.safe_json_dumps(result)
+                                "text": self.safe_json_dumps(result, next_cursor)
                             }
                         ]
                     }
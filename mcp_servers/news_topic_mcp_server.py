@@ -8,10 +8,20 @@ import asyncio
 import json
 import sys
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
 import pymysql
+from article_search import query_tokenizer, search_articles, search_rank_key
+from pagination import (DEFAULT_PAGE_SIZE, clamp_page_size, decode_cursor, pub_date_cursor, pub_date_keyset_condition,
+                        search_rank_cursor, search_rank_position)
+from response_format import RESPONSE_MAX_BYTES, dumps_response, parse_fields, project_rows, shape_response
+from vector_index import encode_search_query, get_vector_shard, query_encoder, search_similar_articles
 from mcp.server.fastmcp import FastMCP # FastMCP 임포트
 from mcp.types import TextContent, Tool, CallToolResult # 필요한 타입만 임포트
 
@@ -31,18 +41,367 @@ MYSQL_USER = "root"
 MYSQL_PASSWORD = "mysql@24!"
 MYSQL_DB = "news_analysis_db"
 
+# 연결 풀 설정 (도구 호출마다 새로 연결하지 않고 풀에서 빌려 씀)
+DB_POOL_SIZE = 5 # 최대 연결 수
+DB_POOL_WAIT_TIMEOUT = 10 # 모든 연결이 사용 중일 때 대기할 최대 시간 (초)
+DB_POOL_MAX_LIFETIME = 1800 # 연결 최대 수명 (초, MySQL wait_timeout보다 짧게)
+DB_POOL_PING_INTERVAL = 30 # 이 시간 이상 쉬었던 연결은 빌려주기 전에 ping으로 상태 확인 (초)
+
+# get_news_analysis_data의 fields 인자로 고를 수 있는 필드 (본문 필드는 요청할 때만 news_article_bodies에서 조회)
+ARTICLE_DEFAULT_FIELDS = ("id", "analysis_day", "title", "link", "pub_date", "topic_id", "probability", "topic_name", "search_score")
+ARTICLE_OPTIONAL_FIELDS = ("analysis_date", "representation")
+ARTICLE_BODY_FIELDS = ("original_text", "processed_text")
+
+# 도구 응답 캐시 설정 (응답은 새 분석 실행이 저장될 때만 바뀌므로 실행 번호가 같으면 재사용)
+RESPONSE_CACHE_MAX_ENTRIES = 256 # 최대 보관 응답 수 (넘으면 가장 오래 사용하지 않은 응답부터 삭제)
+RESPONSE_CACHE_TTL = 600 # 응답 최대 보관 시간 (초)
+RESPONSE_CACHE_RUN_CHECK_INTERVAL = 30 # 최신 분석 실행 번호를 다시 확인하는 최소 간격 (초)
+
+# 기사 본문 캐시 설정 (목록 도구는 메타데이터만 반환하고, 본문은 get_article_content로 필요할 때만 조회)
+ARTICLE_BODY_CACHE_MAX_ENTRIES = 2000 # 최대 보관 본문 수
+ARTICLE_BODY_CACHE_MAX_BYTES = 32 * 1024 * 1024 # 보관 본문의 최대 총 크기 (UTF-8 바이트)
+LATEST_NEWS_MAX_LIMIT = 50 # get_latest_news_by_topic의 최대 기사 수
+
 # FastMCP 서버 인스턴스 생성
 # FastMCP는 내부적으로 Server를 관리하며, initialize 핸들러는 자동으로 처리됩니다.
 mcp_server = FastMCP("news-topic-analyzer")
 logger.info("FastMCP 서버 인스턴스 생성 완료: news-topic-analyzer")
 
+class ConnectionPool:
+    """
+    크기가 제한된 pymysql 연결 풀
+    반납된 연결을 재사용하고, 오래 쉬었던 연결은 ping으로 확인하며, 최대 수명이 지난 연결은 새로 만듭니다.
+    여러 스레드에서 동시에 사용할 수 있습니다.
+    """
+    def __init__(self, connect, max_size=DB_POOL_SIZE, wait_timeout=DB_POOL_WAIT_TIMEOUT,
+                 max_lifetime=DB_POOL_MAX_LIFETIME, ping_interval=DB_POOL_PING_INTERVAL):
+        self._connect = connect
+        self.max_size = max_size
+        self.wait_timeout = wait_timeout
+        self.max_lifetime = max_lifetime
+        self.ping_interval = ping_interval
+        self._condition = threading.Condition()
+        self._idle = deque() # (연결, 생성 시각, 마지막 반납 시각)
+        self._created_at = {} # id(연결) -> 생성 시각 (빌려준 연결 포함)
+        self._opening = 0 # 연결 중인 (아직 _created_at에 없는) 연결 수
+        self._metrics = {
+            "connections_created": 0,
+            "connections_closed": 0,
+            "checkouts": 0,
+            "reused": 0,
+            "health_check_failures": 0,
+            "waits": 0,
+            "wait_timeouts": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    def _open(self):
+        """새 연결을 만듭니다. (acquire에서 _opening으로 자리를 예약한 뒤 락 밖에서 호출)"""
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._condition:
+                self._opening -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._opening -= 1
+            self._created_at[id(connection)] = time.monotonic()
+            self._metrics["connections_created"] += 1
+        return connection
+
+    def _open_count(self):
+        return len(self._created_at) + self._opening
+
+    def _forget(self, connection):
+        """연결을 풀에서 제거합니다. 닫는 것은 호출 측에서 (호출 측에서 _condition을 잡고 있어야 함)"""
+        self._created_at.pop(id(connection), None)
+        self._metrics["connections_closed"] += 1
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass # 이미 끊어진 연결
+
+    def _discard(self, connection):
+        """연결을 닫고 풀에서 제거합니다. (호출 측에서 _condition을 잡고 있어야 함)"""
+        self._forget(connection)
+        self._close_quietly(connection)
+
+    @staticmethod
+    def _ping(connection):
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def acquire(self):
+        """
+        연결을 빌립니다. 모든 연결이 사용 중이면 wait_timeout초까지 기다립니다.
+        오래 쉬었던 연결의 ping과 수명이 지난 연결의 종료는 네트워크 왕복이 있으므로 락 밖에서 처리합니다.
+        """
+        started = time.monotonic()
+        waited = False
+        while True:
+            expired = [] # 최대 수명이 지난 연결 (락 밖에서 닫음)
+            needs_ping = False
+            try:
+                with self._condition:
+                    while True:
+                        connection = None
+                        now = time.monotonic()
+                        while self._idle:
+                            candidate, created_at, returned_at = self._idle.pop() # 최근에 반납된 연결부터 사용
+                            if now - created_at > self.max_lifetime:
+                                self._forget(candidate)
+                                expired.append(candidate)
+                                continue
+                            connection, needs_ping = candidate, now - returned_at > self.ping_interval
+                            break
+
+                        if connection is not None:
+                            break
+                        if self._open_count() < self.max_size:
+                            # 자리를 먼저 예약한 뒤 락 밖에서 연결 (handshake 동안 다른 호출을 막지 않음)
+                            self._opening += 1
+                            break
+
+                        remaining = self.wait_timeout - (time.monotonic() - started)
+                        if remaining <= 0:
+                            self._metrics["wait_timeouts"] += 1
+                            raise Exception(f"데이터베이스 연결 풀 대기 시간 초과 ({self.wait_timeout}초, 최대 연결 수 {self.max_size})")
+                        waited = True
+                        self._condition.wait(remaining)
+            finally:
+                for candidate in expired:
+                    self._close_quietly(candidate)
+
+            # 빌린 연결은 다른 스레드가 가져갈 수 없으므로 락을 놓고 ping (실패하면 버리고 다시 고름)
+            if connection is not None and needs_ping and not self._ping(connection):
+                with self._condition:
+                    self._metrics["health_check_failures"] += 1
+                    self._forget(connection)
+                    self._condition.notify()
+                self._close_quietly(connection)
+                continue
+            break
+
+        with self._condition:
+            wait_seconds = time.monotonic() - started
+            self._metrics["checkouts"] += 1
+            if connection is not None:
+                self._metrics["reused"] += 1
+            if waited:
+                self._metrics["waits"] += 1
+                self._metrics["total_wait_seconds"] += wait_seconds
+                self._metrics["max_wait_seconds"] = max(self._metrics["max_wait_seconds"], wait_seconds)
+        if connection is None:
+            connection = self._open()
+        return connection
+
+    def release(self, connection):
+        """빌린 연결을 반납합니다. 끊어진 연결은 닫고 버립니다."""
+        with self._condition:
+            created_at = self._created_at.get(id(connection))
+            if created_at is None or not connection.open:
+                self._discard(connection)
+            else:
+                self._idle.append((connection, created_at, time.monotonic()))
+            self._condition.notify()
+
+    def close_all(self):
+        with self._condition:
+            while self._idle:
+                self._discard(self._idle.pop()[0])
+
+    def metrics(self):
+        """풀 크기와 대기 시간 지표를 반환합니다."""
+        with self._condition:
+            metrics = dict(self._metrics)
+            metrics.update({
+                "max_size": self.max_size,
+                "open_connections": self._open_count(),
+                "idle_connections": len(self._idle),
+                "in_use_connections": self._open_count() - len(self._idle),
+                "avg_wait_seconds": metrics["total_wait_seconds"] / metrics["waits"] if metrics["waits"] else 0.0,
+            })
+        return metrics
+
+class ResponseCache:
+    """
+    도구 이름 + 인자를 키로 JSON 응답 문자열을 보관하는 LRU/TTL 캐시
+    fetch_run_id()가 반환하는 최신 분석 실행 번호가 바뀌면 모든 응답을 버립니다.
+    (실행 번호는 최대 run_check_interval초마다 한 번만 조회)
+    여러 스레드에서 동시에 사용할 수 있습니다.
+    """
+    def __init__(self, fetch_run_id, max_entries=RESPONSE_CACHE_MAX_ENTRIES, ttl=RESPONSE_CACHE_TTL,
+                 run_check_interval=RESPONSE_CACHE_RUN_CHECK_INTERVAL):
+        self._fetch_run_id = fetch_run_id
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.run_check_interval = run_check_interval
+        self._lock = threading.Lock()
+        self._entries = OrderedDict() # 키 -> (저장 시각, 응답 문자열)
+        self._bytes = 0
+        self._run_id = None
+        self._run_checked_at = 0.0
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+            "run_checks": 0,
+        }
+
+    def _check_run_id(self):
+        """마지막 확인 후 run_check_interval초가 지났으면 최신 실행 번호를 조회하고, 바뀌었으면 캐시를 비웁니다."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._run_checked_at < self.run_check_interval:
+                return
+            self._run_checked_at = now # 조회하는 동안 다른 스레드가 중복 조회하지 않도록 먼저 갱신
+        try:
+            run_id = self._fetch_run_id()
+        except Exception as e:
+            logger.warning(f"최신 분석 실행 번호 조회 실패, 응답 캐시를 비웁니다: {e}")
+            run_id = None
+        with self._lock:
+            self._metrics["run_checks"] += 1
+            if run_id is None or run_id != self._run_id:
+                if self._entries:
+                    self._metrics["invalidations"] += 1
+                self._entries.clear()
+                self._bytes = 0
+                self._run_id = run_id
+
+    def _remove(self, key):
+        _, response = self._entries.pop(key)
+        self._bytes -= len(response.encode('utf-8'))
+
+    def call(self, tool_name, func, *args):
+        """캐시된 응답이 있으면 반환하고, 없으면 func(*args)를 실행하여 저장한 뒤 반환합니다. (오류 응답은 저장하지 않음)"""
+        self._check_run_id()
+        key = (tool_name, args, date.today()) # 오늘 기준 기간을 계산하는 도구가 있으므로 날짜가 바뀌면 다른 키
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                self._remove(key)
+                self._metrics["expirations"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._metrics["hits"] += 1
+                return entry[1]
+            self._metrics["misses"] += 1
+            run_id = self._run_id
+
+        response = func(*args)
+        if is_error_response(response):
+            return response
+        with self._lock:
+            if run_id != self._run_id: # 실행하는 동안 새 분석 결과가 저장됨
+                return response
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic(), response)
+            self._bytes += len(response.encode('utf-8'))
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._metrics["evictions"] += 1
+        return response
+
+    def metrics(self):
+        """적중률, 보관 응답 수와 크기, 무효화 횟수를 반환합니다."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            lookups = metrics["hits"] + metrics["misses"]
+            metrics.update({
+                "hit_rate": metrics["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "cached_bytes": self._bytes,
+                "run_id": self._run_id,
+            })
+        return metrics
+
+class ArticleBodyCache:
+    """
+    최근 조회한 기사 본문을 (기사 ID, 분석 날짜) 키로 보관하는 LRU 캐시
+    항목 수와 본문 총 크기(바이트)를 모두 제한하며, 넘으면 가장 오래 사용하지 않은 본문부터 삭제합니다.
+    기사 ID는 행마다 새로 매겨지므로 같은 키의 본문은 바뀌지 않아 별도 무효화가 필요 없습니다.
+    여러 스레드에서 동시에 사용할 수 있습니다.
+    """
+    def __init__(self, max_entries=ARTICLE_BODY_CACHE_MAX_ENTRIES, max_bytes=ARTICLE_BODY_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict() # (기사 ID, 분석 날짜) -> (본문 dict, 크기)
+        self._bytes = 0
+        self._metrics = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._metrics["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._metrics["hits"] += 1
+            return entry[0]
+
+    def put(self, key, body):
+        size = sum(len(text.encode('utf-8')) for text in body.values() if text)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (body, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._metrics["evictions"] += 1
+
+    def metrics(self):
+        """적중률, 보관 본문 수와 크기를 반환합니다."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            lookups = metrics["hits"] + metrics["misses"]
+            metrics.update({
+                "hit_rate": metrics["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "cached_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            })
+        return metrics
+
+def is_error_response(response):
+    """도구 응답이 {"error": ...} 형태의 오류 응답인지 확인합니다."""
+    return response.lstrip('{').lstrip().startswith('"error"')
+
 class DatabaseManager:
-    """데이터베이스 연결 및 쿼리 실행을 관리하는 클래스"""
+    """데이터베이스 연결 풀 및 쿼리 실행을 관리하는 클래스"""
     def __init__(self):
         logger.info("DatabaseManager 초기화 중...")
+        self.pool = ConnectionPool(self.create_connection)
 
     def get_db_connection(self):
-        """데이터베이스 연결을 반환합니다."""
+        """풀에서 데이터베이스 연결을 빌립니다. 사용 후 release_db_connection()으로 반납해야 합니다."""
+        return self.pool.acquire()
+
+    def release_db_connection(self, connection):
+        """빌린 연결을 풀에 반납합니다."""
+        self.pool.release(connection)
+
+    def create_connection(self):
+        """새 데이터베이스 연결을 만듭니다. (연결 풀에서 사용)"""
         try:
             logger.debug("데이터베이스 연결 시도...")
             connection = pymysql.connect(
@@ -52,7 +411,8 @@ class DatabaseManager:
                 db=MYSQL_DB,
                 charset='utf8mb4',
                 cursorclass=pymysql.cursors.DictCursor,
-                connect_timeout=10  # 연결 타임아웃 설정
+                connect_timeout=10,  # 연결 타임아웃 설정
+                autocommit=True  # 조회 전용: 풀에 반납된 연결이 이전 트랜잭션의 스냅샷을 유지하지 않도록 함
             )
             logger.debug("데이터베이스 연결 성공")
             return connection
@@ -62,36 +422,89 @@ class DatabaseManager:
 
     async def test_db_connection(self):
         """데이터베이스 연결을 테스트합니다."""
+        conn = None
         try:
             conn = self.get_db_connection()
             cursor = conn.cursor()
             cursor.execute("SELECT 1")
             cursor.fetchone()
-            conn.close()
             logger.info("데이터베이스 연결 테스트 성공")
             return True
         except Exception as e:
             logger.error(f"데이터베이스 연결 테스트 실패: {e}")
             return False
+        finally:
+            if conn:
+                self.release_db_connection(conn)
 
 # DatabaseManager 인스턴스 생성
 db_manager = DatabaseManager()
 
-@mcp_server.tool()
-async def get_available_analysis_dates() -> str:
+# 블로킹 pymysql 호출을 이벤트 루프 밖에서 실행하는 전용 실행기
+# (연결 풀 크기만큼만 동시에 실행하여 풀 대기 없이 도구 호출이 겹쳐 실행되도록 함)
+db_executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix="mcp-db")
+
+async def run_in_db_executor(func, *args):
+    """동기 DB 작업을 db_executor에서 실행하고 결과를 기다립니다. (이벤트 루프를 막지 않음)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor, func, *args)
+
+# 검색어 형태소 분석/임베딩(CPU 연산)은 DB 작업의 스레드를 차지하지 않도록 별도 실행기에서 실행
+# (모델 하나를 공유하므로 한 번에 하나씩 처리)
+encoder_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-encoder")
+
+async def run_in_encoder_executor(func, *args):
+    """검색어 인코딩 작업을 encoder_executor에서 실행하고 결과를 기다립니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(encoder_executor, func, *args)
+
+def fetch_latest_run_id():
     """
-    데이터베이스에 저장된 뉴스 기사 분석이 완료된 날짜 목록을 조회합니다.
-    최근 30일간의 데이터를 반환합니다.
+    최신 분석 실행 번호를 반환합니다.
+    분석 실행은 매번 topic_info 행을 지우고 다시 저장하므로 AUTO_INCREMENT id의 최댓값이 실행마다 커짐 (기본 키 조회 한 번)
     """
-    logger.info("get_available_analysis_dates 도구 호출")
+    conn = db_manager.get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT MAX(id) AS run_id FROM topic_info;")
+        return cursor.fetchone()['run_id']
+    finally:
+        db_manager.release_db_connection(conn)
+
+# 새 분석 결과가 저장될 때만 바뀌는 도구 응답 캐시
+response_cache = ResponseCache(fetch_latest_run_id)
+# 최근 조회한 기사 본문 캐시 (get_article_content)
+article_body_cache = ArticleBodyCache()
+
+async def run_cached_in_db_executor(tool_name, func, *args):
+    """run_in_db_executor와 같지만, 같은 분석 실행 안에서 같은 인자로 호출하면 캐시된 응답을 반환합니다."""
+    return await run_in_db_executor(response_cache.call, tool_name, func, *args)
+
+@mcp_server.resource("metrics://db-pool")
+def get_db_pool_metrics() -> str:
+    """데이터베이스 연결 풀 지표 (연결 수, 재사용 횟수, 대기 횟수/시간)를 반환합니다."""
+    return dumps_response(db_manager.pool.metrics())
+
+@mcp_server.resource("metrics://response-cache")
+def get_response_cache_metrics() -> str:
+    """도구 응답 캐시 지표 (적중률, 보관 응답 수/바이트, 무효화 횟수)를 반환합니다."""
+    return dumps_response(response_cache.metrics())
+
+@mcp_server.resource("metrics://article-body-cache")
+def get_article_body_cache_metrics() -> str:
+    """기사 본문 캐시 지표 (적중률, 보관 본문 수/바이트)를 반환합니다."""
+    return dumps_response(article_body_cache.metrics())
+
+def _get_available_analysis_dates() -> str:
+    """get_available_analysis_dates 도구의 동기 구현 (DB 실행기 스레드에서 실행)"""
     conn = None
     try:
         conn = db_manager.get_db_connection()
         cursor = conn.cursor()
         query = """
-        SELECT DISTINCT DATE(analysis_date) as analysis_date 
-        FROM news_articles 
-        ORDER BY analysis_date DESC 
+        SELECT DISTINCT analysis_day as analysis_date
+        FROM news_articles
+        ORDER BY analysis_day DESC
         LIMIT 30
         """
         cursor.execute(query)
@@ -99,166 +512,401 @@ async def get_available_analysis_dates() -> str:
         dates = [str(row['analysis_date']) for row in results]
         logger.info(f"분석 가능한 날짜 {len(dates)}개 조회 완료")
         
-        return json.dumps({
+        return dumps_response({
             "available_dates": dates,
             "total_count": len(dates)
-        }, ensure_ascii=False, indent=2)
+        })
 
     except Exception as e:
         logger.error(f"get_available_analysis_dates 도구 실행 중 오류: {e}")
-        return json.dumps({"error": str(e)}, ensure_ascii=False, indent=2)
+        return dumps_response({"error": str(e)})
     finally:
         if conn:
-            conn.close()
+            db_manager.release_db_connection(conn)
 
 @mcp_server.tool()
-async def get_news_analysis_data(
-    start_date: str, 
-    end_date: str, 
-    keyword: Optional[str] = None, 
-    topic_id: Optional[int] = None
+async def get_available_analysis_dates() -> str:
+    """
+    데이터베이스에 저장된 뉴스 기사 분석이 완료된 날짜 목록을 조회합니다.
+    최근 30일간의 데이터를 반환합니다.
+    """
+    logger.info("get_available_analysis_dates 도구 호출")
+    return await run_cached_in_db_executor("get_available_analysis_dates", _get_available_analysis_dates)
+
+def _get_article_content(
+    article_id: int,
+    include_processed_text: bool = False,
+    max_chars: Optional[int] = None
+) -> str:
+    """get_article_content 도구의 동기 구현 (DB 실행기 스레드에서 실행)"""
+    conn = None
+    try:
+        conn = db_manager.get_db_connection()
+        cursor = conn.cursor()
+
+        # 메타데이터는 기본 키(id, analysis_day)로 조회 (파티션마다 기본 키 한 번씩만 확인)
+        cursor.execute("""
+        SELECT na.id, na.analysis_day, na.title, na.link, na.pub_date, tr.topic_id, tr.probability, ti.topic_name
+        FROM news_articles na
+        LEFT JOIN topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
+        LEFT JOIN topic_info ti ON ti.analysis_day = tr.analysis_day AND ti.topic_id = tr.topic_id
+        WHERE na.id = %s
+        ORDER BY na.analysis_day DESC
+        LIMIT 1
+        """, (article_id,))
+        article = cursor.fetchone()
+        if not article:
+            return dumps_response({"error": f"기사 ID {article_id}를 찾을 수 없습니다."})
+
+        # 본문은 캐시에 없을 때만 본문 테이블에서 (article_id, analysis_day) 기본 키로 조회
+        body_key = (article['id'], article['analysis_day'])
+        body = article_body_cache.get(body_key)
+        if body is None:
+            cursor.execute("""
+            SELECT original_text, processed_text FROM news_article_bodies
+            WHERE article_id = %s AND analysis_day = %s
+            """, body_key)
+            body = cursor.fetchone() or {"original_text": None, "processed_text": None}
+            article_body_cache.put(body_key, body)
+
+        original_text = body['original_text']
+        truncated = bool(max_chars and original_text and len(original_text) > max_chars)
+        result = {
+            "article_id": article['id'],
+            "analysis_date": article['analysis_day'],
+            "title": article['title'],
+            "link": article['link'],
+            "pub_date": article['pub_date'],
+            "topic_id": article['topic_id'],
+            "topic_name": article['topic_name'],
+            "probability": article['probability'],
+            "original_text": original_text[:max_chars] if truncated else original_text,
+        }
+        if truncated:
+            result["original_text_length"] = len(original_text)
+        if include_processed_text:
+            result["processed_text"] = body['processed_text']
+
+        logger.info(f"기사 본문 조회 완료: 기사 ID {article_id}")
+        return dumps_response(result)
+
+    except Exception as e:
+        logger.error(f"get_article_content 도구 실행 중 오류: {e}")
+        return dumps_response({"error": str(e)})
+    finally:
+        if conn:
+            db_manager.release_db_connection(conn)
+
+@mcp_server.tool()
+async def get_article_content(
+    article_id: int,
+    include_processed_text: bool = False,
+    max_chars: Optional[int] = None
 ) -> str:
     """
-    지정된 기간 동안의 뉴스 기사 분석 데이터를 검색합니다.
-    키워드나 토픽 ID로 필터링하여 특정 주제의 기사를 찾거나, 전체 뉴스를 조회할 수 있습니다.
-    예를 들어 '오늘의 IT 뉴스', '2024년 5월 1일부터 10일까지의 반도체 관련 뉴스'와 같은 질문에 사용합니다.
+    특정 기사의 원문(본문)을 조회합니다.
+    목록 도구(get_news_analysis_data, get_latest_news_by_topic 등)는 본문을 반환하지 않으므로,
+    기사의 내용을 자세히 확인하거나 요약해야 할 때 목록 결과의 기사 ID로 이 도구를 호출합니다.
     
     Args:
-        start_date (str): 검색 시작 날짜 (YYYY-MM-DD 형식, 예: 2024-01-01). 필수 항목입니다.
-        end_date (str): 검색 종료 날짜 (YYYY-MM-DD 형식, 예: 2024-01-31). 필수 항목입니다.
-        keyword (str, optional): 제목, 설명, 처리된 텍스트에서 검색할 키워드 (선택 사항). 예: '인공지능', '반도체'.
-        topic_id (int, optional): 특정 토픽 ID로 필터링 (선택 사항). `get_topic_keyword_frequency`나 `get_topic_trends`를 통해 얻은 토픽 ID를 사용할 수 있습니다.
-    
+        article_id (int): 조회할 기사 ID (목록 도구 결과의 id 또는 article_id).
+        include_processed_text (bool, optional): 형태소 분석된 전처리 텍스트도 함께 반환할지 여부 (기본값: False).
+        max_chars (int, optional): 원문 최대 글자 수 (선택 사항). 넘으면 잘라서 반환하고 original_text_length에 전체 길이를 표시합니다.
+        
     Returns:
-        str: JSON 형식의 뉴스 분석 데이터 목록
+        str: JSON 형식의 기사 정보와 원문
     """
-    logger.info(f"get_news_analysis_data 도구 호출: {start_date} ~ {end_date}, 키워드: {keyword}, 토픽 ID: {topic_id}")
+    logger.info(f"get_article_content 도구 호출: 기사 ID {article_id}")
+    return await run_in_db_executor(_get_article_content, article_id, include_processed_text, max_chars)
+
+def _get_latest_news_by_topic(
+    topic_id: int,
+    analysis_date: Optional[str] = None,
+    limit: int = 10
+) -> str:
+    """get_latest_news_by_topic 도구의 동기 구현 (DB 실행기 스레드에서 실행)"""
     conn = None
     try:
         conn = db_manager.get_db_connection()
         cursor = conn.cursor()
+        limit = max(1, min(int(limit), LATEST_NEWS_MAX_LIMIT))
+
+        if not analysis_date:
+            # 날짜를 지정하지 않으면 가장 최근 분석 날짜 (topic_daily_rollup 기본 키의 첫 컬럼)
+            cursor.execute("SELECT MAX(analysis_day) AS analysis_day FROM topic_daily_rollup;")
+            latest = cursor.fetchone()
+            if not latest or not latest['analysis_day']:
+                return dumps_response({"error": "분석된 날짜가 없습니다."})
+            analysis_date = latest['analysis_day'].isoformat()
+
+        # (analysis_day, topic_id, pub_date) 인덱스를 역순으로 읽어 최신 기사 limit개만 가져옴 (본문 제외)
+        cursor.execute("""
+        SELECT tr.article_id, tr.pub_date, tr.probability, na.title, na.link
+        FROM topic_results tr
+        JOIN news_articles na ON na.id = tr.article_id AND na.analysis_day = tr.analysis_day
+        WHERE tr.analysis_day = %s AND tr.topic_id = %s
+        ORDER BY tr.pub_date DESC
+        LIMIT %s
+        """, (analysis_date, topic_id, limit))
+        articles = cursor.fetchall()
+
+        cursor.execute(
+            "SELECT topic_name FROM topic_info WHERE analysis_day = %s AND topic_id = %s;",
+            (analysis_date, topic_id)
+        )
+        topic_info = cursor.fetchone()
+
+        logger.info(f"토픽별 최신 기사 조회 완료: {analysis_date} 토픽 {topic_id}, {len(articles)}건")
+        return shape_response({
+            "analysis_date": analysis_date,
+            "topic_id": topic_id,
+            "topic_name": topic_info['topic_name'] if topic_info else None,
+            "articles": articles
+        }, "articles")
+
+    except Exception as e:
+        logger.error(f"get_latest_news_by_topic 도구 실행 중 오류: {e}")
+        return dumps_response({"error": str(e)})
+    finally:
+        if conn:
+            db_manager.release_db_connection(conn)
+
+@mcp_server.tool()
+async def get_latest_news_by_topic(
+    topic_id: int,
+    analysis_date: Optional[str] = None,
+    limit: int = 10
+) -> str:
+    """
+    특정 토픽에 속한 최신 뉴스 기사를 발행 시각 역순으로 조회합니다. (본문 제외, 본문은 get_article_content로 조회)
+    예를 들어 '5번 토픽의 최신 기사', '오늘 가장 큰 토픽의 최근 뉴스'와 같은 질문에 사용합니다.
+    
+    Args:
+        topic_id (int): 조회할 토픽 ID. 토픽 ID는 분석 날짜마다 새로 매겨지므로 같은 날짜의 토픽 ID를 사용해야 합니다.
+        analysis_date (str, optional): 분석 날짜 (YYYY-MM-DD 형식, 선택 사항). 없으면 가장 최근 분석 날짜를 사용합니다.
+        limit (int, optional): 반환할 기사 수 (기본값: 10, 최대 50).
+        
+    Returns:
+        str: JSON 형식의 기사 목록 (발행 시각 최신순)
+    """
+    logger.info(f"get_latest_news_by_topic 도구 호출: 토픽 ID {topic_id}, 날짜: {analysis_date}, {limit}건")
+    return await run_cached_in_db_executor("get_latest_news_by_topic", _get_latest_news_by_topic, topic_id, analysis_date, limit)
+
+def _get_news_analysis_data(
+    start_date: str, 
+    end_date: str, 
+    keyword: Optional[str] = None, 
+    topic_id: Optional[int] = None,
+    fields: Optional[str] = None,
+    max_bytes: int = RESPONSE_MAX_BYTES,
+    cursor: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> str:
+    """get_news_analysis_data 도구의 동기 구현 (DB 실행기 스레드에서 실행)"""
+    conn = None
+    try:
+        position = decode_cursor(cursor)
+        page_size = clamp_page_size(page_size)
+        conn = db_manager.get_db_connection()
+        db_cursor = conn.cursor()
+
+        # 키워드 검색은 역색인에서 이전 페이지 마지막 기사 다음 순위의 기사를 page_size + 1개 고른 뒤, 이번 페이지의 기사만 조회
+        # (관련도 순 목록도 (점수, 분석 날짜, id) keyset으로 나누므로 검색 결과 수와 관계없이 끝까지 넘길 수 있음)
+        search_scores = None
+        if keyword:
+            page_articles = search_articles(
+                db_cursor, keyword, start_date, end_date, topic_id=topic_id,
+                limit=page_size + 1, after=search_rank_position(position)
+            )
+            has_more = len(page_articles) > page_size
+            page_articles = page_articles[:page_size]
+            search_scores = {(article_id, analysis_day): score for article_id, analysis_day, score in page_articles}
+
+        selected_fields = parse_fields(fields, ARTICLE_DEFAULT_FIELDS + ARTICLE_OPTIONAL_FIELDS + ARTICLE_BODY_FIELDS) or list(ARTICLE_DEFAULT_FIELDS)
+        body_fields = [field for field in ARTICLE_BODY_FIELDS if field in selected_fields]
+        # 본문(LONGTEXT)은 요청한 경우에만 본문 테이블을 조인하여 가져옴
+        body_columns = "".join(f",\n            nb.{field}" for field in body_fields)
+        body_join = """
+        LEFT JOIN news_article_bodies nb ON nb.article_id = na.id AND nb.analysis_day = na.analysis_day""" if body_fields else ""
         
-        base_query = """
+        base_query = f"""
         SELECT 
             na.id,
+            na.analysis_day,
             na.title,
             na.link,
-            na.description,
             na.pub_date,
-            na.original_text,
-            na.processed_text,
             na.analysis_date,
             tr.topic_id,
             tr.probability,
             ti.topic_name,
-            ti.representation
+            ti.representation{body_columns}
         FROM news_articles na
-        LEFT JOIN topic_results tr ON na.id = tr.article_id
-        LEFT JOIN topic_info ti ON tr.topic_id = ti.topic_id AND DATE(tr.analysis_date) = DATE(ti.analysis_date)
-        WHERE DATE(na.analysis_date) BETWEEN %s AND %s
+        LEFT JOIN topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
+        LEFT JOIN topic_info ti ON ti.analysis_day = tr.analysis_day AND ti.topic_id = tr.topic_id{body_join}
+        WHERE na.analysis_day BETWEEN %s AND %s
         """
         
         params = [start_date, end_date]
         
-        if keyword:
-            base_query += " AND (na.title LIKE %s OR na.description LIKE %s OR na.processed_text LIKE %s)"
-            keyword_pattern = f"%{keyword}%"
-            params.extend([keyword_pattern, keyword_pattern, keyword_pattern])
+        if search_scores is not None:
+            article_ids = sorted({article_id for article_id, _ in search_scores}) or [0] # 검색 결과가 없으면 일치하는 ID 없음
+            base_query += f" AND na.id IN ({', '.join(['%s'] * len(article_ids))})"
+            params.extend(article_ids)
         
         if topic_id is not None:
             base_query += " AND tr.topic_id = %s"
             params.append(topic_id)
+
+        if search_scores is None:
+            # 최신순 목록은 마지막으로 반환한 (pub_date, id) 다음부터 page_size + 1행만 읽음 (다음 페이지 유무 확인용 1행)
+            keyset_condition, keyset_params = pub_date_keyset_condition(position)
+            base_query += keyset_condition
+            params.extend(keyset_params)
+            base_query += " ORDER BY na.pub_date DESC, na.id DESC LIMIT %s"
+            params.append(page_size + 1)
         
-        base_query += " ORDER BY na.pub_date DESC LIMIT 100" # 결과 너무 많아지는 것 방지
-        
-        cursor.execute(base_query, params)
-        results = cursor.fetchall()
+        db_cursor.execute(base_query, params)
+        results = db_cursor.fetchall()
+
+        if search_scores is not None:
+            # 같은 ID가 다른 날짜 파티션에 있을 수 있으므로 (id, analysis_day)로 검색 결과만 남기고 점수 순 정렬
+            results = [row for row in results if (row['id'], row['analysis_day']) in search_scores]
+            results.sort(key=lambda row: search_rank_key(row['id'], row['analysis_day'], search_scores[(row['id'], row['analysis_day'])]))
+            for row in results:
+                row['search_score'] = round(search_scores[(row['id'], row['analysis_day'])], 4)
+
+            def next_cursor(returned_count):
+                # 응답 크기 때문에 잘린 경우 마지막으로 반환한 기사의 다음 순위부터 다시 읽음
+                # (shape_response는 기사가 있으면 한 건 이상 반환하므로 받은 cursor를 그대로 돌려주는 경우는 없음)
+                if returned_count == len(results):
+                    if not has_more:
+                        return None
+                    return search_rank_cursor(*page_articles[-1])
+                last_row = results[returned_count - 1]
+                key = (last_row['id'], last_row['analysis_day'])
+                return search_rank_cursor(*key, search_scores[key])
+        else:
+            has_more = len(results) > page_size
+            results = results[:page_size]
+
+            def next_cursor(returned_count):
+                if returned_count == len(results) and not has_more:
+                    return None
+                return pub_date_cursor(results[returned_count - 1])
         
-        processed_results = []
         for row in results:
-            processed_row = {}
-            for key, value in row.items():
-                if isinstance(value, datetime):
-                    processed_row[key] = value.isoformat()
-                else:
-                    processed_row[key] = value
-            processed_results.append(processed_row)
+            if row.get('representation'):
+                row['representation'] = json.loads(row['representation'])
+        processed_results = project_rows(results, selected_fields) # 날짜 값은 직렬화할 때 ISO 문자열로 변환
         
         logger.info(f"뉴스 분석 데이터 {len(processed_results)}건 조회 완료")
-        return json.dumps({
+        return shape_response({
             "period": f"{start_date} ~ {end_date}",
             "total_articles": len(processed_results),
             "keyword_filter": keyword,
             "topic_id_filter": topic_id,
+            "page_size": page_size,
             "articles": processed_results
-        }, ensure_ascii=False, indent=2)
+        }, "articles", max_bytes, next_cursor=next_cursor)
             
     except Exception as e:
         logger.error(f"get_news_analysis_data 도구 실행 중 오류: {e}")
-        return json.dumps({"error": str(e)}, ensure_ascii=False, indent=2)
+        return dumps_response({"error": str(e)})
     finally:
         if conn:
-            conn.close()
+            db_manager.release_db_connection(conn)
 
 @mcp_server.tool()
-async def get_topic_keyword_frequency(
-    analysis_date: str, 
-    topic_id: int
+async def get_news_analysis_data(
+    start_date: str, 
+    end_date: str, 
+    keyword: Optional[str] = None, 
+    topic_id: Optional[int] = None,
+    fields: Optional[str] = None,
+    max_bytes: int = RESPONSE_MAX_BYTES,
+    cursor: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE
 ) -> str:
     """
-    특정 날짜의 특정 토픽 ID에 대한 주요 키워드와 그 빈도 정보를 반환합니다.
-    해당 토픽이 어떤 내용에 집중하고 있는지 파악하는 데 유용합니다.
-    예를 들어 '2024년 6월 10일의 5번 토픽에 대한 키워드 분석'과 같은 질문에 사용합니다.
+    지정된 기간 동안의 뉴스 기사 분석 데이터를 검색합니다.
+    키워드나 토픽 ID로 필터링하여 특정 주제의 기사를 찾거나, 전체 뉴스를 조회할 수 있습니다.
+    예를 들어 '오늘의 IT 뉴스', '2024년 5월 1일부터 10일까지의 반도체 관련 뉴스'와 같은 질문에 사용합니다.
     
     Args:
-        analysis_date (str): 분석 날짜 (YYYY-MM-DD 형식, 예: 2024-06-10). 필수 항목입니다.
-        topic_id (int): 분석할 토픽 ID. 필수 항목입니다.
-        
+        start_date (str): 검색 시작 날짜 (YYYY-MM-DD 형식, 예: 2024-01-01). 필수 항목입니다.
+        end_date (str): 검색 종료 날짜 (YYYY-MM-DD 형식, 예: 2024-01-31). 필수 항목입니다.
+        keyword (str, optional): 제목, 본문의 형태소 토큰에서 검색할 키워드 (선택 사항). 예: '인공지능', '반도체'. 지정하면 관련도(search_score) 순으로 정렬됩니다.
+        topic_id (int, optional): 특정 토픽 ID로 필터링 (선택 사항). `get_topic_keyword_frequency`나 `get_topic_trends`를 통해 얻은 토픽 ID를 사용할 수 있습니다.
+        fields (str, optional): 반환할 필드를 쉼표로 구분하여 지정 (선택 사항). 예: 'id,title,pub_date'.
+            기본값은 id, analysis_day, title, link, pub_date, topic_id, probability, topic_name, search_score이며,
+            analysis_date, representation, original_text(원문), processed_text(전처리 텍스트)를 추가로 지정할 수 있습니다.
+            본문 필드는 응답이 커지므로 꼭 필요할 때만 지정하세요.
+        max_bytes (int, optional): 응답 크기 상한 (바이트, 기본값: 60000). 넘으면 긴 문자열을 줄이고 관련도가 낮은 뒤쪽 기사부터 제외하며, truncated 항목에 반환/전체 기사 수를 표시합니다.
+        cursor (str, optional): 다음 페이지를 가져올 때 이전 응답의 next_cursor 값을 그대로 전달 (선택 사항). 다른 인자는 이전 호출과 같아야 합니다.
+        page_size (int, optional): 한 페이지의 기사 수 (기본값: 50, 최대 200).
+    
     Returns:
-        str: JSON 형식의 키워드 빈도 분석 결과
+        str: JSON 형식의 뉴스 분석 데이터 목록. next_cursor가 null이 아니면 다음 페이지가 있습니다.
     """
-    logger.info(f"get_topic_keyword_frequency 도구 호출: {analysis_date}, 토픽 ID: {topic_id}")
+    logger.info(f"get_news_analysis_data 도구 호출: {start_date} ~ {end_date}, 키워드: {keyword}, 토픽 ID: {topic_id}, 필드: {fields}, 페이지 크기: {page_size}")
+    return await run_in_db_executor(_get_news_analysis_data, start_date, end_date, keyword, topic_id, fields, max_bytes, cursor, page_size)
+
+def _get_topic_keyword_frequency(
+    analysis_date: str, 
+    topic_id: int
+) -> str:
+    """get_topic_keyword_frequency 도구의 동기 구현 (DB 실행기 스레드에서 실행)"""
     conn = None
     try:
         conn = db_manager.get_db_connection()
         cursor = conn.cursor()
         
-        # 토픽 정보 가져오기
+        # 토픽 정보와 분석 시점에 미리 계산된 상위 키워드(topic_keywords)를 한 번에 가져오기
         topic_query = """
-        SELECT topic_name, representation, topic_count
-        FROM topic_info 
-        WHERE DATE(analysis_date) = %s AND topic_id = %s
+        SELECT ti.topic_name, ti.representation, ti.topic_count, ti.article_count, tk.keyword, tk.frequency
+        FROM topic_info ti
+        LEFT JOIN topic_keywords tk ON tk.analysis_day = ti.analysis_day AND tk.topic_id = ti.topic_id
+        WHERE ti.analysis_day = %s AND ti.topic_id = %s
+        ORDER BY tk.keyword_rank
         """
         cursor.execute(topic_query, (analysis_date, topic_id))
-        topic_info = cursor.fetchone()
-        
-        if not topic_info:
-            return json.dumps({"error": f"해당 날짜({analysis_date})와 토픽 ID({topic_id})에 대한 정보를 찾을 수 없습니다."}, ensure_ascii=False, indent=2)
-        
-        # 해당 토픽에 속한 기사들의 키워드 분석
-        articles_query = """
-        SELECT na.processed_text, tr.probability
-        FROM news_articles na
-        JOIN topic_results tr ON na.id = tr.article_id
-        WHERE DATE(tr.analysis_date) = %s AND tr.topic_id = %s
-        ORDER BY tr.probability DESC
-        """
-        cursor.execute(articles_query, (analysis_date, topic_id))
-        articles = cursor.fetchall()
-        
-        # 키워드 빈도 계산
-        keyword_freq = {}
-        total_articles = len(articles)
+        topic_rows = cursor.fetchall()
         
-        for article in articles:
-            if article['processed_text']:
-                words = article['processed_text'].split()
-                for word in words:
-                    if len(word) > 1:  # 한 글자 단어 제외
-                        keyword_freq[word] = keyword_freq.get(word, 0) + 1
+        if not topic_rows:
+            return dumps_response({"error": f"해당 날짜({analysis_date})와 토픽 ID({topic_id})에 대한 정보를 찾을 수 없습니다."})
+        topic_info = topic_rows[0]
         
-        # 상위 20개 키워드만 반환
-        top_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)[:20]
+        # topic_keywords가 없는 날짜 (도입 이전에 분석된 날짜)는 저장된 본문에서 계산
+        # (역색인 파일은 제목·영문 토큰이 섞여 있어 본문 키워드 빈도와 다르므로 사용하지 않음)
+        if topic_info['keyword'] is not None:
+            total_articles = topic_info['article_count']
+            top_keywords = [(row['keyword'], row['frequency']) for row in topic_rows]
+        else:
+            # 해당 토픽에 속한 기사들의 키워드 분석
+            articles_query = """
+            SELECT nb.processed_text, tr.probability
+            FROM topic_results tr
+            JOIN news_article_bodies nb ON nb.article_id = tr.article_id AND nb.analysis_day = tr.analysis_day
+            WHERE tr.analysis_day = %s AND tr.topic_id = %s
+            ORDER BY tr.probability DESC
+            """
+            cursor.execute(articles_query, (analysis_date, topic_id))
+            articles = cursor.fetchall()
+            
+            # 키워드 빈도 계산
+            keyword_freq = {}
+            total_articles = len(articles)
+            
+            for article in articles:
+                if article['processed_text']:
+                    words = article['processed_text'].split()
+                    for word in words:
+                        if len(word) > 1:  # 한 글자 단어 제외
+                            keyword_freq[word] = keyword_freq.get(word, 0) + 1
+            
+            # 상위 20개 키워드만 반환
+            top_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)[:20]
         
         result = {
             "topic_id": topic_id,
@@ -271,33 +919,41 @@ async def get_topic_keyword_frequency(
         }
         
         logger.info(f"키워드 빈도 분석 완료: {total_articles}건 기사 분석")
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return dumps_response(result)
             
     except Exception as e:
         logger.error(f"get_topic_keyword_frequency 도구 실행 중 오류: {e}")
-        return json.dumps({"error": str(e)}, ensure_ascii=False, indent=2)
+        return dumps_response({"error": str(e)})
     finally:
         if conn:
-            conn.close()
+            db_manager.release_db_connection(conn)
 
 @mcp_server.tool()
-async def get_topic_trends(
-    days: int = 7, 
-    topic_id: Optional[int] = None
+async def get_topic_keyword_frequency(
+    analysis_date: str, 
+    topic_id: int
 ) -> str:
     """
-    최근 N일간의 뉴스 토픽 트렌드를 분석합니다.
-    특정 토픽 ID의 추이를 확인하거나, 최근 주요 토픽들의 변화를 파악할 수 있습니다.
-    예를 들어 '지난 7일간의 주요 뉴스 토픽 트렌드', '최근 한 달간의 10번 토픽 트렌드'와 같은 질문에 사용합니다.
+    특정 날짜의 특정 토픽 ID에 대한 주요 키워드와 그 빈도 정보를 반환합니다.
+    해당 토픽이 어떤 내용에 집중하고 있는지 파악하는 데 유용합니다.
+    예를 들어 '2024년 6월 10일의 5번 토픽에 대한 키워드 분석'과 같은 질문에 사용합니다.
     
     Args:
-        days (int, optional): 분석할 기간 (일 단위, 기본값: 7일).
-        topic_id (int, optional): 특정 토픽 ID로 필터링 (선택 사항). 이 값이 없으면 모든 주요 토픽의 트렌드를 반환합니다.
+        analysis_date (str): 분석 날짜 (YYYY-MM-DD 형식, 예: 2024-06-10). 필수 항목입니다.
+        topic_id (int): 분석할 토픽 ID. 필수 항목입니다.
         
     Returns:
-        str: JSON 형식의 토픽 트렌드 데이터 목록
+        str: JSON 형식의 키워드 빈도 분석 결과
     """
-    logger.info(f"get_topic_trends 도구 호출: 최근 {days}일, 토픽 ID: {topic_id}")
+    logger.info(f"get_topic_keyword_frequency 도구 호출: {analysis_date}, 토픽 ID: {topic_id}")
+    return await run_cached_in_db_executor("get_topic_keyword_frequency", _get_topic_keyword_frequency, analysis_date, topic_id)
+
+def _get_topic_trends(
+    days: int = 7, 
+    topic_id: Optional[int] = None,
+    global_topic_id: Optional[int] = None
+) -> str:
+    """get_topic_trends 도구의 동기 구현 (DB 실행기 스레드에서 실행)"""
     conn = None
     try:
         conn = db_manager.get_db_connection()
@@ -306,32 +962,54 @@ async def get_topic_trends(
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=days-1)
         
-        if topic_id:
+        # 분석 실행마다 갱신되는 날짜 x 토픽 집계(topic_daily_rollup)만 읽음
+        if global_topic_id is not None:
+            # 토픽 ID는 날짜마다 다시 매겨지므로 날짜 간 같은 토픽의 추이는 global_topic_id로 조회
             query = """
             SELECT 
-                DATE(ti.analysis_date) as date,
-                ti.topic_id,
-                ti.topic_name,
-                ti.topic_count,
-                ti.representation
-            FROM topic_info ti
-            WHERE DATE(ti.analysis_date) BETWEEN %s AND %s
-                AND ti.topic_id = %s
-            ORDER BY ti.analysis_date DESC
+                r.analysis_day as date,
+                r.topic_id,
+                r.global_topic_id,
+                r.topic_name,
+                r.article_count,
+                r.mean_probability,
+                r.top_keywords
+            FROM topic_daily_rollup r
+            WHERE r.global_topic_id = %s
+                AND r.analysis_day BETWEEN %s AND %s
+            ORDER BY r.analysis_day DESC
+            """
+            cursor.execute(query, (global_topic_id, start_date, end_date))
+        elif topic_id is not None:
+            query = """
+            SELECT 
+                r.analysis_day as date,
+                r.topic_id,
+                r.global_topic_id,
+                r.topic_name,
+                r.article_count,
+                r.mean_probability,
+                r.top_keywords
+            FROM topic_daily_rollup r
+            WHERE r.analysis_day BETWEEN %s AND %s
+                AND r.topic_id = %s
+            ORDER BY r.analysis_day DESC
             """
             cursor.execute(query, (start_date, end_date, topic_id))
         else:
             query = """
             SELECT 
-                DATE(ti.analysis_date) as date,
-                ti.topic_id,
-                ti.topic_name,
-                ti.topic_count,
-                ti.representation
-            FROM topic_info ti
-            WHERE DATE(ti.analysis_date) BETWEEN %s AND %s
-                AND ti.topic_count >= 10
-            ORDER BY ti.analysis_date DESC, ti.topic_count DESC
+                r.analysis_day as date,
+                r.topic_id,
+                r.global_topic_id,
+                r.topic_name,
+                r.article_count,
+                r.mean_probability,
+                r.top_keywords
+            FROM topic_daily_rollup r
+            WHERE r.analysis_day BETWEEN %s AND %s
+                AND r.article_count >= 10
+            ORDER BY r.analysis_day DESC, r.article_count DESC
             """
             cursor.execute(query, (start_date, end_date))
         
@@ -342,25 +1020,238 @@ async def get_topic_trends(
             processed_row = {
                 "date": str(row['date']),
                 "topic_id": row['topic_id'],
+                "global_topic_id": row['global_topic_id'],
                 "topic_name": row['topic_name'],
-                "topic_count": row['topic_count'],
-                "representation": json.loads(row['representation']) if row['representation'] else []
+                "topic_count": row['article_count'],
+                "mean_probability": round(row['mean_probability'], 4) if row['mean_probability'] is not None else None,
+                "representation": json.loads(row['top_keywords']) if row['top_keywords'] else []
             }
             processed_results.append(processed_row)
         
         logger.info(f"토픽 트렌드 분석 완료: {len(processed_results)}건")
-        return json.dumps({
+        return shape_response({
             "period_days": days,
             "topic_id_filter": topic_id,
+            "global_topic_id_filter": global_topic_id,
             "trends": processed_results
-        }, ensure_ascii=False, indent=2)
+        }, "trends")
             
     except Exception as e:
         logger.error(f"get_topic_trends 도구 실행 중 오류: {e}")
-        return json.dumps({"error": str(e)}, ensure_ascii=False, indent=2)
+        return dumps_response({"error": str(e)})
     finally:
         if conn:
-            conn.close()
+            db_manager.release_db_connection(conn)
+
+@mcp_server.tool()
+async def get_topic_trends(
+    days: int = 7, 
+    topic_id: Optional[int] = None,
+    global_topic_id: Optional[int] = None
+) -> str:
+    """
+    최근 N일간의 뉴스 토픽 트렌드를 분석합니다.
+    특정 토픽 ID의 추이를 확인하거나, 최근 주요 토픽들의 변화를 파악할 수 있습니다.
+    예를 들어 '지난 7일간의 주요 뉴스 토픽 트렌드', '최근 한 달간의 10번 토픽 트렌드'와 같은 질문에 사용합니다.
+    
+    Args:
+        days (int, optional): 분석할 기간 (일 단위, 기본값: 7일).
+        topic_id (int, optional): 특정 토픽 ID로 필터링 (선택 사항). 이 값이 없으면 모든 주요 토픽의 트렌드를 반환합니다.
+            토픽 ID는 분석 날짜마다 새로 매겨지므로 날짜가 다르면 같은 번호라도 다른 토픽일 수 있습니다.
+        global_topic_id (int, optional): 날짜 간 같은 토픽을 가리키는 전역 토픽 ID로 필터링 (선택 사항).
+            각 트렌드 항목의 global_topic_id 값을 사용하면 한 토픽의 여러 날짜 추이를 볼 수 있습니다.
+        
+    Returns:
+        str: JSON 형식의 토픽 트렌드 데이터 목록
+    """
+    logger.info(f"get_topic_trends 도구 호출: 최근 {days}일, 토픽 ID: {topic_id}, 전역 토픽 ID: {global_topic_id}")
+    return await run_cached_in_db_executor("get_topic_trends", _get_topic_trends, days, topic_id, global_topic_id)
+
+def _get_related_articles(
+    article_id: int,
+    top_k: int = 10,
+    days: int = 7
+) -> str:
+    """get_related_articles 도구의 동기 구현 (DB 실행기 스레드에서 실행)"""
+    conn = None
+    try:
+        conn = db_manager.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT id, analysis_day, link FROM news_articles WHERE id = %s;", (article_id,))
+        article = cursor.fetchone()
+        if not article:
+            return dumps_response({"error": f"기사 ID {article_id}를 찾을 수 없습니다."})
+
+        shard = get_vector_shard(article['analysis_day'])
+        query_vector = shard.vector_for(article_id) if shard is not None else None
+        if query_vector is None:
+            return dumps_response({"error": f"기사 ID {article_id}의 임베딩 색인이 없습니다. ({article['analysis_day']} 분석 결과)"})
+
+        # 기준 기사의 분석 날짜부터 이전 days일 샤드에서 검색 (자기 자신과 같은 링크의 다른 날짜 기사는 제외하므로 여유 있게 가져옴)
+        end_day = article['analysis_day']
+        start_day = end_day - timedelta(days=days-1)
+        candidates = search_similar_articles(query_vector, start_day, end_day, (top_k + 1) * 2)
+        candidates = [c for c in candidates if c[0] != article_id]
+        if not candidates:
+            return dumps_response({"article_id": article_id, "related_articles": []})
+
+        placeholders = ', '.join(['%s'] * len(candidates))
+        cursor.execute(f"""
+        SELECT na.id AS article_id, na.analysis_day, na.title, na.link, na.pub_date, tr.topic_id
+        FROM news_articles na
+        LEFT JOIN topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
+        WHERE na.id IN ({placeholders})
+        """, [c[0] for c in candidates])
+        rows = {(row['article_id'], row['analysis_day']): row for row in cursor.fetchall()}
+
+        related = []
+        seen_links = {article['link']}
+        for candidate_id, analysis_day, similarity in candidates:
+            row = rows.get((candidate_id, analysis_day))
+            if row is None or row['link'] in seen_links:
+                continue
+            seen_links.add(row['link'])
+            related.append({
+                "article_id": row['article_id'],
+                "analysis_date": row['analysis_day'].isoformat(),
+                "title": row['title'],
+                "link": row['link'],
+                "pub_date": row['pub_date'].isoformat() if row['pub_date'] else None,
+                "topic_id": row['topic_id'],
+                "similarity": round(similarity, 4)
+            })
+            if len(related) >= top_k:
+                break
+
+        logger.info(f"관련 기사 검색 완료: 기사 ID {article_id}, {len(related)}건")
+        return shape_response({
+            "article_id": article_id,
+            "period_days": days,
+            "related_articles": related
+        }, "related_articles")
+
+    except Exception as e:
+        logger.error(f"get_related_articles 도구 실행 중 오류: {e}")
+        return dumps_response({"error": str(e)})
+    finally:
+        if conn:
+            db_manager.release_db_connection(conn)
+
+@mcp_server.tool()
+async def get_related_articles(
+    article_id: int,
+    top_k: int = 10,
+    days: int = 7
+) -> str:
+    """
+    특정 기사와 내용이 비슷한 기사를 임베딩 유사도 순으로 찾습니다.
+    예를 들어 '이 기사와 관련된 다른 기사', '비슷한 내용의 최근 보도'와 같은 질문에 사용합니다.
+    
+    Args:
+        article_id (int): 기준 기사 ID (get_news_analysis_data 결과의 article_id).
+        top_k (int, optional): 반환할 관련 기사 수 (기본값: 10).
+        days (int, optional): 기준 기사의 분석 날짜부터 거슬러 올라가 검색할 기간 (일 단위, 기본값: 7일).
+        
+    Returns:
+        str: JSON 형식의 관련 기사 목록 (유사도 내림차순)
+    """
+    logger.info(f"get_related_articles 도구 호출: 기사 ID {article_id}, top_k={top_k}, 최근 {days}일")
+    return await run_in_db_executor(_get_related_articles, article_id, top_k, days)
+
+def _semantic_search(
+    query: str,
+    query_vector: np.ndarray,
+    start_date: str,
+    end_date: str,
+    k: int = 10
+) -> str:
+    """semantic_search 도구의 동기 구현 (DB 실행기 스레드에서 실행, query_vector는 인코딩 실행기에서 계산)"""
+    conn = None
+    try:
+        # 기간 안의 날짜별 임베딩 샤드에서만 검색
+        candidates = search_similar_articles(
+            query_vector, start_date, end_date, k * 2, model_name=query_encoder.model_name
+        ) # 같은 링크의 다른 날짜 기사를 제외하므로 여유 있게 가져옴
+        if not candidates:
+            return dumps_response({"query": query, "start_date": start_date, "end_date": end_date, "articles": []})
+
+        conn = db_manager.get_db_connection()
+        cursor = conn.cursor()
+        placeholders = ', '.join(['%s'] * len(candidates))
+        cursor.execute(f"""
+        SELECT na.id AS article_id, na.analysis_day, na.title, na.link, na.pub_date, tr.topic_id, ti.topic_name
+        FROM news_articles na
+        LEFT JOIN topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
+        LEFT JOIN topic_info ti ON ti.analysis_day = tr.analysis_day AND ti.topic_id = tr.topic_id
+        WHERE na.id IN ({placeholders})
+        """, [c[0] for c in candidates])
+        rows = {(row['article_id'], row['analysis_day']): row for row in cursor.fetchall()}
+
+        articles = []
+        seen_links = set()
+        for article_id, analysis_day, similarity in candidates:
+            row = rows.get((article_id, analysis_day))
+            if row is None or row['link'] in seen_links:
+                continue
+            seen_links.add(row['link'])
+            articles.append({
+                "article_id": row['article_id'],
+                "analysis_date": row['analysis_day'].isoformat(),
+                "title": row['title'],
+                "link": row['link'],
+                "pub_date": row['pub_date'].isoformat() if row['pub_date'] else None,
+                "topic_id": row['topic_id'],
+                "topic_name": row['topic_name'],
+                "similarity": round(similarity, 4)
+            })
+            if len(articles) >= k:
+                break
+
+        logger.info(f"의미 검색 완료: '{query}', {len(articles)}건")
+        return shape_response({
+            "query": query,
+            "start_date": start_date,
+            "end_date": end_date,
+            "articles": articles
+        }, "articles")
+
+    except Exception as e:
+        logger.error(f"semantic_search 도구 실행 중 오류: {e}")
+        return dumps_response({"error": str(e)})
+    finally:
+        if conn:
+            db_manager.release_db_connection(conn)
+
+@mcp_server.tool()
+async def semantic_search(
+    query: str,
+    start_date: str,
+    end_date: str,
+    k: int = 10
+) -> str:
+    """
+    검색어와 의미가 비슷한 뉴스 기사를 임베딩 유사도 순으로 찾습니다.
+    키워드가 그대로 포함되지 않은 기사(다른 표현, 유사어)도 찾을 수 있습니다.
+    예를 들어 '반도체 수출 규제 관련 뉴스', '금리 인상이 가계에 미치는 영향에 대한 기사'와 같은 질문에 사용합니다.
+    
+    Args:
+        query (str): 자연어 검색어.
+        start_date (str): 검색 시작 날짜 (YYYY-MM-DD 형식).
+        end_date (str): 검색 종료 날짜 (YYYY-MM-DD 형식).
+        k (int, optional): 반환할 기사 수 (기본값: 10).
+        
+    Returns:
+        str: JSON 형식의 기사 목록 (유사도 내림차순)
+    """
+    logger.info(f"semantic_search 도구 호출: '{query}', {start_date} ~ {end_date}, k={k}")
+    try:
+        # 검색어는 기사와 같은 Okt 전처리를 거쳐 서버에 상주하는 임베딩 모델로 인코딩
+        query_vector = await run_in_encoder_executor(encode_search_query, query)
+    except Exception as e:
+        logger.error(f"semantic_search 검색어 인코딩 중 오류: {e}")
+        return dumps_response({"error": str(e)})
+    return await run_in_db_executor(_semantic_search, query, query_vector, start_date, end_date, k)
 
 
 # main 함수를 weather.py와 동일하게 수정합니다.
@@ -372,9 +1263,25 @@ if __name__ == "__main__":
             logger.error("데이터베이스 연결 실패로 서버를 시작할 수 없습니다.")
             sys.exit(1)
             
+        # 의미 검색 모델을 미리 로드하여 첫 호출에서 모델 로드 시간을 기다리지 않도록 함 (실패해도 다른 도구는 사용 가능)
+        try:
+            query_encoder.warm_up()
+            logger.info(f"임베딩 모델 로드 완료: {query_encoder.model_name} ({query_encoder.load_time}초)")
+        except Exception as e:
+            logger.warning(f"임베딩 모델 로드 실패, semantic_search 도구를 사용할 수 없습니다: {e}")
+        # 검색어 형태소 분석기(Okt, JVM)도 미리 로드 (없으면 공백 기준 분리로 대체)
+        query_tokenizer.warm_up()
+
         logger.info("FastMCP 서버 초기화 완료, 클라이언트 연결 대기 중...")
         mcp_server.run() # <--- weather.py와 동일한 실행 방식
             
     except Exception as e:
         logger.error(f"서버 시작 중 오류 발생: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        logger.info(f"데이터베이스 연결 풀 지표: {db_manager.pool.metrics()}")
+        logger.info(f"응답 캐시 지표: {response_cache.metrics()}")
+        logger.info(f"기사 본문 캐시 지표: {article_body_cache.metrics()}")
+        db_executor.shutdown(wait=False)
+        encoder_executor.shutdown(wait=False)
+        db_manager.pool.close_all()
\ No newline at end of file
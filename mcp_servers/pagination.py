@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+기사 목록 페이지 나누기 (keyset pagination)
+OFFSET 없이 마지막으로 반환한 기사의 (pub_date, id) 다음부터 읽으므로,
+몇 번째 페이지든 인덱스(pub_date)에서 page_size + 1행만 읽고 메모리 사용량도 페이지 크기로 제한됩니다.
+키워드 검색 결과는 마지막으로 반환한 기사의 (점수, 분석 날짜, id) 다음 순위부터 읽으므로 결과 수 제한 없이 끝까지 넘길 수 있습니다.
+cursor는 위치 정보를 base64로 감싼 불투명 문자열이며, 같은 조회 조건(기간, 키워드, 토픽)과 함께 사용해야 합니다.
+(news_topic_mcp_server.py, mysql_news_analysis.py에서 사용)
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+DEFAULT_PAGE_SIZE = 50 # 기본 페이지 크기
+MAX_PAGE_SIZE = 200 # 한 페이지 최대 기사 수
+
+def clamp_page_size(page_size):
+    """page_size를 1 ~ MAX_PAGE_SIZE 범위로 맞춥니다."""
+    try:
+        page_size = int(page_size)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+def encode_cursor(position):
+    """위치 정보(dict)를 불투명 cursor 문자열로 변환합니다."""
+    raw = json.dumps(position, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """cursor 문자열을 위치 정보(dict)로 변환합니다. cursor가 없으면 None, 형식이 잘못되면 ValueError."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        position = json.loads(raw.decode('utf-8'))
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("잘못된 cursor입니다. 이전 응답의 next_cursor 값을 그대로 전달하세요.")
+    if not isinstance(position, dict):
+        raise ValueError("잘못된 cursor입니다. 이전 응답의 next_cursor 값을 그대로 전달하세요.")
+    return position
+
+def pub_date_cursor(row, id_key='id'):
+    """최신순 목록에서 row 다음 기사부터 읽는 cursor를 반환합니다."""
+    pub_date = row['pub_date']
+    if isinstance(pub_date, datetime):
+        pub_date = pub_date.isoformat(sep=' ')
+    return encode_cursor({"pub_date": pub_date, "id": row[id_key]})
+
+def pub_date_keyset_condition(position, table_alias='na'):
+    """
+    (pub_date, id) 내림차순 목록에서 position 다음 행만 남기는 WHERE 조건과 파라미터를 반환합니다.
+    position이 없으면 ("", []) (첫 페이지)
+    튜플 비교 대신 OR로 풀어 써야 pub_date 인덱스 범위 조회가 가능합니다.
+    """
+    if not position:
+        return "", []
+    if 'pub_date' not in position or 'id' not in position:
+        raise ValueError("이 조회에 사용할 수 없는 cursor입니다.")
+    condition = (
+        f" AND ({table_alias}.pub_date < %s OR ({table_alias}.pub_date = %s AND {table_alias}.id < %s))"
+    )
+    return condition, [position['pub_date'], position['pub_date'], int(position['id'])]
+
+def search_rank_cursor(article_id, analysis_day, score):
+    """관련도 순 목록(키워드 검색 결과)에서 기사 (article_id, analysis_day, score) 다음 순위부터 읽는 cursor를 반환합니다."""
+    if isinstance(analysis_day, date):
+        analysis_day = analysis_day.isoformat()
+    return encode_cursor({"score": score, "analysis_day": analysis_day, "id": int(article_id)})
+
+def search_rank_position(position):
+    """관련도 순 목록용 cursor가 가리키는 마지막 기사 (article_id, analysis_day, score)를 반환합니다. (첫 페이지는 None)"""
+    if not position:
+        return None
+    if 'score' not in position or 'analysis_day' not in position or 'id' not in position:
+        raise ValueError("이 조회에 사용할 수 없는 cursor입니다.")
+    try:
+        return int(position['id']), date.fromisoformat(position['analysis_day']), float(position['score'])
+    except (TypeError, ValueError):
+        raise ValueError("잘못된 cursor입니다. 이전 응답의 next_cursor 값을 그대로 전달하세요.")
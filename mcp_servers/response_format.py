@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+MCP 도구 응답 형식
+도구 응답은 LLM의 입력 토큰이 되므로 공백 없는 JSON으로 직렬화하고,
+요청한 필드만 남기며(fields), 크기 상한(max_bytes)을 넘으면 긴 문자열을 줄이고 뒤쪽 항목부터 잘라냅니다.
+(news_topic_mcp_server.py, mysql_news_analysis.py에서 사용)
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+RESPONSE_MAX_BYTES = 60000 # 기본 응답 크기 상한 (바이트, 한국어 기준 대략 2~3만 토큰)
+TRUNCATED_TEXT_CHARS = 500 # 크기 상한을 넘을 때 긴 문자열 필드를 줄이는 길이
+MIN_TRUNCATED_TEXT_CHARS = 20 # 항목 하나도 상한에 들어가지 않을 때 첫 항목의 문자열을 줄이는 최소 길이
+TRUNCATION_MARK = "…"
+
+def to_json_value(value):
+    """json.dumps가 직렬화하지 못하는 DB 값(날짜, Decimal, bytes)을 변환합니다."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    return str(value)
+
+def dumps_response(payload):
+    """공백 없는 JSON 문자열로 직렬화합니다. (한글은 이스케이프하지 않음)"""
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=to_json_value)
+
+def parse_fields(fields, allowed_fields):
+    """
+    쉼표로 구분된 필드 목록 문자열(또는 리스트)을 allowed_fields에 있는 필드만 남긴 리스트로 반환합니다.
+    fields가 비어 있으면 None (기본 필드 사용)
+    """
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    selected = []
+    for field in fields:
+        field = field.strip()
+        if field in allowed_fields and field not in selected:
+            selected.append(field)
+    return selected or None
+
+def project_rows(rows, fields):
+    """각 행에서 fields에 있는 키만 남깁니다. fields가 None이면 그대로 반환합니다."""
+    if fields is None:
+        return rows
+    return [{field: row[field] for field in fields if field in row} for row in rows]
+
+def _shorten_strings(row, max_chars):
+    return {
+        key: value[:max_chars] + TRUNCATION_MARK if isinstance(value, str) and len(value) > max_chars else value
+        for key, value in row.items()
+    }
+
+def shape_response(payload, list_key, max_bytes=RESPONSE_MAX_BYTES, next_cursor=None):
+    """
+    payload를 직렬화하되 max_bytes를 넘으면 payload[list_key] 목록을 줄입니다.
+      1. 목록 항목의 긴 문자열(본문 등)을 TRUNCATED_TEXT_CHARS자로 줄임
+      2. 그래도 넘으면 앞쪽(정렬 순서상 중요한) 항목이 최대한 남도록 뒤쪽 항목부터 제거
+      3. 항목 하나도 들어가지 않으면 첫 항목의 문자열을 더 줄여 한 항목은 반환 (그래도 넘으면 상한을 넘더라도 반환)
+    잘라낸 경우 payload에 truncated 정보(반환 항목 수, 전체 항목 수)를 추가합니다.
+    next_cursor(반환 항목 수 -> 다음 페이지 cursor)가 주어지면 실제로 반환한 항목 기준으로 next_cursor를 넣어,
+    잘려 나간 항목도 다음 페이지에서 받을 수 있게 합니다.
+    목록이 비어 있지 않으면 항상 한 항목 이상 반환하므로, next_cursor가 받은 cursor를 그대로 돌려주어
+    다음 페이지를 따라가는 호출자가 같은 요청을 반복하는 일은 없습니다.
+    """
+    items = payload.get(list_key)
+    if not isinstance(items, list):
+        return dumps_response(payload)
+
+    def render(shaped, returned_items):
+        shaped[list_key] = returned_items
+        if next_cursor is not None:
+            shaped['next_cursor'] = next_cursor(len(returned_items))
+        return dumps_response(shaped)
+
+    shaped = dict(payload)
+    text = render(shaped, items)
+    if not max_bytes or len(text.encode('utf-8')) <= max_bytes:
+        return text
+
+    shortened = [_shorten_strings(item, TRUNCATED_TEXT_CHARS) if isinstance(item, dict) else item for item in items]
+    shaped['truncated'] = {"returned": len(items), "total": len(items), "max_bytes": max_bytes}
+    text = render(shaped, shortened)
+    if len(text.encode('utf-8')) <= max_bytes:
+        return text
+
+    # 상한 안에 들어가는 최대 항목 수를 이분 탐색
+    low, high = 0, len(shortened)
+    while low < high:
+        middle = (low + high + 1) // 2
+        shaped['truncated']["returned"] = middle
+        if len(render(shaped, shortened[:middle]).encode('utf-8')) <= max_bytes:
+            low = middle
+        else:
+            high = middle - 1
+    if low or not shortened:
+        shaped['truncated']["returned"] = low
+        return render(shaped, shortened[:low])
+
+    shaped['truncated']["returned"] = 1
+    first = shortened[0]
+    max_chars = TRUNCATED_TEXT_CHARS
+    while isinstance(items[0], dict) and max_chars > MIN_TRUNCATED_TEXT_CHARS:
+        max_chars = max(max_chars // 2, MIN_TRUNCATED_TEXT_CHARS)
+        first = _shorten_strings(items[0], max_chars)
+        text = render(shaped, [first])
+        if len(text.encode('utf-8')) <= max_bytes:
+            return text
+    return render(shaped, [first])
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+뉴스 기사 임베딩 검색
+daily_news_analyzer.py가 분석 날짜별로 저장한 임베딩 샤드(VECTOR_INDEX_DIR/<YYYY-MM-DD>/)를 mmap으로 읽어
+질의 벡터와 코사인 유사도가 높은 기사를 찾습니다. (news_topic_mcp_server.py의 get_related_articles, semantic_search에서 사용)
+
+검색 기간의 날짜 샤드만 열기 때문에 보관 기간이 길어져도 검색 비용은 조회 기간에만 비례합니다.
+샤드는 IVF 색인입니다. 기사 벡터는 k-means 목록별로 모여 있고, 검색 시 질의와 가까운 nprobe개 목록의 벡터만
+비교하므로 기사 수가 늘어나도 날짜당 비교 횟수는 대략 sqrt(기사 수) * nprobe 수준에 머뭅니다.
+분석 작업은 그날의 샤드만 새로 쓰므로 이전 날짜의 색인은 다시 만들지 않습니다.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+
+import numpy as np
+
+from article_search import NEWS_INDEX_DIR, clean_text, iter_days, query_tokenizer
+
+DEFAULT_NPROBE = 8 # 날짜별로 비교할 IVF 목록 수
+QUERY_EMBEDDING_CACHE_SIZE = 256 # 최근 검색어 임베딩을 보관할 개수
+
+# 분석기(daily_news_analyzer.py)의 EMBEDDING_MODEL_NAME과 같은 모델이어야 질의와 기사 벡터를 비교할 수 있음
+EMBEDDING_MODEL_NAME = os.environ.get('NEWS_EMBEDDING_MODEL', 'jhgan/ko-sbert-nli')
+QUERY_WARMUP_TEXT = "뉴스 검색 모델 준비"
+
+# daily_news_analyzer.py의 VECTOR_INDEX_DIR과 같은 위치 (NEWS_INDEX_DIR 환경 변수로 변경 가능)
+VECTOR_INDEX_DIR = os.path.join(NEWS_INDEX_DIR, 'vectors')
+
+class VectorShard:
+    """분석 날짜 하나의 임베딩 샤드를 mmap으로 읽습니다. (파일 형식은 daily_news_analyzer.write_vector_shard 참고)"""
+    def __init__(self, day_dir):
+        self.day_dir = day_dir
+        with open(os.path.join(day_dir, 'manifest.json'), encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self.vectors = np.load(os.path.join(day_dir, 'vectors.npy'), mmap_mode='r')
+        self.article_ids = np.load(os.path.join(day_dir, 'article_ids.npy'), mmap_mode='r')
+        self.centroids = np.load(os.path.join(day_dir, 'centroids.npy'))
+        self.list_offsets = np.load(os.path.join(day_dir, 'list_offsets.npy'))
+        self._row_by_article_id = None
+
+    @property
+    def dim(self):
+        return self.vectors.shape[1]
+
+    @property
+    def model_name(self):
+        return self.manifest.get('model')
+
+    def vector_for(self, article_id):
+        """기사 ID의 정규화된 임베딩을 반환합니다. 샤드에 없으면 None."""
+        if self._row_by_article_id is None:
+            self._row_by_article_id = {int(a): i for i, a in enumerate(self.article_ids)}
+        row = self._row_by_article_id.get(int(article_id))
+        return None if row is None else np.asarray(self.vectors[row])
+
+    def search(self, query, top_k, nprobe=DEFAULT_NPROBE):
+        """정규화된 질의 벡터와 가까운 기사를 [(article_id, similarity), ...]로 최대 top_k개 반환합니다."""
+        if not len(self.centroids) or top_k <= 0:
+            return []
+        probe_lists = np.argsort(-(self.centroids @ query))[:nprobe]
+        rows = np.concatenate([
+            np.arange(self.list_offsets[i], self.list_offsets[i + 1]) for i in probe_lists
+        ])
+        if not len(rows):
+            return []
+        similarities = np.asarray(self.vectors[rows]) @ query
+        best = np.argsort(-similarities)[:top_k]
+        return [(int(self.article_ids[rows[i]]), float(similarities[i])) for i in best]
+
+_vector_shards = {} # 날짜 문자열 -> (manifest 수정 시각, VectorShard)
+_vector_shards_lock = threading.Lock()
+
+def get_vector_shard(analysis_day, directory=None):
+    """날짜의 임베딩 샤드를 열어 반환합니다. 파일이 없으면 None. (분석 작업이 파일을 교체하면 다시 엶)"""
+    day_str = analysis_day.isoformat() if isinstance(analysis_day, date) else str(analysis_day)
+    day_dir = os.path.join(directory or VECTOR_INDEX_DIR, day_str)
+    try:
+        manifest_mtime = os.path.getmtime(os.path.join(day_dir, 'manifest.json'))
+    except OSError:
+        return None
+    with _vector_shards_lock:
+        cached = _vector_shards.get(day_str)
+        if cached is not None and cached[0] == manifest_mtime:
+            return cached[1]
+    try:
+        shard = VectorShard(day_dir)
+    except (OSError, ValueError):
+        return None # 분석 작업이 파일을 교체하는 중
+    with _vector_shards_lock:
+        _vector_shards[day_str] = (manifest_mtime, shard)
+    return shard
+
+def search_similar_articles(query, start_date, end_date, top_k, nprobe=DEFAULT_NPROBE, model_name=None):
+    """
+    기간(start_date ~ end_date)의 샤드에서 질의 벡터와 가까운 기사를 찾아
+    [(article_id, analysis_day, similarity), ...]를 유사도 내림차순으로 최대 top_k개 반환합니다.
+    샤드가 없거나 임베딩 차원이 다른 날짜, model_name이 주어졌을 때 다른 모델로 만든 샤드는 건너뜁니다.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    query = query / (np.linalg.norm(query) or 1.0)
+    candidates = []
+    for day in iter_days(start_date, end_date):
+        shard = get_vector_shard(day)
+        if shard is None or shard.dim != len(query):
+            continue
+        if model_name and shard.model_name and shard.model_name != model_name:
+            continue
+        candidates.extend((article_id, day, similarity) for article_id, similarity in shard.search(query, top_k, nprobe))
+    candidates.sort(key=lambda item: item[2], reverse=True)
+    return candidates[:top_k]
+
+class QueryEncoder:
+    """
+    검색어를 기사 임베딩과 같은 모델로 인코딩합니다.
+    모델은 프로세스에서 한 번만 로드하여 계속 재사용하고, 최근 검색어의 임베딩은 LRU로 보관합니다.
+    """
+    def __init__(self, model_name=EMBEDDING_MODEL_NAME, cache_size=QUERY_EMBEDDING_CACHE_SIZE):
+        self.model_name = model_name
+        self.cache_size = cache_size
+        self.load_time = None
+        self._model = None
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+
+    def _get_model(self):
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer # 모델을 쓰는 도구를 처음 호출할 때만 임포트
+                started = time.perf_counter()
+                model = SentenceTransformer(self.model_name)
+                model.encode([QUERY_WARMUP_TEXT], show_progress_bar=False) # 첫 검색의 초기화 비용을 미리 지불
+                self._model = model
+                self.load_time = round(time.perf_counter() - started, 3)
+            return self._model
+
+    def warm_up(self):
+        self._get_model()
+
+    def encode(self, text):
+        """검색어의 L2 정규화된 float32 임베딩을 반환합니다."""
+        with self._lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return cached
+        vector = np.asarray(self._get_model().encode([text], show_progress_bar=False)[0], dtype=np.float32)
+        vector = vector / (np.linalg.norm(vector) or 1.0)
+        with self._lock:
+            self._cache[text] = vector
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return vector
+
+query_encoder = QueryEncoder()
+
+def preprocess_query(query):
+    """
+    검색어를 기사 임베딩의 입력(분석기가 Okt로 전처리한 본문 토큰)과 같은 형태로 바꿉니다.
+    남는 토큰이 없으면 정제된 검색어를 그대로 사용합니다.
+    """
+    cleaned = clean_text(query)
+    return ' '.join(query_tokenizer.tokenize(cleaned)) or cleaned
+
+def encode_search_query(query):
+    """검색어를 전처리한 뒤 query_encoder로 인코딩합니다."""
+    return query_encoder.encode(preprocess_query(query))
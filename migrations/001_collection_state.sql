@@ -0,0 +1,11 @@
+-- 증분 수집을 위한 쿼리별 high-water mark 테이블과
+-- 저장된 24시간 이내 기사를 다시 읽기 위한 pub_date 인덱스
+
+CREATE TABLE IF NOT EXISTS collection_state (
+    search_query VARCHAR(100) PRIMARY KEY,
+    last_pub_date DATETIME NOT NULL,
+    last_link VARCHAR(512),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+ALTER TABLE news_articles ADD INDEX idx_news_articles_pub_date (pub_date);
@@ -0,0 +1,10 @@
+-- topic_results를 기사당 분석 실행당 한 행으로 제한
+-- 같은 날짜에 여러 번 실행한 이전 결과가 남아 있으면 유니크 키 추가가 실패합니다.
+-- 이 경우 이 파일 대신 정리 도구를 실행하세요. (이전 실행 결과를 삭제한 뒤 아래 유니크 키를 추가하므로 이 파일은 건너뜀)
+--   python mlnews/db_maintenance.py dedup-topic-results --dry-run
+--   python mlnews/db_maintenance.py dedup-topic-results
+-- 어느 쪽이든 004_partition_by_day.sql보다 먼저 적용해야 합니다. (004가 이 키를 파티션 컬럼을 포함하도록 다시 만듦)
+-- 정리 도구는 003 적용 여부에 맞는 컬럼으로 키를 만듭니다.
+
+ALTER TABLE topic_results
+    ADD UNIQUE KEY uq_topic_results_article_run (article_id, analysis_date);
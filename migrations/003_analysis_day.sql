@@ -0,0 +1,18 @@
+-- DATE(analysis_date) 필터를 인덱스를 탈 수 있는 조건으로 바꾸기 위한 생성 컬럼과 복합 인덱스
+-- 모든 조회 쿼리는 DATE(x.analysis_date) 대신 x.analysis_day를 사용합니다.
+-- README의 DDL은 analysis_date를 DATE로 만들지만 분석 작업은 실행 시각(datetime.now())을 저장하므로,
+-- 컬럼을 DATETIME으로 만든 DB에서는 analysis_date로 날짜 범위를 조회할 수 없습니다. (기존 쿼리가 DATE()를 쓴 이유)
+-- analysis_day는 두 경우 모두 "분석한 날"을 뜻하는 DATE 컬럼이며, 이후 파티션 키와 날짜별 테이블의 키로 사용합니다.
+-- 적용 후 `python mlnews/db_maintenance.py explain-queries`로 실행 계획을 확인하세요.
+
+ALTER TABLE news_articles
+    ADD COLUMN analysis_day DATE AS (DATE(analysis_date)) STORED,
+    ADD INDEX idx_news_articles_day_pub (analysis_day, pub_date);
+
+ALTER TABLE topic_results
+    ADD COLUMN analysis_day DATE AS (DATE(analysis_date)) STORED,
+    ADD INDEX idx_topic_results_day_topic (analysis_day, topic_id, probability);
+
+ALTER TABLE topic_info
+    ADD COLUMN analysis_day DATE AS (DATE(analysis_date)) STORED,
+    ADD INDEX idx_topic_info_day_topic (analysis_day, topic_id, topic_count);
@@ -0,0 +1,51 @@
+-- news_articles, topic_results를 분석 날짜(analysis_day) 기준 일 단위 RANGE 파티션으로 전환
+-- 보존 기간 정리를 행 단위 DELETE 대신 DROP PARTITION으로 처리하고, 날짜 조건 조회가 해당 파티션만 읽도록 하기 위함
+--
+-- 파티션 테이블 제약 사항에 따른 변경:
+--   * 외래 키를 사용할 수 없으므로 topic_results -> news_articles 외래 키를 제거 (무결성은 분석 작업의 트랜잭션이 보장)
+--   * 모든 PRIMARY/UNIQUE 키에 파티션 컬럼이 포함되어야 하므로 analysis_day를 추가
+--     (news_articles의 link 유니크 키는 (link, analysis_day)가 되어 같은 기사가 분석 날짜마다 한 행씩 저장됨)
+--
+-- 적용 후 `python mlnews/db_maintenance.py add-partitions --days-ahead 7`을 실행하면
+-- 기존 데이터가 날짜별 파티션(pYYYYMMDD)으로 나뉘고 앞으로 사용할 파티션이 만들어집니다. (이후 매일 실행 권장)
+-- 테이블 전체를 재작성하므로 데이터가 많으면 점검 시간에 적용하세요.
+
+-- 외래 키 이름은 생성 방식에 따라 다를 수 있으므로 (자동 이름 topic_results_ibfk_N 또는 직접 지정한 이름)
+-- information_schema에서 topic_results -> news_articles 외래 키를 찾아 삭제 (없으면 건너뜀)
+SET @fk_name = (
+    SELECT CONSTRAINT_NAME
+    FROM information_schema.REFERENTIAL_CONSTRAINTS
+    WHERE CONSTRAINT_SCHEMA = DATABASE()
+      AND TABLE_NAME = 'topic_results'
+      AND REFERENCED_TABLE_NAME = 'news_articles'
+    LIMIT 1
+);
+SET @drop_fk_sql = IF(
+    @fk_name IS NULL,
+    'DO 0',
+    CONCAT('ALTER TABLE topic_results DROP FOREIGN KEY `', REPLACE(@fk_name, '`', '``'), '`')
+);
+PREPARE drop_fk_stmt FROM @drop_fk_sql;
+EXECUTE drop_fk_stmt;
+DEALLOCATE PREPARE drop_fk_stmt;
+
+ALTER TABLE news_articles
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (id, analysis_day),
+    DROP INDEX link,
+    ADD UNIQUE KEY uq_news_articles_link_day (link, analysis_day);
+
+ALTER TABLE topic_results
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (id, analysis_day),
+    DROP INDEX uq_topic_results_article_run,
+    ADD UNIQUE KEY uq_topic_results_article_run (article_id, analysis_date, analysis_day),
+    ADD INDEX idx_topic_results_article (article_id);
+
+ALTER TABLE news_articles PARTITION BY RANGE COLUMNS (analysis_day) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
+
+ALTER TABLE topic_results PARTITION BY RANGE COLUMNS (analysis_day) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
@@ -0,0 +1,26 @@
+-- 기사 본문(LONGTEXT)을 news_articles에서 news_article_bodies로 분리
+-- 대시보드/MCP 서버의 목록 조회가 본문 페이지까지 버퍼 풀로 읽어 들이지 않도록 하기 위함
+-- description과 original_text는 같은 값(네이버 API의 description)이므로 original_text 하나만 옮기고 둘 다 삭제합니다.
+-- 압축 행 포맷을 쓰지 않으려면 ROW_FORMAT, KEY_BLOCK_SIZE를 제거하세요. (innodb_file_per_table 필요)
+-- 적용 후 `python mlnews/db_maintenance.py add-partitions`로 news_article_bodies의 날짜 파티션을 만드세요.
+
+CREATE TABLE news_article_bodies (
+    article_id INT NOT NULL,
+    analysis_day DATE NOT NULL,
+    original_text MEDIUMTEXT,
+    processed_text MEDIUMTEXT,
+    PRIMARY KEY (article_id, analysis_day)
+)
+ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8
+PARTITION BY RANGE COLUMNS (analysis_day) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
+
+INSERT INTO news_article_bodies (article_id, analysis_day, original_text, processed_text)
+SELECT id, analysis_day, COALESCE(original_text, description), processed_text
+FROM news_articles;
+
+ALTER TABLE news_articles
+    DROP COLUMN description,
+    DROP COLUMN original_text,
+    DROP COLUMN processed_text;
@@ -0,0 +1,17 @@
+-- 키워드 검색용 역색인 테이블 (LIKE '%키워드%' 전체 스캔 대체)
+-- news_articles 등이 날짜 파티션 테이블이라 FULLTEXT 인덱스를 쓸 수 없으므로,
+-- 분석 작업이 Okt 토큰(본문 + 제목)으로 (토큰, 기사 ID, 빈도)를 저장하고 MCP 서버가 TF-IDF 점수로 순위를 매깁니다.
+-- 적용 후 아래 명령으로 날짜 파티션을 만들고 기존 날짜의 색인을 저장된 본문으로 채우세요.
+--   python mlnews/db_maintenance.py add-partitions
+--   python mlnews/db_maintenance.py build-article-terms --days 90
+
+CREATE TABLE article_terms (
+    analysis_day DATE NOT NULL,
+    term VARCHAR(100) NOT NULL,
+    article_id INT NOT NULL,
+    tf SMALLINT UNSIGNED NOT NULL,
+    PRIMARY KEY (term, analysis_day, article_id)
+)
+PARTITION BY RANGE COLUMNS (analysis_day) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
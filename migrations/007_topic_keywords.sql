@@ -0,0 +1,15 @@
+-- 토픽별 상위 키워드 빈도를 분석 시점에 미리 계산하여 저장
+-- get_topic_keyword_frequency가 토픽의 모든 기사 본문을 읽어 단어를 세는 대신 이 테이블만 인덱스로 읽습니다.
+-- 이 마이그레이션 이전에 분석된 날짜는 기존 방식(저장된 본문)으로 계산됩니다.
+
+ALTER TABLE topic_info
+    ADD COLUMN article_count INT AFTER topic_count;
+
+CREATE TABLE topic_keywords (
+    analysis_day DATE NOT NULL,
+    topic_id INT NOT NULL,
+    keyword_rank SMALLINT NOT NULL,
+    keyword VARCHAR(100) NOT NULL,
+    frequency INT NOT NULL,
+    PRIMARY KEY (analysis_day, topic_id, keyword_rank)
+);
@@ -0,0 +1,26 @@
+-- 날짜 x 토픽 집계 테이블 (기사 수, 평균 확률, 대표 키워드)
+-- 분석 작업이 실행 끝에 해당 날짜의 행을 교체하며, 트렌드 차트와 get_topic_trends는 이 테이블만 읽습니다.
+-- 아래 INSERT ... SELECT로 기존 날짜의 집계를 한 번 채웁니다.
+
+CREATE TABLE topic_daily_rollup (
+    analysis_day DATE NOT NULL,
+    topic_id INT NOT NULL,
+    topic_name VARCHAR(255),
+    article_count INT NOT NULL,
+    mean_probability DOUBLE,
+    top_keywords JSON,
+    PRIMARY KEY (analysis_day, topic_id),
+    INDEX idx_topic_daily_rollup_day_count (analysis_day, article_count)
+);
+
+INSERT INTO topic_daily_rollup (analysis_day, topic_id, topic_name, article_count, mean_probability, top_keywords)
+SELECT
+    tr.analysis_day,
+    tr.topic_id,
+    ANY_VALUE(ti.topic_name),
+    COUNT(*),
+    AVG(tr.probability),
+    ANY_VALUE(ti.representation)
+FROM topic_results tr
+LEFT JOIN topic_info ti ON ti.analysis_day = tr.analysis_day AND ti.topic_id = tr.topic_id
+GROUP BY tr.analysis_day, tr.topic_id;
@@ -0,0 +1,27 @@
+-- 날짜 간 토픽 연결 테이블 (토픽 ID는 분석 날짜마다 새로 매겨지므로 같은 토픽을 추적할 전역 ID를 둠)
+-- 분석 작업이 실행 끝에 오늘의 토픽을 최근 전역 토픽과 비교해 연결하고, 연결되지 않은 토픽은 새 전역 토픽으로 등록합니다.
+-- 기존 날짜의 topic_daily_rollup 행은 global_topic_id가 NULL로 남습니다. (임베딩이 없어 소급 연결하지 않음)
+
+CREATE TABLE global_topics (
+    global_topic_id INT AUTO_INCREMENT PRIMARY KEY,
+    label VARCHAR(255),
+    first_seen DATE NOT NULL,
+    last_seen DATE NOT NULL,
+    centroid MEDIUMBLOB NOT NULL,
+    keywords JSON,
+    INDEX idx_global_topics_last_seen (last_seen),
+    INDEX idx_global_topics_first_seen (first_seen)
+);
+
+CREATE TABLE topic_lineage (
+    analysis_day DATE NOT NULL,
+    topic_id INT NOT NULL,
+    global_topic_id INT NOT NULL,
+    similarity DOUBLE NOT NULL,
+    PRIMARY KEY (analysis_day, topic_id),
+    INDEX idx_topic_lineage_global_day (global_topic_id, analysis_day)
+);
+
+ALTER TABLE topic_daily_rollup
+    ADD COLUMN global_topic_id INT AFTER topic_id,
+    ADD INDEX idx_topic_daily_rollup_global (global_topic_id, analysis_day);
@@ -0,0 +1,11 @@
+-- 토픽별 최신 기사 조회(get_latest_news_by_topic)를 위해 topic_results에 기사 발행 시각을 함께 저장합니다.
+-- (analysis_day, topic_id, pub_date) 인덱스를 역순으로 읽어 news_articles를 정렬하지 않고 최신 기사 N개를 찾습니다.
+-- 아래 UPDATE로 기존 행의 pub_date를 news_articles에서 한 번 채웁니다.
+
+ALTER TABLE topic_results
+    ADD COLUMN pub_date DATETIME AFTER analysis_date,
+    ADD INDEX idx_topic_results_day_topic_pub (analysis_day, topic_id, pub_date);
+
+UPDATE topic_results tr
+JOIN news_articles na ON na.id = tr.article_id AND na.analysis_day = tr.analysis_day
+SET tr.pub_date = na.pub_date;
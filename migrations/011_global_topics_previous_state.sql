@@ -0,0 +1,10 @@
+-- 전역 토픽에 오늘 반영하기 전의 상태를 함께 저장
+-- 같은 날짜를 다시 분석하면 분석 작업이 이 상태로 되돌린 뒤 다시 연결하므로,
+-- 중심 임베딩 이동 평균이 하루에 한 번만 적용되고 그 날짜에 새로 만든 전역 토픽의 ID도 유지됩니다.
+-- 기존 행은 NULL로 남으며 다음 분석 날짜에 연결될 때부터 채워집니다.
+
+ALTER TABLE global_topics
+    ADD COLUMN previous_label VARCHAR(255) AFTER keywords,
+    ADD COLUMN previous_last_seen DATE AFTER previous_label,
+    ADD COLUMN previous_centroid MEDIUMBLOB AFTER previous_last_seen,
+    ADD COLUMN previous_keywords JSON AFTER previous_centroid;
@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+뉴스 분석 DB 유지보수 도구
+daily_news_analyzer.py가 쌓은 데이터를 정리하는 일회성/주기성 작업을 모아 둔 스크립트
+
+사용 예:
+    python db_maintenance.py dedup-topic-results --dry-run
+    python db_maintenance.py dedup-topic-results
+    python db_maintenance.py explain-queries
+    python db_maintenance.py add-partitions --days-ahead 7
+    python db_maintenance.py retention --keep-days 90 --export-dir ./archive --dry-run
+    python db_maintenance.py build-article-terms --days 30
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import pymysql
+
+# MySQL 데이터베이스 설정 (daily_news_analyzer.py와 동일하게 설정)
+MYSQL_HOST = "localhost"
+MYSQL_USER = "root"
+MYSQL_PASSWORD = "mysql@24!"
+MYSQL_DB = "news_analysis_db"
+
+TOPIC_RESULTS_UNIQUE_KEY = "uq_topic_results_article_run"
+
+# 분석 날짜(analysis_day) 기준 일 단위 RANGE 파티션이 걸린 테이블 (schema.sql, migrations/004 참고)
+PARTITIONED_TABLES = ("news_articles", "news_article_bodies", "topic_results", "article_terms")
+PARTITION_NAME_FORMAT = "p%Y%m%d" # 파티션 p20240101에는 analysis_day = 2024-01-01 행이 저장됨
+MAX_PARTITION_NAME = "pmax"
+# 파티션 없이 analysis_day 컬럼으로 보존 기간을 정리하는 테이블
+UNPARTITIONED_DAY_TABLES = ("topic_info", "topic_keywords", "topic_daily_rollup", "topic_lineage")
+
+# daily_news_analyzer.py가 저장하는 분석 날짜별 역색인/임베딩 샤드 파일 (보존 기간 정리 대상)
+# 분석기와 같은 NEWS_INDEX_DIR 환경 변수를 사용 (기본값: mlnews/cache)
+NEWS_INDEX_DIR = os.environ.get('NEWS_INDEX_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache'))
+POSTINGS_INDEX_DIR = os.path.join(NEWS_INDEX_DIR, 'postings')
+VECTOR_INDEX_DIR = os.path.join(NEWS_INDEX_DIR, 'vectors')
+
+def get_db_connection():
+    """MySQL 데이터베이스 연결을 반환합니다. (자동 커밋 끔)"""
+    return pymysql.connect(
+        host=MYSQL_HOST,
+        user=MYSQL_USER,
+        password=MYSQL_PASSWORD,
+        db=MYSQL_DB,
+        charset='utf8mb4',
+        cursorclass=pymysql.cursors.DictCursor,
+        autocommit=False
+    )
+
+def index_exists(cursor, table_name, index_name):
+    cursor.execute("""
+    SELECT 1 FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+    LIMIT 1;
+    """, (table_name, index_name))
+    return cursor.fetchone() is not None
+
+# --- topic_results 중복 정리 ---
+# analysis_date는 DATE 컬럼이라 같은 날짜의 여러 실행을 구분할 수 없으므로 행 ID(AUTO_INCREMENT) 순서로 실행을 구분합니다.
+# (각 실행은 기사당 한 행씩 연속으로 저장하고, 기사 ID는 link 기준으로 실행 간에 같음)
+# 1) 날짜별로 나중 실행에 같은 기사의 행이 있는(= 대체된) 행 중 가장 큰 ID까지가 이전 실행이므로,
+#    그 ID 이하의 행을 모두 삭제하여 그 날짜의 마지막 실행 결과만 남김
+#    (토픽 ID는 실행마다 다시 매겨지므로 이전 실행의 할당은 의미가 없음)
+STALE_TOPIC_RESULTS_SQL = """
+FROM topic_results tr
+JOIN (
+    SELECT older.analysis_date, MAX(older.id) AS last_superseded_id
+    FROM topic_results older
+    JOIN topic_results newer
+        ON newer.article_id = older.article_id AND newer.analysis_date = older.analysis_date AND newer.id > older.id
+    GROUP BY older.analysis_date
+) previous_runs ON tr.analysis_date = previous_runs.analysis_date AND tr.id <= previous_runs.last_superseded_id
+"""
+# 2) topic_info는 (analysis_date, topic_id) 유니크 키로 실행마다 덮어써졌으므로, 마지막 실행보다 토픽 수가 많았던
+#    이전 실행의 토픽(남은 토픽 할당 결과의 최대 토픽 ID보다 큰 ID)만 삭제
+#    (1번 단계 뒤에 실행해야 남은 결과가 마지막 실행의 결과임)
+STALE_TOPIC_INFO_SQL = """
+FROM topic_info ti
+JOIN (
+    SELECT analysis_date, MAX(topic_id) AS max_topic_id
+    FROM topic_results
+    GROUP BY analysis_date
+) latest ON ti.analysis_date = latest.analysis_date AND ti.topic_id > latest.max_topic_id
+"""
+
+def column_exists(cursor, table_name, column_name):
+    cursor.execute("""
+    SELECT 1 FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    LIMIT 1;
+    """, (table_name, column_name))
+    return cursor.fetchone() is not None
+
+def dedup_topic_results(dry_run=False):
+    """
+    이전 실행의 topic_results·topic_info 행을 삭제하고, 테이블을 최적화한 뒤
+    기사당 분석 날짜당 한 행만 허용하는 유니크 키를 추가합니다. (migrations/002를 대신함)
+    유니크 키 컬럼은 현재 스키마에 맞춥니다. (migrations/003 적용 전이면 (article_id, analysis_date),
+    적용 후면 파티션 컬럼을 포함한 (article_id, analysis_date, analysis_day))
+    """
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            steps = [
+                ("이전 실행의 토픽 할당 결과", "tr", STALE_TOPIC_RESULTS_SQL),
+                ("이전 실행의 토픽 정보", "ti", STALE_TOPIC_INFO_SQL),
+            ]
+            for label, alias, from_sql in steps:
+                if dry_run:
+                    # 토픽 정보 건수는 1번 단계 삭제 전 기준이므로 실제 삭제 건수보다 적을 수 있음
+                    cursor.execute(f"SELECT COUNT(*) AS cnt {from_sql};")
+                    print(f"[dry-run] 삭제 대상 {label}: {cursor.fetchone()['cnt']}건")
+                else:
+                    started = time.perf_counter()
+                    cursor.execute(f"DELETE {alias} {from_sql};")
+                    print(f"{label} {cursor.rowcount}건 삭제 ({time.perf_counter() - started:.1f}초)")
+            if dry_run:
+                conn.rollback()
+                return
+            conn.commit()
+
+            # 삭제로 생긴 빈 공간 회수 (InnoDB는 테이블 재구성)
+            print("topic_results, topic_info 테이블 최적화 중...")
+            cursor.execute("OPTIMIZE TABLE topic_results, topic_info;")
+            cursor.fetchall()
+
+            if index_exists(cursor, 'topic_results', TOPIC_RESULTS_UNIQUE_KEY):
+                print(f"유니크 키 {TOPIC_RESULTS_UNIQUE_KEY}가 이미 존재합니다.")
+            else:
+                # migrations/004 이후 파티션 테이블의 유니크 키는 파티션 컬럼(analysis_day)을 포함해야 함
+                if column_exists(cursor, 'topic_results', 'analysis_day'):
+                    key_columns = "article_id, analysis_date, analysis_day"
+                else:
+                    key_columns = "article_id, analysis_date"
+                cursor.execute(f"ALTER TABLE topic_results ADD UNIQUE KEY {TOPIC_RESULTS_UNIQUE_KEY} ({key_columns});")
+                print(f"유니크 키 {TOPIC_RESULTS_UNIQUE_KEY} ({key_columns}) 추가 완료.")
+    except pymysql.Error as e:
+        conn.rollback()
+        print(f"topic_results 정리 중 오류 발생: {e}", file=sys.stderr)
+        raise
+    finally:
+        conn.close()
+
+# --- 조회 쿼리 실행 계획 점검 ---
+# 대시보드, MCP 서버의 조회 경로와 같은 모양의 쿼리 (analysis_day 기준 조건이 인덱스를 타는지 확인)
+READ_PATH_QUERIES = {
+    "analysis_dates": (
+        "SELECT DISTINCT analysis_day AS analysis_date FROM news_articles ORDER BY analysis_day DESC LIMIT 30",
+        lambda start, end: ()
+    ),
+    "articles_and_topics_by_date_range": (
+        """
+        SELECT na.analysis_day, na.title, na.link, na.pub_date, tr.topic_id, tr.probability, ti.topic_name
+        FROM news_articles na
+        JOIN topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
+        LEFT JOIN topic_info ti ON ti.analysis_day = na.analysis_day AND ti.topic_id = tr.topic_id
+        WHERE na.analysis_day BETWEEN %s AND %s
+        """,
+        lambda start, end: (start, end)
+    ),
+    "news_analysis_data": (
+        """
+        SELECT na.id, na.title, na.pub_date, tr.topic_id, ti.topic_name
+        FROM news_articles na
+        LEFT JOIN topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
+        LEFT JOIN topic_info ti ON ti.analysis_day = tr.analysis_day AND ti.topic_id = tr.topic_id
+        WHERE na.analysis_day BETWEEN %s AND %s
+        ORDER BY na.pub_date DESC, na.id DESC LIMIT 51
+        """,
+        lambda start, end: (start, end)
+    ),
+    "news_analysis_data_next_page": (
+        """
+        SELECT na.id, na.title, na.pub_date, tr.topic_id, ti.topic_name
+        FROM news_articles na
+        LEFT JOIN topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
+        LEFT JOIN topic_info ti ON ti.analysis_day = tr.analysis_day AND ti.topic_id = tr.topic_id
+        WHERE na.analysis_day BETWEEN %s AND %s
+            AND (na.pub_date < %s OR (na.pub_date = %s AND na.id < %s))
+        ORDER BY na.pub_date DESC, na.id DESC LIMIT 51
+        """,
+        lambda start, end: (start, end, f"{end} 12:00:00", f"{end} 12:00:00", 2**31 - 1)
+    ),
+    "topic_info_by_day": (
+        "SELECT topic_name, representation, topic_count FROM topic_info WHERE analysis_day = %s AND topic_id = %s",
+        lambda start, end: (end, 0)
+    ),
+    "topic_keywords_by_day": (
+        """
+        SELECT ti.topic_name, ti.topic_count, ti.article_count, tk.keyword, tk.frequency
+        FROM topic_info ti
+        LEFT JOIN topic_keywords tk ON tk.analysis_day = ti.analysis_day AND tk.topic_id = ti.topic_id
+        WHERE ti.analysis_day = %s AND ti.topic_id = %s
+        ORDER BY tk.keyword_rank
+        """,
+        lambda start, end: (end, 0)
+    ),
+    "topic_articles_by_day": (
+        """
+        SELECT nb.processed_text, tr.probability
+        FROM topic_results tr
+        JOIN news_article_bodies nb ON nb.article_id = tr.article_id AND nb.analysis_day = tr.analysis_day
+        WHERE tr.analysis_day = %s AND tr.topic_id = %s
+        ORDER BY tr.probability DESC
+        """,
+        lambda start, end: (end, 0)
+    ),
+    "keyword_search_postings": (
+        """
+        SELECT at.term, at.analysis_day, at.article_id, at.tf
+        FROM article_terms at
+        WHERE at.term IN (%s) AND at.analysis_day BETWEEN %s AND %s
+        """,
+        lambda start, end: ('경제', start, end)
+    ),
+    "article_content": (
+        """
+        SELECT na.id, na.analysis_day, na.title, na.link, na.pub_date, nb.original_text
+        FROM news_articles na
+        LEFT JOIN news_article_bodies nb ON nb.article_id = na.id AND nb.analysis_day = na.analysis_day
+        WHERE na.id = %s
+        """,
+        lambda start, end: (1,)
+    ),
+    "latest_news_by_topic": (
+        """
+        SELECT tr.article_id, tr.pub_date, tr.probability, na.title, na.link
+        FROM topic_results tr
+        JOIN news_articles na ON na.id = tr.article_id AND na.analysis_day = tr.analysis_day
+        WHERE tr.analysis_day = %s AND tr.topic_id = %s
+        ORDER BY tr.pub_date DESC
+        LIMIT 10
+        """,
+        lambda start, end: (end, 0)
+    ),
+    "topic_trends": (
+        """
+        SELECT r.analysis_day AS date, r.topic_id, r.topic_name, r.article_count, r.mean_probability
+        FROM topic_daily_rollup r
+        WHERE r.analysis_day BETWEEN %s AND %s AND r.article_count >= 10
+        ORDER BY r.analysis_day DESC, r.article_count DESC
+        """,
+        lambda start, end: (start, end)
+    ),
+    "global_topic_trend": (
+        """
+        SELECT r.analysis_day AS date, r.topic_id, r.article_count, r.mean_probability
+        FROM topic_daily_rollup r
+        WHERE r.global_topic_id = %s AND r.analysis_day BETWEEN %s AND %s
+        ORDER BY r.analysis_day
+        """,
+        lambda start, end: (1, start, end)
+    ),
+}
+
+def explain_queries(days=7):
+    """
+    조회 경로 쿼리마다 EXPLAIN을 실행하여 전체 테이블 스캔(type=ALL)이나 인덱스 미사용을 찾아 출력합니다.
+    문제가 있는 쿼리가 하나라도 있으면 False를 반환합니다. (스키마 변경 후 회귀 점검용)
+    """
+    end = date.today()
+    start = end - timedelta(days=days - 1)
+    conn = get_db_connection()
+    all_ok = True
+    try:
+        with conn.cursor() as cursor:
+            for name, (sql, make_params) in READ_PATH_QUERIES.items():
+                cursor.execute("EXPLAIN " + sql, make_params(start, end))
+                problems = []
+                for row in cursor.fetchall():
+                    if row.get('table') is None or str(row['table']).startswith('<'):
+                        continue # 파생 테이블 등 내부 단계는 제외
+                    if row['type'] == 'ALL' or row['key'] is None:
+                        problems.append(f"{row['table']}: type={row['type']}, key={row['key']}, rows={row['rows']}")
+                if problems:
+                    all_ok = False
+                    print(f"[FAIL] {name}")
+                    for problem in problems:
+                        print(f"       {problem}")
+                else:
+                    print(f"[OK]   {name}")
+    finally:
+        conn.close()
+    return all_ok
+
+# --- 날짜 파티션 관리 ---
+def partition_name_for_day(day):
+    return day.strftime(PARTITION_NAME_FORMAT)
+
+def day_for_partition_name(name):
+    """파티션 이름을 날짜로 변환합니다. (pmax 등 날짜 파티션이 아니면 None)"""
+    try:
+        return datetime.strptime(name, PARTITION_NAME_FORMAT).date()
+    except ValueError:
+        return None
+
+def list_day_partitions(cursor, table_name):
+    """테이블의 날짜 파티션을 [(파티션 이름, 날짜, 행 수 추정치), ...]로 날짜 순 반환합니다."""
+    cursor.execute("""
+    SELECT PARTITION_NAME, TABLE_ROWS FROM information_schema.PARTITIONS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL
+    ORDER BY PARTITION_ORDINAL_POSITION;
+    """, (table_name,))
+    partitions = []
+    for row in cursor.fetchall():
+        day = day_for_partition_name(row['PARTITION_NAME'])
+        if day is not None:
+            partitions.append((row['PARTITION_NAME'], day, row['TABLE_ROWS']))
+    return partitions
+
+def add_partitions(days_ahead=7):
+    """
+    오늘부터 days_ahead일 뒤까지 일 단위 파티션이 있도록 pmax 파티션을 재구성합니다.
+    분석 작업이 새 날짜 행을 pmax에 쌓지 않도록 주기적으로(예: 매일 cron) 실행합니다.
+    """
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            for table_name in PARTITIONED_TABLES:
+                existing = list_day_partitions(cursor, table_name)
+                if existing:
+                    first_new_day = existing[-1][1] + timedelta(days=1)
+                else:
+                    # 마이그레이션 직후 (pmax 하나뿐): 저장된 가장 오래된 기사 날짜부터 일 단위로 나눔
+                    # (새로 만든 빈 테이블도 이후 채워질 과거 날짜가 각자의 파티션에 들어가도록 news_articles 기준)
+                    cursor.execute("SELECT MIN(analysis_day) AS min_day FROM news_articles;")
+                    first_new_day = cursor.fetchone()['min_day'] or date.today()
+                target_day = date.today() + timedelta(days=days_ahead)
+                new_days = []
+                day = first_new_day
+                while day <= target_day:
+                    new_days.append(day)
+                    day += timedelta(days=1)
+                if not new_days:
+                    print(f"{table_name}: {target_day}까지 파티션이 이미 있습니다.")
+                    continue
+                # 파티션 p<날짜>는 analysis_day < 다음 날 인 행을 저장
+                definitions = [
+                    f"PARTITION {partition_name_for_day(d)} VALUES LESS THAN ('{(d + timedelta(days=1)).isoformat()}')"
+                    for d in new_days
+                ]
+                definitions.append(f"PARTITION {MAX_PARTITION_NAME} VALUES LESS THAN (MAXVALUE)")
+                cursor.execute(
+                    f"ALTER TABLE {table_name} REORGANIZE PARTITION {MAX_PARTITION_NAME} INTO ({', '.join(definitions)});"
+                )
+                print(f"{table_name}: 파티션 {len(new_days)}개 추가 ({new_days[0]} ~ {new_days[-1]})")
+    except pymysql.Error as e:
+        print(f"파티션 추가 중 오류 발생: {e}", file=sys.stderr)
+        raise
+    finally:
+        conn.close()
+
+def export_partition(cursor, table_name, partition_name, export_dir):
+    """파티션의 모든 행을 JSON Lines 파일로 내보내고 (파일 경로, 행 수)를 반환합니다."""
+    os.makedirs(export_dir, exist_ok=True)
+    export_path = os.path.join(export_dir, f"{table_name}.{partition_name}.jsonl")
+    row_count = 0
+    cursor.execute(f"SELECT * FROM {table_name} PARTITION ({partition_name});")
+    with open(export_path, 'w', encoding='utf-8') as f:
+        for row in cursor.fetchall():
+            f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+            row_count += 1
+    return export_path, row_count
+
+def remove_expired_day_directories(directory, cutoff_day):
+    """<directory>/<YYYY-MM-DD>/ 형태의 날짜별 파일 중 cutoff_day 이전 날짜를 삭제합니다."""
+    if not os.path.isdir(directory):
+        return
+    for name in sorted(os.listdir(directory)):
+        try:
+            day = datetime.strptime(name, '%Y-%m-%d').date()
+        except ValueError:
+            continue
+        if day < cutoff_day:
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+            print(f"{os.path.join(directory, name)} 삭제")
+
+def apply_retention(keep_days, export_dir=None, dry_run=False):
+    """
+    오늘 기준 keep_days일보다 오래된 날짜 파티션을 (선택적으로 내보낸 뒤) DROP PARTITION으로 삭제합니다.
+    행 단위 DELETE와 달리 파티션 삭제는 메타데이터 작업이라 테이블 크기와 무관하게 빠름.
+    파티션이 없는 UNPARTITIONED_DAY_TABLES는 같은 기준으로 행을 삭제하고,
+    기준일 이후 한 번도 연결되지 않은 전역 토픽(global_topics.last_seen)도 삭제합니다.
+    """
+    cutoff_day = date.today() - timedelta(days=keep_days)
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            # 나머지 테이블이 news_articles를 참조하므로 news_articles를 마지막에 처리
+            for table_name in reversed(PARTITIONED_TABLES):
+                expired = [p for p in list_day_partitions(cursor, table_name) if p[1] < cutoff_day]
+                if not expired:
+                    print(f"{table_name}: {cutoff_day} 이전 파티션이 없습니다.")
+                    continue
+                for partition_name, day, estimated_rows in expired:
+                    if dry_run:
+                        print(f"[dry-run] {table_name}.{partition_name} ({day}, 약 {estimated_rows}행) 삭제 대상")
+                        continue
+                    if export_dir:
+                        export_path, row_count = export_partition(cursor, table_name, partition_name, export_dir)
+                        print(f"{table_name}.{partition_name}: {row_count}행을 {export_path}로 내보냄")
+                    started = time.perf_counter()
+                    cursor.execute(f"ALTER TABLE {table_name} DROP PARTITION {partition_name};")
+                    print(f"{table_name}.{partition_name} 삭제 ({time.perf_counter() - started:.2f}초)")
+
+            if dry_run:
+                for table_name in UNPARTITIONED_DAY_TABLES:
+                    cursor.execute(f"SELECT COUNT(*) AS cnt FROM {table_name} WHERE analysis_day < %s;", (cutoff_day,))
+                    print(f"[dry-run] 삭제 대상 {table_name}: {cursor.fetchone()['cnt']}건")
+                cursor.execute("SELECT COUNT(*) AS cnt FROM global_topics WHERE last_seen < %s;", (cutoff_day,))
+                print(f"[dry-run] 삭제 대상 global_topics: {cursor.fetchone()['cnt']}건")
+                conn.rollback()
+                return
+            for table_name in UNPARTITIONED_DAY_TABLES:
+                cursor.execute(f"DELETE FROM {table_name} WHERE analysis_day < %s;", (cutoff_day,))
+                print(f"{table_name} {cursor.rowcount}건 삭제")
+            cursor.execute("DELETE FROM global_topics WHERE last_seen < %s;", (cutoff_day,))
+            print(f"global_topics {cursor.rowcount}건 삭제")
+            conn.commit()
+
+        remove_expired_day_directories(POSTINGS_INDEX_DIR, cutoff_day)
+        remove_expired_day_directories(VECTOR_INDEX_DIR, cutoff_day)
+    except pymysql.Error as e:
+        conn.rollback()
+        print(f"보존 기간 정리 중 오류 발생: {e}", file=sys.stderr)
+        raise
+    finally:
+        conn.close()
+
+# --- 키워드 검색 색인 재구성 ---
+WRITE_BATCH_SIZE = 500
+ARTICLE_TERM_MAX_LENGTH = 100 # daily_news_analyzer.py와 동일하게 설정
+
+def extract_alpha_terms(text):
+    """daily_news_analyzer.extract_alpha_terms와 같은 영문 토큰 (clean_text처럼 태그와 기호를 지운 뒤 소문자로)"""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'[^가-힣a-zA-Z\s]', '', text)
+    return [term.lower() for term in re.findall(r'[A-Za-z]{2,}', text)]
+
+def is_day_indexed(cursor, day):
+    """분석 작업이 색인을 저장한 날짜인지 (역색인 파일의 manifest.json 또는 article_terms 행이 있는지) 확인합니다."""
+    if os.path.exists(os.path.join(POSTINGS_INDEX_DIR, day.isoformat(), 'manifest.json')):
+        return True
+    cursor.execute("SELECT 1 FROM article_terms WHERE analysis_day = %s LIMIT 1;", (day,))
+    return cursor.fetchone() is not None
+
+def build_article_terms(days=30, force=False):
+    """
+    최근 days일 중 색인이 없는 날짜의 article_terms를 news_article_bodies.processed_text와 제목/원문의 영문 토큰으로 만듭니다.
+    (색인 도입 이전에 저장된 날짜용. 제목의 한국어 토큰은 형태소 분석기가 필요하므로 분석 작업이 저장한 색인에만 포함됨)
+    분석 작업이 이미 색인한 날짜(article_terms 행 또는 역색인 파일이 있는 날짜)는 제목 토큰이 빠진 색인으로 덮어쓰면
+    역색인 파일과 DB 색인의 검색 결과가 달라지므로 건너뜁니다. force=True이면 모든 날짜를 다시 만듭니다.
+    """
+    end = date.today()
+    start = end - timedelta(days=days - 1)
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            day = start
+            while day <= end:
+                if not force and is_day_indexed(cursor, day):
+                    print(f"{day}: 이미 색인된 날짜이므로 건너뜀 (다시 만들려면 --force)")
+                    day += timedelta(days=1)
+                    continue
+                cursor.execute("""
+                SELECT nb.article_id, nb.processed_text, nb.original_text, na.title
+                FROM news_article_bodies nb
+                JOIN news_articles na ON na.id = nb.article_id AND na.analysis_day = nb.analysis_day
+                WHERE nb.analysis_day = %s;
+                """, (day,))
+                rows = []
+                for body in cursor.fetchall():
+                    term_frequency = {}
+                    alpha_terms = extract_alpha_terms(f"{body['title']} {body['original_text'] or ''}")
+                    for term in (body['processed_text'] or '').split() + alpha_terms:
+                        if len(term) <= ARTICLE_TERM_MAX_LENGTH:
+                            term_frequency[term] = term_frequency.get(term, 0) + 1
+                    rows.extend((day, term, body['article_id'], tf) for term, tf in term_frequency.items())
+                if rows:
+                    cursor.execute("DELETE FROM article_terms WHERE analysis_day = %s;", (day,))
+                    for i in range(0, len(rows), WRITE_BATCH_SIZE):
+                        cursor.executemany(
+                            "INSERT INTO article_terms (analysis_day, term, article_id, tf) VALUES (%s, %s, %s, %s);",
+                            rows[i:i + WRITE_BATCH_SIZE]
+                        )
+                    conn.commit()
+                    print(f"{day}: 검색 색인 {len(rows)}건 저장")
+                day += timedelta(days=1)
+    except pymysql.Error as e:
+        conn.rollback()
+        print(f"검색 색인 재구성 중 오류 발생: {e}", file=sys.stderr)
+        raise
+    finally:
+        conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 분석 DB 유지보수 도구")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    dedup_parser = subparsers.add_parser('dedup-topic-results', help="이전 실행의 토픽 할당 결과를 정리하고 유니크 키를 추가합니다. (migrations/002 대신 실행)")
+    dedup_parser.add_argument('--dry-run', action='store_true', help="삭제하지 않고 삭제 대상 건수만 출력")
+
+    explain_parser = subparsers.add_parser('explain-queries', help="조회 쿼리의 실행 계획을 점검합니다. (전체 스캔이 있으면 종료 코드 1)")
+    explain_parser.add_argument('--days', type=int, default=7, help="점검에 사용할 날짜 범위 (기본값: 7일)")
+
+    partitions_parser = subparsers.add_parser('add-partitions', help="앞으로 사용할 날짜 파티션을 미리 만듭니다.")
+    partitions_parser.add_argument('--days-ahead', type=int, default=7, help="오늘부터 며칠 뒤까지 파티션을 만들지 (기본값: 7일)")
+
+    retention_parser = subparsers.add_parser('retention', help="보존 기간이 지난 날짜 파티션을 삭제합니다.")
+    retention_parser.add_argument('--keep-days', type=int, required=True, help="보존할 일수 (오늘 기준)")
+    retention_parser.add_argument('--export-dir', help="삭제 전에 파티션 행을 JSON Lines로 내보낼 디렉터리")
+    retention_parser.add_argument('--dry-run', action='store_true', help="삭제하지 않고 삭제 대상 파티션만 출력")
+
+    terms_parser = subparsers.add_parser('build-article-terms', help="색인이 없는 날짜의 키워드 검색 색인(article_terms)을 저장된 본문으로 만듭니다.")
+    terms_parser.add_argument('--days', type=int, default=30, help="재구성할 최근 일수 (기본값: 30일)")
+    terms_parser.add_argument('--force', action='store_true', help="이미 색인된 날짜도 다시 만듦 (제목의 한국어 토큰이 빠짐)")
+
+    args = parser.parse_args()
+    try:
+        if args.command == 'dedup-topic-results':
+            dedup_topic_results(dry_run=args.dry_run)
+        elif args.command == 'explain-queries':
+            if not explain_queries(days=args.days):
+                sys.exit(1)
+        elif args.command == 'add-partitions':
+            add_partitions(days_ahead=args.days_ahead)
+        elif args.command == 'retention':
+            apply_retention(keep_days=args.keep_days, export_dir=args.export_dir, dry_run=args.dry_run)
+        elif args.command == 'build-article-terms':
+            build_article_terms(days=args.days, force=args.force)
+    except pymysql.Error:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
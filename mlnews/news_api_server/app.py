@@ -1,28 +1,127 @@
+import uuid
+from datetime import datetime
 from flask import Flask, jsonify
-from threading import Thread
-from daily_news_analyzer import run_daily_analysis
+from threading import Thread, Lock
+from collections import OrderedDict
+from daily_news_analyzer import run_daily_analysis, get_model_registry
 
 app = Flask(__name__)
 
-# 백그라운드에서 실행할 함수
-def background_analysis():
-    try:
-        run_daily_analysis()
-    except Exception as e:
-        # 필요하다면 로그로 저장 가능
-        print(f"[ERROR] 분석 중 오류 발생: {e}")
+class AnalysisJobManager:
+    """
+    분석 작업을 한 번에 하나만 실행하는 관리자.
+    실행 중에 들어온 요청은 하나의 후속 작업으로 합쳐서 대기시키고, 같은 작업 ID를 돌려줍니다.
+    """
+    MAX_HISTORY = 50 # 조회용으로 보관할 최근 작업 수
+
+    def __init__(self):
+        self._lock = Lock()
+        self._jobs = OrderedDict() # job_id -> 작업 정보
+        self._running_id = None
+        self._queued_id = None
+
+    def _new_job(self, state):
+        job_id = uuid.uuid4().hex[:12]
+        self._jobs[job_id] = {
+            'job_id': job_id,
+            'state': state, # queued, running, succeeded, skipped, failed
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'started_at': None,
+            'finished_at': None,
+            'stages': {},
+            'counts': {},
+            'model_load_times': {},
+            'message': None
+        }
+        while len(self._jobs) > self.MAX_HISTORY:
+            oldest_id = next(iter(self._jobs))
+            if oldest_id in (self._running_id, self._queued_id):
+                break
+            self._jobs.popitem(last=False)
+        return job_id
+
+    def submit(self):
+        """
+        분석을 요청합니다. (작업 ID, 상태)를 반환합니다.
+        실행 중인 작업이 없으면 바로 시작하고, 있으면 후속 작업을 하나만 대기시킵니다.
+        """
+        with self._lock:
+            if self._running_id is None:
+                job_id = self._new_job('running')
+                self._running_id = job_id
+                Thread(target=self._worker, args=(job_id,), daemon=True).start()
+                return job_id, 'started'
+            if self._queued_id is None:
+                self._queued_id = self._new_job('queued')
+            return self._queued_id, 'queued'
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def _worker(self, job_id):
+        while job_id is not None:
+            self._run(job_id)
+            with self._lock:
+                # 대기 중인 후속 작업이 있으면 같은 스레드에서 이어서 실행
+                job_id = self._queued_id
+                self._queued_id = None
+                self._running_id = job_id
+                if job_id is not None:
+                    self._jobs[job_id]['state'] = 'running'
+
+    def _run(self, job_id):
+        with self._lock:
+            job = self._jobs[job_id]
+            job['started_at'] = datetime.now().isoformat(timespec='seconds')
+        stats = {}
+
+        def on_stage(stage, stats):
+            # 단계가 끝날 때마다 작업 정보에 복사하여 실행 중에도 /jobs/<job_id>로 진행 상황을 볼 수 있게 함
+            with self._lock:
+                job.update({
+                    'stages': dict(stats.get('stages', {})),
+                    'counts': dict(stats.get('counts', {})),
+                    'model_load_times': dict(stats.get('model_load_times', {}))
+                })
+
+        try:
+            run_daily_analysis(stats=stats, on_stage=on_stage)
+            if stats.get('error'):
+                state, message = 'failed', stats['error']
+            elif stats.get('skipped'):
+                state, message = 'skipped', stats['skipped']
+            else:
+                state, message = 'succeeded', None
+        except Exception as e:
+            # 필요하다면 로그로 저장 가능
+            print(f"[ERROR] 분석 중 오류 발생: {e}")
+            state, message = 'failed', str(e)
+        with self._lock:
+            job.update({
+                'state': state,
+                'message': message,
+                'finished_at': datetime.now().isoformat(timespec='seconds'),
+                'stages': dict(stats.get('stages', {})),
+                'counts': dict(stats.get('counts', {})),
+                'model_load_times': dict(stats.get('model_load_times', {}))
+            })
+
+job_manager = AnalysisJobManager()
 
 @app.route('/run-news-analysis', methods=['POST'])
 def run_news_analysis():
     try:
-        # 백그라운드 스레드에서 실행
-        thread = Thread(target=background_analysis)
-        thread.start()
+        # 실행 중인 분석이 있으면 후속 작업 하나로 합쳐짐
+        job_id, status = job_manager.submit()
 
         # 즉시 응답 반환
+        message = '분석이 백그라운드에서 시작되었습니다.' if status == 'started' else '진행 중인 분석이 끝나면 이어서 실행됩니다.'
         return jsonify({
-            'status': 'started',
-            'message': '분석이 백그라운드에서 시작되었습니다.'
+            'status': status,
+            'job_id': job_id,
+            'message': message
         }), 202
     except Exception as e:
         return jsonify({
@@ -30,5 +129,17 @@ def run_news_analysis():
             'message': f'스레드 실행 중 오류 발생: {str(e)}'
         }), 500
 
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({
+            'status': 'error',
+            'message': f'작업을 찾을 수 없습니다: {job_id}'
+        }), 404
+    return jsonify(job), 200
+
 if __name__ == '__main__':
+    # 서버 시작 시 임베딩 모델과 전처리 워커(Okt)를 미리 로드하여 이후 분석 실행에서 재사용
+    Thread(target=get_model_registry().warm_up, daemon=True).start()
     app.run(host='0.0.0.0', port=5000)
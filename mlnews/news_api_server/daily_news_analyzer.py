@@ -1,7 +1,12 @@
 import os
+import shutil
+import hashlib
+import sqlite3
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from konlpy.tag import Okt
 import re
@@ -11,6 +16,10 @@ import warnings
 import pymysql # MySQL 연동
 import pytz # 시간대 처리
 import time # API 요청 지연을 위해
+import threading
+import random
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 
 # 경고 메시지 무시 (예: 라이브러리의 UserWarning)
@@ -28,161 +37,1373 @@ MYSQL_USER = "root"
 MYSQL_PASSWORD = "mysql@24!"
 MYSQL_DB = "news_analysis_db" # 생성한 데이터베이스 이름과 일치하는지 확인
 
+# DB 일괄 저장 설정
+DB_WRITE_BATCH_SIZE = 500 # 다중 행 INSERT 한 번에 보낼 행 수
+DB_LOOKUP_BATCH_SIZE = 1000 # WHERE link IN (...) 한 번에 조회할 링크 수
+ARTICLE_TERM_MAX_LENGTH = 100 # article_terms.term 컬럼 길이 (이보다 긴 토큰은 색인하지 않음)
+TOPIC_KEYWORDS_TOP_K = 20 # topic_keywords에 저장할 토픽별 상위 키워드 수
+
+# 뉴스 수집 동시성 및 API 호출 속도 설정
+NAVER_MAX_CONCURRENCY = 4 # 동시에 수집할 쿼리 수
+NAVER_RATE_LIMIT_PER_SEC = 10 # 네이버 검색 API 초당 호출 한도
+NAVER_RATE_LIMIT_BURST = 10 # 순간적으로 허용할 최대 호출 수
+NAVER_MAX_START = 1000 # 네이버 API start 파라미터 최대값 (쿼리당 최대 1000개 기사)
+
+# 네이버 API HTTP 클라이언트 설정
+NAVER_CONNECT_TIMEOUT = 3.05 # TCP 연결 타임아웃 (초)
+NAVER_READ_TIMEOUT = 10 # 응답 대기 타임아웃 (초)
+NAVER_MAX_RETRIES = 3 # 429/5xx 및 네트워크 오류 시 재시도 횟수
+NAVER_BACKOFF_BASE = 0.5 # 지수 백오프 기본 대기 시간 (초)
+NAVER_BACKOFF_MAX = 8 # 백오프 최대 대기 시간 (초)
+
+# 증분 수집 설정: collection_state 테이블의 쿼리별 최신 pubDate/link 이후 기사만 새로 가져옴
+INCREMENTAL_COLLECTION = True
+
+# 한국어 전처리 병렬화 설정 (워커 프로세스마다 Okt 인스턴스를 하나씩 사용)
+PREPROCESS_WORKERS = os.cpu_count() or 1
+PREPROCESS_CHUNK_SIZE = 64 # 워커에 한 번에 전달할 문서 수
+
+# 전처리 결과 캐시 설정 (정제된 텍스트 + 전처리 설정의 해시를 키로 사용하는 SQLite 파일)
+PREPROCESS_CACHE_ENABLED = True
+PREPROCESS_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'preprocess_cache.sqlite3')
+PREPROCESS_CACHE_MAX_ENTRIES = 200000 # 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+
+# 임베딩 설정 및 임베딩 저장소 (전처리 텍스트 해시 + 모델 이름을 키로 하는 memmap 행렬)
+EMBEDDING_MODEL_NAME = 'jhgan/ko-sbert-nli'
+EMBEDDING_CACHE_ENABLED = True
+EMBEDDING_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'embeddings')
+EMBEDDING_CACHE_DTYPE = 'float32' # 'float16'으로 바꾸면 디스크 사용량이 절반
+
+# 분석 날짜별 역색인/임베딩 샤드 파일의 공유 위치 (MCP 서버, db_maintenance.py가 같은 위치를 읽음)
+# 기본값은 두 분석기 사본(mlnews/, mlnews/news_api_server/) 모두 mlnews/cache이며, NEWS_INDEX_DIR 환경 변수로 변경 가능
+_MLNEWS_DIR = os.path.dirname(os.path.abspath(__file__))
+if os.path.basename(_MLNEWS_DIR) == 'news_api_server':
+    _MLNEWS_DIR = os.path.dirname(_MLNEWS_DIR)
+NEWS_INDEX_DIR = os.environ.get('NEWS_INDEX_DIR', os.path.join(_MLNEWS_DIR, 'cache'))
+
+# 분석 날짜별 역색인 파일 (토큰 -> 기사 ID, 빈도). MCP 서버가 mmap으로 읽어 검색/키워드 빈도 계산에 사용
+POSTINGS_INDEX_ENABLED = True
+POSTINGS_INDEX_DIR = os.path.join(NEWS_INDEX_DIR, 'postings')
+
+# 분석 날짜별 기사 임베딩 샤드 (정규화된 벡터 + IVF 목록). MCP 서버의 관련 기사 검색에 사용
+VECTOR_INDEX_ENABLED = True
+VECTOR_INDEX_DIR = os.path.join(NEWS_INDEX_DIR, 'vectors')
+VECTOR_INDEX_KMEANS_ITERATIONS = 10 # IVF 목록 중심을 구하는 k-means 반복 횟수
+
+# 날짜 간 토픽 연결 설정 (매일 새로 매겨지는 토픽 ID를 영구적인 global_topic_id에 연결)
+TOPIC_LINEAGE_LOOKBACK_DAYS = 14 # 최근 이 기간 안에 등장한 전역 토픽과만 비교
+TOPIC_LINEAGE_MATCH_THRESHOLD = 0.55 # 유사도가 이 값 이상이어야 같은 토픽으로 연결 (미만이면 새 전역 토픽)
+TOPIC_LINEAGE_CENTROID_WEIGHT = 0.7 # 유사도 = 가중치 * 중심 임베딩 코사인 + (1 - 가중치) * c-TF-IDF 키워드 코사인
+TOPIC_LINEAGE_CENTROID_MOMENTUM = 0.8 # 연결된 전역 토픽의 중심 = 모멘텀 * 기존 중심 + (1 - 모멘텀) * 오늘 중심
+
 # --- Okt 초기화 ---
-try:
-    okt = Okt()
-except Exception as e:
-    print(f"Okt 초기화 오류: {e}. 'pip install konlpy' 및 Java 설치를 확인해주세요.")
-    exit()  # Okt 없이는 진행 불가
+# Okt는 JVM을 띄우므로 프로세스마다 처음 사용할 때 한 번만 생성합니다. (전처리 워커 프로세스도 각자 하나씩 보유)
+okt = None
+
+def get_okt():
+    global okt
+    if okt is None:
+        try:
+            okt = Okt()
+        except Exception as e:
+            print(f"Okt 초기화 오류: {e}. 'pip install konlpy' 및 Java 설치를 확인해주세요.")
+            raise  # Okt 없이는 진행 불가
+    return okt
 
 # --- 전처리 함수 ---
-def preprocess_korean_text(text):
-    if not okt:
-        return ""
+STOPWORDS = frozenset(['은', '는', '이', '가', '을', '를', '에', '에서', '와', '과', '하다', '이다', '되다', '되', '것', '수', '고', '다', '습니다', '등', '있다', '있', '으로', '에게', '하여', '이번', '지난', '말', '기자', '사진', '씨', '명', '년', '월', '일', '오전', '오후', '시', '분', '초', '지난달', '이번달', '새로운', '각각', '오직', '특히', '점', '또한', '통해', '이번', '그간', '따라', '대한', '관련', '때문', '로부터', '까지', '바로', '또한', '물론', '대비', '위해', '으로'])
+KEEP_POS_TAGS = ('Noun', 'Verb', 'Adjective', 'Exclamation', 'Josa')
+
+# 불용어/품사 설정이 바뀌면 캐시 키도 바뀌도록 설정 자체의 해시를 키에 포함
+PREPROCESS_CONFIG_FINGERPRINT = hashlib.sha256(json.dumps({
+    'stopwords': sorted(STOPWORDS),
+    'pos_tags': KEEP_POS_TAGS,
+    'norm': True,
+    'stem': True,
+    'min_length': 2
+}, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
+def clean_text(text):
     # HTML 태그, 특수 문자 및 추가 공백 제거
     text = re.sub(r'<[^>]+>', '', text)
     text = re.sub(r'[^가-힣a-zA-Z\s]', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    stopwords = ['은', '는', '이', '가', '을', '를', '에', '에서', '와', '과', '하다', '이다', '되다', '되', '것', '수', '고', '다', '습니다', '등', '있다', '있', '으로', '에게', '하여', '이번', '지난', '말', '기자', '사진', '씨', '명', '년', '월', '일', '오전', '오후', '시', '분', '초', '지난달', '이번달', '새로운', '각각', '오직', '특히', '점', '또한', '통해', '이번', '그간', '따라', '대한', '관련', '때문', '로부터', '까지', '바로', '또한', '물론', '대비', '위해', '으로']
+    return re.sub(r'\s+', ' ', text).strip()
 
+def tokenize_cleaned_text(text):
+    """정제된 텍스트를 Okt로 형태소 분석하여 불용어를 제외한 토큰을 공백으로 연결해 반환합니다."""
+    tagger = get_okt()
     processed_tokens = []
-    for word, pos in okt.pos(text, norm=True, stem=True):
-        if pos in ['Noun', 'Verb', 'Adjective', 'Exclamation', 'Josa']:
-            if word not in stopwords and len(word) > 1:
+    for word, pos in tagger.pos(text, norm=True, stem=True):
+        if pos in KEEP_POS_TAGS:
+            if word not in STOPWORDS and len(word) > 1:
                 processed_tokens.append(word)
     return ' '.join(processed_tokens)
 
+def preprocess_korean_text(text):
+    return tokenize_cleaned_text(clean_text(text))
+
+def extract_alpha_terms(text):
+    """
+    정제된 텍스트의 영문 토큰(Okt의 Alpha 품사와 같은 연속된 로마자)을 소문자로 반환합니다.
+    KEEP_POS_TAGS에 Alpha가 없어 토픽 모델 입력에는 빠지므로, 'AI', 'IT', 'Samsung' 같은 검색어를 위해 키워드 검색 색인에만 추가합니다.
+    """
+    return [term.lower() for term in re.findall(r'[A-Za-z]{2,}', text)]
+
+# --- 전처리 결과 캐시 ---
+class PreprocessCache:
+    """
+    정제된 텍스트와 전처리 설정의 해시를 키로 전처리 결과를 저장하는 SQLite 캐시.
+    max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제하며, 히트/미스 횟수를 집계합니다.
+    """
+    def __init__(self, path=PREPROCESS_CACHE_PATH, max_entries=PREPROCESS_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS preprocessed (
+                cache_key TEXT PRIMARY KEY,
+                processed_text TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_preprocessed_last_used ON preprocessed (last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(cleaned_text):
+        return hashlib.sha256(f"{PREPROCESS_CONFIG_FINGERPRINT}\0{cleaned_text}".encode('utf-8')).hexdigest()
+
+    def get_many(self, keys):
+        """키 목록 중 캐시에 있는 항목을 {키: 전처리 결과}로 반환하고 히트/미스 횟수를 갱신합니다."""
+        unique_keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            # SQLite 바인딩 변수 개수 제한을 피하기 위해 나누어 조회
+            for i in range(0, len(unique_keys), 500):
+                batch = unique_keys[i:i + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT cache_key, processed_text FROM preprocessed WHERE cache_key IN ({placeholders})", batch
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                self._conn.executemany("UPDATE preprocessed SET last_used = ? WHERE cache_key = ?",
+                                       [(now, key) for key in found])
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+        return found
+
+    def put_many(self, items):
+        """{키: 전처리 결과}를 저장하고 최대 항목 수를 넘으면 오래된 항목을 삭제합니다."""
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO preprocessed (cache_key, processed_text, last_used) VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in items.items()]
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM preprocessed").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM preprocessed WHERE cache_key IN (SELECT cache_key FROM preprocessed ORDER BY last_used LIMIT ?)",
+                    (overflow,)
+                )
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM preprocessed").fetchone()[0]
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0,
+                'entries': entries
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_preprocess_cache = None
+_preprocess_cache_lock = threading.Lock()
+
+def get_preprocess_cache():
+    """프로세스 전역에서 공유하는 PreprocessCache를 반환합니다. (비활성화 시 None)"""
+    global _preprocess_cache
+    if not PREPROCESS_CACHE_ENABLED:
+        return None
+    with _preprocess_cache_lock:
+        if _preprocess_cache is None:
+            _preprocess_cache = PreprocessCache()
+        return _preprocess_cache
+
+def _init_preprocess_worker():
+    # 워커 프로세스 시작 시 Okt(JVM)를 미리 로드하여 첫 청크의 지연을 없앰
+    get_okt()
+
+def create_preprocess_pool(workers=PREPROCESS_WORKERS):
+    """
+    Okt가 미리 로드된 전처리용 프로세스 풀을 생성합니다.
+    부모 프로세스에서 시작된 JVM은 fork 후 사용할 수 없으므로 spawn 방식으로 워커를 띄웁니다.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max(1, workers),
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_preprocess_worker
+    )
+
+def _tokenize_in_pool(cleaned_texts, workers, pool, chunksize):
+    if pool is None:
+        # 청크 수보다 많은 워커는 띄우지 않음
+        workers = min(workers, (len(cleaned_texts) + chunksize - 1) // chunksize)
+        if workers <= 1:
+            return [tokenize_cleaned_text(text) for text in cleaned_texts]
+
+    owns_pool = pool is None
+    if owns_pool:
+        pool = create_preprocess_pool(workers)
+    try:
+        # Executor.map은 청크 단위로 워커에 분배하면서도 입력 순서를 유지함
+        return list(pool.map(tokenize_cleaned_text, cleaned_texts, chunksize=chunksize))
+    finally:
+        if owns_pool:
+            pool.shutdown()
+
+def preprocess_documents(documents, workers=PREPROCESS_WORKERS, pool=None, chunksize=PREPROCESS_CHUNK_SIZE, cache=None):
+    """
+    문서 목록을 여러 프로세스에서 청크 단위로 전처리하고, 입력 순서대로 결과를 반환합니다.
+    pool이 주어지면 (미리 Okt를 로드해 둔 풀) 그대로 재사용하며 종료하지 않습니다.
+    cache(PreprocessCache)가 주어지면 캐시에 없는 텍스트만 Okt로 보냅니다.
+    """
+    if not documents:
+        return []
+    cleaned_texts = [clean_text(doc) for doc in documents]
+    keys = [PreprocessCache.make_key(text) for text in cleaned_texts]
+    results = cache.get_many(keys) if cache is not None else {}
+
+    # 캐시 미스 중 중복 텍스트는 한 번만 분석
+    pending = {}
+    for key, text in zip(keys, cleaned_texts):
+        if key not in results and key not in pending:
+            pending[key] = text
+    if pending:
+        tokenized = _tokenize_in_pool(list(pending.values()), workers, pool, chunksize)
+        computed = dict(zip(pending.keys(), tokenized))
+        if cache is not None:
+            cache.put_many(computed)
+        results.update(computed)
+
+    return [results[key] for key in keys]
+
+# --- 임베딩 저장소 ---
+class EmbeddingStore:
+    """
+    문서 임베딩을 모델·dtype별 memmap 행렬(<모델>.<dtype>.bin)과 인덱스 파일(<모델>.<dtype>.idx, 행 순서대로 32바이트 해시)에 저장합니다.
+    새 임베딩은 메타 파일의 행 수(count) 위치부터 두 파일에 쓰고, 마지막에 메타 파일의 행 수를 갱신합니다.
+    중간에 실패하여 count 뒤에 남은 바이트는 다음 로드 때 잘라내므로 행 번호와 파일 내용이 어긋나지 않습니다.
+    """
+    KEY_SIZE = 32 # sha256 digest 크기
+
+    def __init__(self, model_name, directory=EMBEDDING_CACHE_DIR, dtype=EMBEDDING_CACHE_DTYPE):
+        self.model_name = model_name
+        self.dtype = np.dtype(dtype)
+        slug = re.sub(r'[^0-9A-Za-z_.-]', '_', model_name)
+        os.makedirs(directory, exist_ok=True)
+        self.matrix_path = os.path.join(directory, f"{slug}.{self.dtype.name}.bin")
+        self.index_path = os.path.join(directory, f"{slug}.{self.dtype.name}.idx")
+        self.meta_path = os.path.join(directory, f"{slug}.{self.dtype.name}.meta.json")
+        self._lock = threading.Lock()
+        self._matrix = None # 읽기 전용 memmap (행이 추가될 때마다 다시 연다)
+        self._load()
+
+    def _load(self):
+        self.dim = None
+        self.count = 0
+        self._rows = {}
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('model_name') == self.model_name and meta.get('dtype') == self.dtype.name:
+                self.dim = meta['dim']
+                self.count = meta['count']
+        # 메타 파일에 기록되지 않은 행(추가 도중 실패한 나머지)을 잘라냄
+        row_bytes = self.dim * self.dtype.itemsize if self.dim else 0
+        self._truncate(self.matrix_path, self.count * row_bytes)
+        self._truncate(self.index_path, self.count * self.KEY_SIZE)
+        if self.count:
+            keys = np.fromfile(self.index_path, dtype=f"S{self.KEY_SIZE}", count=self.count)
+            self._rows = {key: row for row, key in enumerate(keys.tolist())}
+            self._matrix = np.memmap(self.matrix_path, dtype=self.dtype, mode='r', shape=(self.count, self.dim))
+
+    @staticmethod
+    def _truncate(path, size):
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, 'r+b') as f:
+                f.truncate(size)
+
+    def make_key(self, text):
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode('utf-8')).digest()
+
+    def lookup(self, keys):
+        """키 목록에 대해 저장된 행 번호 목록을 반환합니다. (없으면 None)"""
+        with self._lock:
+            return [self._rows.get(key) for key in keys]
+
+    def read_rows(self, rows):
+        with self._lock:
+            return np.asarray(self._matrix[rows], dtype=np.float32)
+
+    def append(self, keys, vectors):
+        """새 임베딩을 저장소 끝에 추가합니다. 이미 있는 키는 건너뜁니다."""
+        vectors = np.asarray(vectors)
+        with self._lock:
+            new_positions = []
+            seen = set()
+            for i, key in enumerate(keys):
+                if key not in self._rows and key not in seen:
+                    seen.add(key)
+                    new_positions.append(i)
+            if not new_positions:
+                return
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+            # 이전 실패로 남은 바이트가 있어도 count 위치부터 덮어씀
+            for path, offset, data in (
+                (self.matrix_path, self.count * self.dim * self.dtype.itemsize,
+                 np.ascontiguousarray(vectors[new_positions], dtype=self.dtype).tobytes()),
+                (self.index_path, self.count * self.KEY_SIZE, b''.join(keys[i] for i in new_positions)),
+            ):
+                with open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+                    f.truncate(offset)
+                    f.seek(offset)
+                    f.write(data)
+            for offset, i in enumerate(new_positions):
+                self._rows[keys[i]] = self.count + offset
+            self.count += len(new_positions)
+            meta_tmp_path = self.meta_path + '.tmp'
+            with open(meta_tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'model_name': self.model_name, 'dim': self.dim, 'dtype': self.dtype.name, 'count': self.count}, f)
+            os.replace(meta_tmp_path, self.meta_path)
+            self._matrix = np.memmap(self.matrix_path, dtype=self.dtype, mode='r', shape=(self.count, self.dim))
+
+def encode_with_store(embedding_model, texts, store=None, show_progress_bar=True):
+    """
+    저장소에 없는 텍스트만 모델로 인코딩하고, 나머지는 memmap 행렬에서 읽어 입력 순서대로 합친 float32 배열을 반환합니다.
+    (반환값: 임베딩 배열, 새로 인코딩한 문서 수)
+    """
+    if store is None:
+        return np.asarray(embedding_model.encode(texts, show_progress_bar=show_progress_bar), dtype=np.float32), len(texts)
+
+    keys = [store.make_key(text) for text in texts]
+    rows = store.lookup(keys)
+
+    # 저장소에 없는 텍스트 (중복 제거)
+    pending = {}
+    for key, row, text in zip(keys, rows, texts):
+        if row is None and key not in pending:
+            pending[key] = text
+    if pending:
+        new_vectors = np.asarray(embedding_model.encode(list(pending.values()), show_progress_bar=show_progress_bar), dtype=np.float32)
+        store.append(list(pending.keys()), new_vectors)
+        rows = store.lookup(keys)
+
+    # 저장된 행을 한 번에 모아 읽음 (memmap에서 필요한 행만 페이지 인)
+    return store.read_rows(np.asarray(rows, dtype=np.int64)), len(pending)
+
+_embedding_stores = {}
+_embedding_stores_lock = threading.Lock()
+
+def get_embedding_store(model_name=EMBEDDING_MODEL_NAME):
+    """모델별로 프로세스 전역에서 공유하는 EmbeddingStore를 반환합니다. (비활성화 시 None)"""
+    if not EMBEDDING_CACHE_ENABLED:
+        return None
+    with _embedding_stores_lock:
+        if model_name not in _embedding_stores:
+            _embedding_stores[model_name] = EmbeddingStore(model_name)
+        return _embedding_stores[model_name]
+
+# --- 모델 레지스트리 ---
+MODEL_WARMUP_TEXTS = ['오늘 주요 경제 뉴스', '인공지능 기술 발전과 사회 변화']
+
+class ModelRegistry:
+    """
+    임베딩 모델과 전처리 워커 풀(워커별 Okt)을 프로세스 수명 동안 한 번만 로드하여 여러 분석 실행에서 재사용합니다.
+    각 구성 요소의 로드(+워밍업) 시간을 load_times에 기록하여 추론 시간과 구분해 보고합니다.
+    """
+    def __init__(self, embedding_model_name=EMBEDDING_MODEL_NAME, preprocess_workers=PREPROCESS_WORKERS):
+        self.embedding_model_name = embedding_model_name
+        self.preprocess_workers = preprocess_workers
+        self.load_times = {}
+        self._embedding_model = None
+        self._preprocess_pool = None
+        self._lock = threading.Lock()
+
+    def get_embedding_model(self):
+        with self._lock:
+            if self._embedding_model is None:
+                started = time.perf_counter()
+                model = SentenceTransformer(self.embedding_model_name)
+                model.encode(MODEL_WARMUP_TEXTS, show_progress_bar=False) # 첫 배치의 초기화 비용을 미리 지불
+                self._embedding_model = model
+                self.load_times['embedding_model'] = round(time.perf_counter() - started, 3)
+            return self._embedding_model
+
+    def get_preprocess_pool(self, warm_up=False):
+        """전처리 프로세스 풀을 반환합니다. 워커 수가 1 이하이면 None (현재 프로세스의 Okt 사용)."""
+        with self._lock:
+            if self.preprocess_workers <= 1:
+                if warm_up and 'okt' not in self.load_times:
+                    started = time.perf_counter()
+                    get_okt().pos(MODEL_WARMUP_TEXTS[0])
+                    self.load_times['okt'] = round(time.perf_counter() - started, 3)
+                return None
+            if self._preprocess_pool is None:
+                self._preprocess_pool = create_preprocess_pool(self.preprocess_workers)
+            if warm_up and 'preprocess_pool' not in self.load_times:
+                # 워커 수만큼 작업을 보내 모든 워커 프로세스를 띄우고 Okt(JVM)를 로드시킴
+                started = time.perf_counter()
+                warmup_texts = [MODEL_WARMUP_TEXTS[0]] * self.preprocess_workers
+                list(self._preprocess_pool.map(tokenize_cleaned_text, warmup_texts, chunksize=1))
+                self.load_times['preprocess_pool'] = round(time.perf_counter() - started, 3)
+            return self._preprocess_pool
+
+    def warm_up(self):
+        """모든 모델을 미리 로드합니다. (서버 시작 시 백그라운드에서 호출)"""
+        print("모델 워밍업 시작...")
+        self.get_preprocess_pool(warm_up=True)
+        self.get_embedding_model()
+        print(f"모델 워밍업 완료: {self.load_times}")
+
+    def shutdown(self):
+        with self._lock:
+            if self._preprocess_pool is not None:
+                self._preprocess_pool.shutdown()
+                self._preprocess_pool = None
+
+_model_registry = None
+_model_registry_lock = threading.Lock()
+
+def get_model_registry():
+    """프로세스 전역에서 공유하는 ModelRegistry를 반환합니다."""
+    global _model_registry
+    with _model_registry_lock:
+        if _model_registry is None:
+            _model_registry = ModelRegistry()
+        return _model_registry
+
+# --- 네이버 뉴스 API 클라이언트 ---
+class NaverNewsClient:
+    """
+    keep-alive 연결 풀을 재사용하는 네이버 뉴스 검색 API 클라이언트.
+    인증 헤더, 연결 풀 크기, 타임아웃, 429/5xx 재시도(지터 포함 지수 백오프)를 관리합니다.
+    """
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    def __init__(self, client_id=NAVER_CLIENT_ID, client_secret=NAVER_CLIENT_SECRET,
+                 api_url=NAVER_NEWS_API_URL, pool_size=NAVER_MAX_CONCURRENCY,
+                 connect_timeout=NAVER_CONNECT_TIMEOUT, read_timeout=NAVER_READ_TIMEOUT,
+                 max_retries=NAVER_MAX_RETRIES, backoff_base=NAVER_BACKOFF_BASE,
+                 backoff_max=NAVER_BACKOFF_MAX):
+        self.api_url = api_url
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            "X-Naver-Client-Id": client_id,
+            "X-Naver-Client-Secret": client_secret
+        })
+        # 동시 수집 스레드 수만큼 연결을 유지하고, 풀이 가득 차면 새 연결 대신 대기
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size), pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _backoff_delay(self, attempt, retry_after=None):
+        # full jitter: 0 ~ min(최대값, 기본값 * 2^attempt) 사이 임의 대기
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after)) # 서버가 요청한 대기 시간은 지킴
+            except ValueError:
+                pass
+        return delay
+
+    def search_news(self, query, display=100, start=1, sort='date'):
+        """뉴스 검색 결과의 items 목록을 반환합니다. 재시도 후에도 실패하면 예외를 발생시킵니다."""
+        params = {
+            "query": query,
+            "display": display,
+            "start": start,
+            "sort": sort # 'date' (최신순) 또는 'sim' (유사도순)
+        }
+        attempt = 0
+        while True:
+            try:
+                response = self.session.get(self.api_url, params=params, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in self.RETRY_STATUS_CODES and attempt < self.max_retries:
+                retry_after = response.headers.get('Retry-After')
+                response.close()
+                time.sleep(self._backoff_delay(attempt, retry_after))
+                attempt += 1
+                continue
+
+            response.raise_for_status() # HTTP 오류 (4xx 또는 5xx) 발생 시 예외 발생
+            return response.json()['items']
+
+    def close(self):
+        self.session.close()
+
+_default_naver_client = None
+_default_naver_client_lock = threading.Lock()
+
+def get_default_naver_client():
+    """모듈 전역에서 공유하는 NaverNewsClient를 반환합니다."""
+    global _default_naver_client
+    with _default_naver_client_lock:
+        if _default_naver_client is None:
+            _default_naver_client = NaverNewsClient()
+        return _default_naver_client
+
 # --- 네이버 뉴스 API 호출 함수 ---
-def get_naver_news_articles(query, display=100, start=1, sort='date'):
-    headers = {
-        "X-Naver-Client-Id": NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
-    }
-    params = {
-        "query": query,
-        "display": display,
-        "start": start,
-        "sort": sort # 'date' (최신순) 또는 'sim' (유사도순)
-    }
+def get_naver_news_articles(query, display=100, start=1, sort='date', client=None):
+    if client is None:
+        client = get_default_naver_client()
     try:
-        response = requests.get(NAVER_NEWS_API_URL, headers=headers, params=params)
-        response.raise_for_status() # HTTP 오류 (4xx 또는 5xx) 발생 시 예외 발생
-        return response.json()['items']
+        return client.search_news(query, display=display, start=start, sort=sort)
     except requests.exceptions.RequestException as e:
         print(f"쿼리 '{query}'에 대한 네이버 뉴스 API 호출 오류: {e}")
         return []
 
+# --- API 호출 속도 제한 (토큰 버킷) ---
+class TokenBucket:
+    """여러 스레드가 공유하는 토큰 버킷. 고정 sleep 대신 API 쿼터에 맞춰 호출을 조절합니다."""
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate) # 초당 충전되는 토큰 수
+        self.capacity = float(capacity or rate) # 버킷 최대 크기 (버스트 허용량)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """토큰을 얻을 때까지 대기합니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_seconds = (tokens - self._tokens) / self.rate
+            time.sleep(wait_seconds)
+
+# --- 뉴스 수집 함수 ---
+def decode_html_entities(text):
+    # HTML 엔티티를 일반 문자로 디코딩
+    return text.replace('&quot;', '"').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
+
+def parse_naver_item(item, kst_timezone):
+    """네이버 API 응답 항목을 기사 dict로 변환합니다. (기사, KST 발행 시각) 또는 None을 반환합니다."""
+    pub_date_str = item.get('pubDate')
+    if not pub_date_str:
+        return None
+    try:
+        # 날짜 파싱 (RFC 2822 포맷)
+        pub_date = datetime.strptime(pub_date_str, '%a, %d %b %Y %H:%M:%S %z')
+        # 한국 시간대 +0900으로 변환 (네이버 기본)
+        pub_date_kst = pub_date.astimezone(kst_timezone)
+    except ValueError as ve:
+        print(f"날짜 파싱 오류: {pub_date_str} - {ve}")
+        return None
+
+    decoded_description = decode_html_entities(item.get('description', ''))
+    article = {
+        'title': decode_html_entities(item.get('title', '')),
+        'link': item.get('link', ''),
+        'description': decoded_description, # description을 원문으로 사용
+        'pubDate': pub_date_kst.isoformat(), # ISO 포맷으로 저장
+        'original_text': decoded_description
+    }
+    return article, pub_date_kst
+
+def collect_query_articles(query, filter_start_time, rate_limiter, kst_timezone, client, high_water_mark=None):
+    """
+    하나의 쿼리를 최신순으로 페이징하며 filter_start_time 이후 기사를 수집합니다.
+    high_water_mark((pubDate, link))가 주어지면 이전 실행에서 이미 본 기사에 도달하는 즉시 중단합니다.
+    (수집한 기사 목록, 새 high-water mark)를 반환합니다.
+    이전 high-water mark나 24시간 경계, 결과의 끝까지 페이징하지 못한 경우(API 오류, start 상한 도달)에는
+    건너뛴 구간이 다음 실행에서 다시 수집되도록 기존 high-water mark를 그대로 반환합니다.
+    """
+    articles = []
+    newest_mark = high_water_mark
+    paging_complete = False
+    current_start = 1
+    # 각 쿼리당 최대 1000개 기사 (네이버 API 제한)를 가져오면서 24시간 필터링
+    while current_start <= NAVER_MAX_START:
+        rate_limiter.acquire() # API 요청 간 지연 (쿼터 기반)
+        try:
+            items = client.search_news(query, display=100, start=current_start, sort='date')
+        except requests.exceptions.RequestException as e:
+            print(f"쿼리 '{query}'에 대한 네이버 뉴스 API 호출 오류: {e}")
+            break # 실패한 페이지 이후는 수집하지 못함 → high-water mark 유지
+        if not items:
+            paging_complete = True # 더 이상 기사가 없으면 중단
+            break
+
+        new_articles_in_window = 0
+        reached_window_boundary = False
+        for item in items:
+            try:
+                parsed = parse_naver_item(item, kst_timezone)
+                if parsed is None:
+                    continue
+                article, pub_date_kst = parsed
+                if high_water_mark is not None:
+                    seen_pub_date, seen_link = high_water_mark
+                    if pub_date_kst < seen_pub_date:
+                        # 이전 실행에서 이미 수집한 구간에 도달 → 이후 페이지도 모두 수집된 기사
+                        reached_window_boundary = True
+                        continue
+                    if pub_date_kst == seen_pub_date and article['link'] == seen_link:
+                        continue
+                # 24시간 이내 기사만 필터링
+                if pub_date_kst >= filter_start_time:
+                    if newest_mark is None or pub_date_kst > newest_mark[0]:
+                        newest_mark = (pub_date_kst, article['link'])
+                    articles.append(article)
+                    new_articles_in_window += 1
+                else:
+                    # 날짜순 정렬이므로, 24시간 범위를 벗어나면 다음 페이지에는 더 이상 범위 내 기사가 없음
+                    reached_window_boundary = True
+            except Exception as ex:
+                print(f"기사 처리 중 알 수 없는 오류: {ex}")
+
+        # 24시간 경계(또는 이전 high-water mark)에 도달했거나 마지막 페이지면 이 쿼리의 수집 완료
+        if reached_window_boundary or len(items) < 100:
+            paging_complete = True
+            break
+        # 현재 페이지에 범위 내 기사가 없으면 다음 쿼리로 이동
+        if new_articles_in_window == 0:
+            break
+
+        current_start += 100
+    if not paging_complete:
+        print(f"쿼리 '{query}': 수집 구간을 끝까지 페이징하지 못해 high-water mark를 갱신하지 않습니다.")
+        return articles, high_water_mark
+    return articles, newest_mark
+
+def collect_news_articles(queries, filter_start_time, max_concurrency=NAVER_MAX_CONCURRENCY, rate_limiter=None, client=None, collection_state=None):
+    """
+    모든 쿼리를 스레드 풀에서 동시에 수집합니다.
+    동시 실행 수는 max_concurrency로, 전체 API 호출 속도는 공유 토큰 버킷으로 제한합니다.
+    모든 쿼리와 페이지는 하나의 NaverNewsClient 연결 풀을 재사용합니다.
+    collection_state(쿼리 -> high-water mark)가 주어지면 쿼리별로 이미 본 기사 이전에서 중단합니다.
+    (쿼리 순서대로 합친 기사 목록, 갱신된 collection_state)를 반환합니다.
+    """
+    collection_state = dict(collection_state or {})
+    if rate_limiter is None:
+        rate_limiter = TokenBucket(NAVER_RATE_LIMIT_PER_SEC, NAVER_RATE_LIMIT_BURST)
+    if client is None:
+        client = get_default_naver_client()
+    kst_timezone = pytz.timezone('Asia/Seoul')
+
+    all_articles = []
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        futures = [
+            executor.submit(collect_query_articles, q, filter_start_time, rate_limiter, kst_timezone, client,
+                            collection_state.get(q))
+            for q in queries
+        ]
+        for q, future in zip(queries, futures):
+            try:
+                articles, newest_mark = future.result()
+                print(f"쿼리 '{q}': {len(articles)}개 기사 수집")
+                all_articles.extend(articles)
+                if newest_mark is not None:
+                    collection_state[q] = newest_mark
+            except Exception as e:
+                print(f"쿼리 '{q}' 수집 중 오류 발생: {e}")
+    return all_articles, collection_state
+
+# --- 증분 수집 상태 (쿼리별 high-water mark) ---
+def load_collection_state(conn, kst_timezone):
+    """collection_state 테이블에서 쿼리별 (최신 pubDate, link)를 읽어옵니다."""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT search_query, last_pub_date, last_link FROM collection_state;")
+            return {
+                row['search_query']: (kst_timezone.localize(row['last_pub_date']), row['last_link'])
+                for row in cursor.fetchall()
+            }
+    except pymysql.Error as e:
+        print(f"수집 상태 조회 실패 ({e}). 전체 24시간 구간을 수집합니다.")
+        return {}
+
+def save_collection_state(conn, collection_state):
+    """쿼리별 high-water mark를 collection_state 테이블에 저장합니다. (pub_date는 KST 기준 DATETIME)"""
+    if not collection_state:
+        return
+    upsert_state_sql = """
+    INSERT INTO collection_state (search_query, last_pub_date, last_link)
+    VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        last_pub_date=VALUES(last_pub_date),
+        last_link=VALUES(last_link);
+    """
+    rows = [(q, pub_date.replace(tzinfo=None), link) for q, (pub_date, link) in collection_state.items()]
+    with conn.cursor() as cursor:
+        cursor.executemany(upsert_state_sql, rows)
+    conn.commit()
+
+def load_stored_window_articles(conn, filter_start_time, analysis_day):
+    """
+    이전 실행에서 이미 저장된 24시간 이내 기사를 DB에서 읽어옵니다. (다시 수집하지 않은 기사도 분석에 포함)
+    news_articles는 분석 날짜별 파티션에 저장되므로, 같은 분석 날짜(analysis_day)의 행만 기존 ID를 재사용하고
+    전날 파티션의 기사는 오늘 파티션에 새 행으로 저장되도록 article_id를 비워 둡니다.
+    """
+    select_window_sql = """
+    SELECT na.id, na.title, na.link, na.pub_date, na.analysis_day, nb.original_text
+    FROM news_articles na
+    LEFT JOIN news_article_bodies nb ON nb.article_id = na.id AND nb.analysis_day = na.analysis_day
+    WHERE na.pub_date >= %s
+    ORDER BY na.analysis_day DESC;
+    """
+    kst_timezone = filter_start_time.tzinfo
+    with conn.cursor() as cursor:
+        # pub_date는 KST 기준 naive DATETIME으로 저장되어 있음
+        cursor.execute(select_window_sql, (filter_start_time.replace(tzinfo=None),))
+        rows = cursor.fetchall()
+    # 같은 링크가 여러 날짜에 있으면 최신 분석 날짜의 행이 먼저 오므로 호출 측의 중복 제거에서 우선됨
+    return [{
+        'article_id': row['id'] if row['analysis_day'] == analysis_day else None,
+        'title': row['title'],
+        'link': row['link'],
+        'description': row['original_text'] or '',
+        'pubDate': kst_timezone.localize(row['pub_date']).isoformat(),
+        'original_text': row['original_text'] or ''
+    } for row in rows]
+
 # --- MySQL 연결 및 데이터 저장 함수 ---
-def save_results_to_mysql(conn, doc_topic_df, topic_info_df, current_analysis_date):
+def iter_batches(items, batch_size):
+    for i in range(0, len(items), batch_size):
+        yield items[i:i + batch_size]
+
+def fetch_article_ids_by_link(cursor, links, analysis_day, batch_size=DB_LOOKUP_BATCH_SIZE):
+    """
+    분석 날짜(analysis_day) 파티션에서 링크 목록의 기사 ID를 WHERE link IN (...) 쿼리 몇 번으로 조회하여
+    {link: id}로 반환합니다.
+    """
+    article_id_map = {}
+    for batch in iter_batches(list(links), batch_size):
+        placeholders = ', '.join(['%s'] * len(batch))
+        cursor.execute(
+            f"SELECT id, link FROM news_articles WHERE analysis_day = %s AND link IN ({placeholders});",
+            [analysis_day] + batch
+        )
+        for row in cursor.fetchall():
+            article_id_map[row['link']] = row['id']
+    return article_id_map
+
+def build_article_terms(processed_text, processed_title, alpha_terms=()):
+    """
+    전처리된 본문/제목 토큰과 영문 토큰(extract_alpha_terms)의 빈도를 {토큰: 빈도}로 반환합니다.
+    (article_terms 키워드 검색 색인용)
+    """
+    term_frequency = {}
+    for term in f"{processed_text} {processed_title}".split() + list(alpha_terms):
+        if len(term) <= ARTICLE_TERM_MAX_LENGTH:
+            term_frequency[term] = term_frequency.get(term, 0) + 1
+    return term_frequency
+
+def build_topic_keywords(body_terms, article_topics, top_k=TOPIC_KEYWORDS_TOP_K):
+    """
+    기사별 본문 토큰 빈도를 토픽별로 합산하여 {topic_id: [(키워드, 빈도), ...]} (빈도 내림차순 상위 top_k개)를 반환합니다.
+    노이즈 토픽(-1)도 포함합니다.
+    (검색 색인용 article_terms는 제목 토큰을 더하므로 쓰지 않음. 제목이 본문에 다시 나오면 두 번 세어짐)
+    """
+    topic_frequencies = {}
+    for article_id, term_frequency in body_terms.items():
+        topic_frequency = topic_frequencies.setdefault(article_topics[article_id], {})
+        for term, tf in term_frequency.items():
+            topic_frequency[term] = topic_frequency.get(term, 0) + tf
+    return {
+        topic_id: sorted(frequency.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+        for topic_id, frequency in topic_frequencies.items()
+    }
+
+def save_results_to_mysql(conn, doc_topic_df, topic_info_df, current_analysis_date, batch_size=DB_WRITE_BATCH_SIZE,
+                          embeddings=None, topic_keyword_weights=None):
+    """
+    기사, 기사 본문, 토픽 할당 결과, 토픽 정보를 하나의 트랜잭션으로 저장합니다.
+    기사 메타데이터는 batch_size 단위의 다중 행 INSERT ... ON DUPLICATE KEY UPDATE로 저장하고,
+    기사 ID는 저장 후 WHERE link IN (...) 조회로 한꺼번에 가져온 뒤 본문을 news_article_bodies에 저장합니다.
+    같은 날짜에 다시 실행하면 그 날짜의 토픽 할당 결과와 토픽 정보를 이번 실행 결과로 교체합니다.
+    (토픽 ID는 실행마다 다시 매겨지므로 이전 실행의 결과와 섞이면 안 됨)
+    embeddings(doc_topic_df와 같은 순서)와 topic_keyword_weights(topic_model.get_topics())가 주어지면
+    오늘의 토픽을 전역 토픽(global_topic_id)에 연결하고, 커밋 후 관련 기사 검색용 임베딩 샤드를 저장합니다.
+    중간에 오류가 나면 전체를 롤백하고 예외를 다시 발생시킵니다.
+    실제로 저장한 행 수를 {'saved_articles', 'saved_bodies', 'saved_assignments', 'saved_topics', 'saved_terms'}로 반환합니다.
+    (기사 ID를 찾지 못한 행은 저장하지 않으므로 doc_topic_df의 행 수와 다를 수 있음)
+    """
     cursor = conn.cursor()
+    try:
+        # 1. news_articles 테이블에 기사 메타데이터 저장 (또는 링크가 존재하는 경우 업데이트)
+        # 목록 조회가 본문(LONGTEXT) 페이지를 읽지 않도록 본문은 news_article_bodies에 따로 저장
+        print("뉴스 기사 정보를 DB에 저장 중...")
+        article_id_map = {} # link -> article_id 매핑
 
-    # 1. news_articles 테이블에 기사 저장 (또는 링크가 존재하는 경우 업데이트)
-    print("뉴스 기사 정보를 DB에 저장 중...")
-    article_id_map = {} # link -> article_id 매핑
-    
-    # 중복 삽입 방지를 위해 ON DUPLICATE KEY UPDATE 사용
-    insert_article_sql = """
-    INSERT INTO news_articles (title, link, description, pub_date, original_text, processed_text, analysis_date)
-    VALUES (%s, %s, %s, %s, %s, %s, %s)
-    ON DUPLICATE KEY UPDATE
-        title=VALUES(title),
-        description=VALUES(description),
-        pub_date=VALUES(pub_date),
-        original_text=VALUES(original_text),
-        processed_text=VALUES(processed_text);
-    """
-    
-    # 기존 기사 ID를 가져오거나 새로 삽입된 ID를 얻기 위해
-    select_article_id_sql = "SELECT id FROM news_articles WHERE link = %s;"
-    
-    articles_to_insert = []
-    for _, row in doc_topic_df.iterrows():
+        # 중복 삽입 방지를 위해 ON DUPLICATE KEY UPDATE 사용 (유니크 키: link + analysis_day)
+        # (pymysql의 executemany는 이 형태의 INSERT를 다중 행 VALUES 하나로 합쳐서 전송)
+        insert_article_sql = """
+        INSERT INTO news_articles (title, link, pub_date, analysis_date)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            title=VALUES(title),
+            pub_date=VALUES(pub_date);
+        """
+        insert_body_sql = """
+        INSERT INTO news_article_bodies (article_id, analysis_day, original_text, processed_text)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            original_text=VALUES(original_text),
+            processed_text=VALUES(processed_text);
+        """
+
+        articles_to_insert = []
+        bodies_by_link = {} # link -> (original_text, processed_text)
         # 네이버 API pubDate 포맷: 'Sat, 01 Jun 2024 23:30:00 +0900'
-        # MySQL DATETIME 포맷으로 변환
+        # 수집 시 ISO 포맷 문자열로 저장했으므로 다시 파싱하여 MySQL DATETIME으로 변환 (topic_results에도 함께 저장)
+        pub_dates_by_link = {}
+        for link, pub_date_str in zip(doc_topic_df['link'], doc_topic_df['pubDate']):
+            try:
+                pub_dates_by_link[link] = datetime.fromisoformat(pub_date_str).replace(tzinfo=None)
+            except (TypeError, ValueError):
+                pub_dates_by_link[link] = datetime.now() # 파싱 실패 시 현재 시간 사용 또는 오류 처리
+                print(f"Warning: Failed to parse pubDate '{pub_date_str}'. Using current time.")
+        for _, row in doc_topic_df.iterrows():
+            # 이전 실행에서 저장된 기사는 다시 upsert하지 않고 기존 ID를 그대로 사용
+            if 'article_id' in row and pd.notna(row['article_id']):
+                article_id_map[row['link']] = int(row['article_id'])
+                continue
+
+            pub_date_dt = pub_dates_by_link[row['link']]
+            articles_to_insert.append((row['title'], row['link'], pub_date_dt, current_analysis_date))
+            # 네이버 API의 description이 원문이므로 본문 테이블에 한 번만 저장
+            bodies_by_link[row['link']] = (row['original_text'], row['processed_text'])
+
+        for batch in iter_batches(articles_to_insert, batch_size):
+            cursor.executemany(insert_article_sql, batch)
+
+        # 새로 삽입되었거나 업데이트된 기사의 ID를 링크로 한꺼번에 조회
+        analysis_day = current_analysis_date.date()
+        article_id_map.update(fetch_article_ids_by_link(cursor, [article[1] for article in articles_to_insert], analysis_day))
+        print(f"{len(articles_to_insert)}개의 기사 정보 저장 또는 업데이트 완료. (기존 기사 {len(article_id_map) - len(articles_to_insert)}개 재사용)")
+
+        bodies_to_insert = [
+            (article_id_map[link], analysis_day, original_text, processed_text)
+            for link, (original_text, processed_text) in bodies_by_link.items()
+            if link in article_id_map
+        ]
+        for batch in iter_batches(bodies_to_insert, batch_size):
+            cursor.executemany(insert_body_sql, batch)
+        print(f"{len(bodies_to_insert)}개의 기사 본문 저장 완료.")
+
+        # 2. 같은 날짜의 이전 실행 결과 삭제 (재실행 시 교체)
+        # (analysis_day 조건으로 해당 날짜 파티션만 접근)
+        cursor.execute("DELETE FROM topic_results WHERE analysis_day = %s;", (analysis_day,))
+        replaced_results = cursor.rowcount
+        cursor.execute("DELETE FROM topic_info WHERE analysis_day = %s;", (analysis_day,))
+        cursor.execute("DELETE FROM article_terms WHERE analysis_day = %s;", (analysis_day,))
+        cursor.execute("DELETE FROM topic_keywords WHERE analysis_day = %s;", (analysis_day,))
+        cursor.execute("DELETE FROM topic_daily_rollup WHERE analysis_day = %s;", (analysis_day,))
+        if replaced_results:
+            print(f"같은 날짜의 이전 실행 결과 {replaced_results}건을 교체합니다.")
+
+        # 3. topic_results 테이블에 토픽 할당 결과 저장
+        # (article_id, analysis_date) 유니크 키로 한 실행 안에서도 기사당 한 행만 유지
+        print("토픽 할당 결과를 DB에 저장 중...")
+        # pub_date는 news_articles와 같은 값 (토픽별 최신 기사를 (analysis_day, topic_id, pub_date) 인덱스만으로 조회)
+        insert_topic_result_sql = """
+        INSERT INTO topic_results (article_id, topic_id, probability, analysis_date, pub_date)
+        VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            topic_id=VALUES(topic_id),
+            probability=VALUES(probability),
+            pub_date=VALUES(pub_date);
+        """
+        results_to_insert = []
+        for _, row in doc_topic_df.iterrows():
+            article_id = article_id_map.get(row['link'])
+            if article_id:
+                results_to_insert.append((
+                    article_id, int(row['topic']), float(row['probability']), current_analysis_date, pub_dates_by_link[row['link']]
+                ))
+
+        for batch in iter_batches(results_to_insert, batch_size):
+            cursor.executemany(insert_topic_result_sql, batch)
+        print(f"{len(results_to_insert)}개의 토픽 할당 결과 저장 완료.")
+
+        # 4. topic_info 테이블에 토픽 정보 저장
+        print("토픽 정보를 DB에 저장 중...")
+        insert_topic_info_sql = """
+        INSERT INTO topic_info (topic_id, topic_count, article_count, topic_name, representation, analysis_date)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            topic_count=VALUES(topic_count),
+            article_count=VALUES(article_count),
+            topic_name=VALUES(topic_name),
+            representation=VALUES(representation);
+        """
+        # topic_count는 BERTopic이 계산한 문서 수, article_count는 노이즈 재할당 후 실제로 저장된 기사 수
+        article_counts = {}
+        probability_sums = {}
+        for article_id, topic_id, probability, _, _ in results_to_insert:
+            article_counts[topic_id] = article_counts.get(topic_id, 0) + 1
+            probability_sums[topic_id] = probability_sums.get(topic_id, 0.0) + probability
+        info_to_insert = []
+        rollup_to_insert = []
+        for _, row in topic_info_df.iterrows():
+            # Representation 리스트를 JSON 문자열로 변환하여 저장
+            # 비어있으면 '[]'로 저장
+            representation = row['Representation']
+            if not representation or (isinstance(representation, float) and pd.isna(representation)):
+                representation_str = "[]"
+            else:
+                representation_str = json.dumps(representation, ensure_ascii=False)
+            info_to_insert.append((
+                int(row['Topic']), int(row['Count']), article_counts.get(int(row['Topic']), 0),
+                row['Name'], representation_str, current_analysis_date
+            ))
+            article_count = article_counts.get(int(row['Topic']), 0)
+            mean_probability = probability_sums.get(int(row['Topic']), 0.0) / article_count if article_count else None
+            rollup_to_insert.append((
+                analysis_day, int(row['Topic']), row['Name'], article_count, mean_probability, representation_str
+            ))
+
+        for batch in iter_batches(info_to_insert, batch_size):
+            cursor.executemany(insert_topic_info_sql, batch)
+        print(f"{len(info_to_insert)}개의 토픽 정보 저장 완료.")
+
+        # 5. article_terms 테이블에 키워드 검색 색인 (토큰 -> 기사 ID, 빈도) 저장
+        print("키워드 검색 색인을 DB에 저장 중...")
+        insert_term_sql = """
+        INSERT INTO article_terms (analysis_day, term, article_id, tf)
+        VALUES (%s, %s, %s, %s);
+        """
+        terms_to_insert = []
+        article_terms = {} # article_id -> {토큰: 빈도} (역색인 파일 작성용)
+        body_terms = {} # article_id -> {본문 토큰: 빈도} (토픽별 키워드 빈도용)
+        article_topics = {} # article_id -> topic_id
+        for _, row in doc_topic_df.iterrows():
+            article_id = article_id_map.get(row['link'])
+            if not article_id:
+                continue
+            alpha_terms = extract_alpha_terms(clean_text(f"{row['title']} {row['original_text']}"))
+            term_frequency = build_article_terms(row['processed_text'], row.get('processed_title', ''), alpha_terms)
+            article_terms[article_id] = term_frequency
+            body_terms[article_id] = build_article_terms(row['processed_text'], '')
+            article_topics[article_id] = int(row['topic'])
+            for term, tf in term_frequency.items():
+                terms_to_insert.append((analysis_day, term, article_id, tf))
+
+        for batch in iter_batches(terms_to_insert, batch_size):
+            cursor.executemany(insert_term_sql, batch)
+        print(f"{len(terms_to_insert)}개의 검색 색인 항목 저장 완료.")
+
+        # 6. topic_keywords 테이블에 토픽별 상위 본문 키워드 빈도 저장 (키워드 빈도 조회 시 다시 계산하지 않도록)
+        insert_topic_keyword_sql = """
+        INSERT INTO topic_keywords (analysis_day, topic_id, keyword_rank, keyword, frequency)
+        VALUES (%s, %s, %s, %s, %s);
+        """
+        keywords_to_insert = []
+        for topic_id, keywords in build_topic_keywords(body_terms, article_topics).items():
+            for rank, (keyword, frequency) in enumerate(keywords, start=1):
+                keywords_to_insert.append((analysis_day, topic_id, rank, keyword, frequency))
+
+        for batch in iter_batches(keywords_to_insert, batch_size):
+            cursor.executemany(insert_topic_keyword_sql, batch)
+        print(f"{len(keywords_to_insert)}개의 토픽 키워드 빈도 저장 완료.")
+
+        # 7. 오늘의 토픽을 이전 날짜의 전역 토픽과 연결 (토픽 ID는 매일 다시 매겨지므로 날짜 간 추적용 ID 부여)
+        global_topic_map = {}
+        if embeddings is not None and topic_keyword_weights is not None:
+            print("토픽 연결(global_topic_id) 계산 중...")
+            topic_descriptors = build_topic_descriptors(doc_topic_df, embeddings, topic_keyword_weights)
+            topic_names = {int(row['Topic']): row['Name'] for _, row in topic_info_df.iterrows()}
+            global_topic_map = assign_global_topics(cursor, analysis_day, topic_descriptors, topic_names)
+
+        # 8. topic_daily_rollup 테이블에 이번 분석 날짜의 토픽별 집계 저장
+        # (트렌드 조회는 기사 행을 다시 집계하지 않고 날짜 x 토픽 행만 읽음)
+        insert_rollup_sql = """
+        INSERT INTO topic_daily_rollup (analysis_day, topic_id, global_topic_id, topic_name, article_count, mean_probability, top_keywords)
+        VALUES (%s, %s, %s, %s, %s, %s, %s);
+        """
+        rollup_to_insert = [
+            (day, topic_id, global_topic_map.get(topic_id), topic_name, article_count, mean_probability, top_keywords)
+            for day, topic_id, topic_name, article_count, mean_probability, top_keywords in rollup_to_insert
+        ]
+        for batch in iter_batches(rollup_to_insert, batch_size):
+            cursor.executemany(insert_rollup_sql, batch)
+        print(f"{len(rollup_to_insert)}개의 일별 토픽 집계 저장 완료.")
+
+        # 모든 테이블의 변경 사항을 한 번에 커밋
+        conn.commit()
+        saved_counts = {
+            'saved_articles': len(articles_to_insert),
+            'saved_bodies': len(bodies_to_insert),
+            'saved_assignments': len(results_to_insert),
+            'saved_topics': len(info_to_insert),
+            'saved_terms': len(terms_to_insert)
+        }
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    # DB에 커밋된 결과와 같은 내용으로 역색인/임베딩 파일 교체 (파일 작성 실패는 분석 결과에 영향을 주지 않음)
+    if POSTINGS_INDEX_ENABLED:
         try:
-            # pubDate_dt는 ISO 포맷으로 저장된 문자열이므로, 다시 파싱
-            pub_date_dt = datetime.fromisoformat(row['pubDate']).replace(tzinfo=None) 
-        except ValueError:
-            pub_date_dt = datetime.now() # 파싱 실패 시 현재 시간 사용 또는 오류 처리
-            print(f"Warning: Failed to parse pubDate '{row['pubDate']}'. Using current time.")
-
-        articles_to_insert.append((
-            row['title'], row['link'], row['original_text'], # description과 original_text를 동일하게 사용
-            pub_date_dt,
-            row['original_text'], row['processed_text'], current_analysis_date
-        ))
-        
-    # executemany로 한 번에 여러 행 삽입 (효율성)
-    # 하지만 ON DUPLICATE KEY UPDATE를 사용하면서 lastrowid를 개별적으로 얻기 어렵습니다.
-    # 따라서, 각 행을 개별적으로 삽입하고 ID를 가져오는 방식으로 변경합니다.
-    for article_data in articles_to_insert:
-        link = article_data[1] # link 값은 튜플의 두 번째 요소
-        cursor.execute(insert_article_sql, article_data)
-        # MySQL에 ON DUPLICATE KEY UPDATE가 발생했을 때 lastrowid는 0을 반환합니다.
-        # 따라서, 기존 ID를 가져오기 위한 추가 쿼리가 필요합니다.
-        if cursor.rowcount == 0: # rowcount가 0이면 업데이트가 발생한 것 (이미 존재하는 링크)
-            cursor.execute(select_article_id_sql, (link,))
-            article_id = cursor.fetchone()['id']
-        else: # rowcount가 1이면 새로운 삽입 발생
-            article_id = cursor.lastrowid
-        article_id_map[link] = article_id
-    
-    conn.commit()
-    print(f"{len(article_id_map)}개의 기사 정보 저장 또는 업데이트 완료.")
+            index_dir = write_postings_index(POSTINGS_INDEX_DIR, analysis_day, article_terms, article_topics)
+            print(f"역색인 파일 저장 완료: {index_dir}")
+        except OSError as e:
+            print(f"역색인 파일 저장 중 오류 발생: {e}")
+    if VECTOR_INDEX_ENABLED and embeddings is not None:
+        try:
+            shard_article_ids = []
+            shard_rows = []
+            for position, link in enumerate(doc_topic_df['link']):
+                if link in article_id_map:
+                    shard_article_ids.append(article_id_map[link])
+                    shard_rows.append(position)
+            shard_dir = write_vector_shard(VECTOR_INDEX_DIR, analysis_day, shard_article_ids, embeddings[shard_rows])
+            print(f"임베딩 샤드 저장 완료: {shard_dir}")
+        except OSError as e:
+            print(f"임베딩 샤드 저장 중 오류 발생: {e}")
+    return saved_counts
 
-    # 2. topic_results 테이블에 토픽 할당 결과 저장
-    print("토픽 할당 결과를 DB에 저장 중...")
-    insert_topic_result_sql = """
-    INSERT INTO topic_results (article_id, topic_id, probability, analysis_date)
-    VALUES (%s, %s, %s, %s);
+# --- 분석 날짜별 역색인 파일 ---
+def write_postings_index(directory, analysis_day, article_terms, article_topics):
     """
-    results_to_insert = []
-    for _, row in doc_topic_df.iterrows():
-        article_id = article_id_map.get(row['link'])
-        if article_id:
-            results_to_insert.append((article_id, int(row['topic']), float(row['probability']), current_analysis_date))
-    
-    if results_to_insert:
-        # executemany는 여러 행을 효율적으로 삽입
-        cursor.executemany(insert_topic_result_sql, results_to_insert)
-    conn.commit()
-    print(f"{len(results_to_insert)}개의 토픽 할당 결과 저장 완료.")
+    분석 날짜 하나의 역색인을 <directory>/<YYYY-MM-DD>/ 아래 파일로 저장하고 경로를 반환합니다.
+      terms.json               정렬된 토큰 목록 (i번째 토큰의 posting은 offsets[i]:offsets[i+1])
+      offsets.npy              int64, 토큰 수 + 1
+      postings_article_ids.npy int32, 토큰별로 기사 ID 오름차순
+      postings_tf.npy          uint16, 위 기사에서의 토큰 빈도
+      article_ids.npy          int32, 색인된 기사 ID (오름차순)
+      article_topics.npy       int32, article_ids와 같은 순서의 토픽 ID
+      manifest.json            건수와 생성 시각 (마지막에 기록, 읽는 쪽의 갱신 확인용)
+    모든 배열은 np.load(mmap_mode='r')로 바로 읽을 수 있습니다. 임시 디렉터리에 쓴 뒤 교체하여 읽는 쪽이 중간 상태를 보지 않음.
+    """
+    day_str = analysis_day.isoformat()
+    final_dir = os.path.join(directory, day_str)
+    tmp_dir = os.path.join(directory, f".{day_str}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
 
-    # 3. topic_info 테이블에 토픽 정보 저장
-    print("토픽 정보를 DB에 저장 중...")
-    insert_topic_info_sql = """
-    INSERT INTO topic_info (topic_id, topic_count, topic_name, representation, analysis_date)
-    VALUES (%s, %s, %s, %s, %s)
-    ON DUPLICATE KEY UPDATE
-        topic_count=VALUES(topic_count),
-        topic_name=VALUES(topic_name),
-        representation=VALUES(representation);
-    """
-    info_to_insert = []
-    for _, row in topic_info_df.iterrows():
-        # Representation 리스트를 JSON 문자열로 변환하여 저장
-        # 비어있으면 '[]'로 저장
-        representation = row['Representation']
-        if not representation or (isinstance(representation, float) and pd.isna(representation)):
-            representation_str = "[]"
+    postings = {} # 토큰 -> [(article_id, tf), ...]
+    for article_id in sorted(article_terms):
+        for term, tf in article_terms[article_id].items():
+            postings.setdefault(term, []).append((article_id, tf))
+    terms = sorted(postings)
+
+    offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+    for i, term in enumerate(terms):
+        offsets[i + 1] = offsets[i] + len(postings[term])
+    postings_article_ids = np.fromiter(
+        (article_id for term in terms for article_id, _ in postings[term]), dtype=np.int32, count=int(offsets[-1])
+    )
+    postings_tf = np.fromiter(
+        (min(tf, np.iinfo(np.uint16).max) for term in terms for _, tf in postings[term]), dtype=np.uint16, count=int(offsets[-1])
+    )
+    article_ids = np.array(sorted(article_terms), dtype=np.int32)
+    topics = np.array([article_topics.get(int(article_id), -1) for article_id in article_ids], dtype=np.int32)
+
+    with open(os.path.join(tmp_dir, 'terms.json'), 'w', encoding='utf-8') as f:
+        json.dump(terms, f, ensure_ascii=False)
+    np.save(os.path.join(tmp_dir, 'offsets.npy'), offsets)
+    np.save(os.path.join(tmp_dir, 'postings_article_ids.npy'), postings_article_ids)
+    np.save(os.path.join(tmp_dir, 'postings_tf.npy'), postings_tf)
+    np.save(os.path.join(tmp_dir, 'article_ids.npy'), article_ids)
+    np.save(os.path.join(tmp_dir, 'article_topics.npy'), topics)
+    with open(os.path.join(tmp_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump({
+            'analysis_day': day_str,
+            'terms': len(terms),
+            'postings': int(offsets[-1]),
+            'articles': int(len(article_ids)),
+            'created_at': datetime.now().isoformat()
+        }, f)
+
+    replace_day_directory(directory, day_str, tmp_dir)
+    return final_dir
+
+def replace_day_directory(directory, day_str, tmp_dir):
+    """임시 디렉터리에 다 쓴 날짜별 파일을 <directory>/<day_str>로 교체합니다. (기존 디렉터리를 치운 뒤 이름 변경)"""
+    final_dir = os.path.join(directory, day_str)
+    old_dir = os.path.join(directory, f".{day_str}.old")
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if os.path.exists(final_dir):
+        os.replace(final_dir, old_dir)
+    os.replace(tmp_dir, final_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+# --- 분석 날짜별 임베딩 샤드 (관련 기사 검색용) ---
+def normalize_rows(matrix):
+    """행마다 L2 정규화한 float32 행렬을 반환합니다. (영벡터는 그대로)"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+def build_ivf_lists(vectors, n_lists, iterations=VECTOR_INDEX_KMEANS_ITERATIONS, seed=0):
+    """
+    정규화된 벡터를 구면 k-means로 n_lists개 목록에 나누고 (중심 행렬, 행별 목록 번호)를 반환합니다.
+    검색 시 질의와 가까운 몇 개 목록만 비교하여 전체 비교를 피하기 위한 IVF 색인
+    """
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), size=n_lists, replace=False)].copy()
+    assignments = np.zeros(len(vectors), dtype=np.int32)
+    for _ in range(iterations):
+        assignments = np.argmax(vectors @ centroids.T, axis=1).astype(np.int32)
+        for list_id in range(n_lists):
+            members = vectors[assignments == list_id]
+            if len(members):
+                centroids[list_id] = members.sum(axis=0)
+        centroids = normalize_rows(centroids)
+    return centroids, assignments
+
+def write_vector_shard(directory, analysis_day, article_ids, embeddings, model_name=EMBEDDING_MODEL_NAME):
+    """
+    분석 날짜 하나의 기사 임베딩을 <directory>/<YYYY-MM-DD>/ 아래 파일로 저장하고 경로를 반환합니다.
+      vectors.npy      float32, L2 정규화된 임베딩 (IVF 목록 순서로 정렬)
+      article_ids.npy  int32, vectors와 같은 순서의 기사 ID
+      centroids.npy    float32, IVF 목록 중심 (목록 수 x 차원)
+      list_offsets.npy int64, i번째 목록의 행은 list_offsets[i]:list_offsets[i+1]
+      manifest.json    건수, 임베딩 모델 이름, 생성 시각 (마지막에 기록)
+    실행마다 해당 날짜 샤드만 새로 쓰므로 이전 날짜의 색인은 그대로 재사용됩니다.
+    """
+    day_str = analysis_day.isoformat()
+    tmp_dir = os.path.join(directory, f".{day_str}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    vectors = normalize_rows(embeddings)
+    article_ids = np.asarray(article_ids, dtype=np.int32)
+    n_lists = max(1, min(len(vectors), int(np.sqrt(len(vectors)))))
+    if len(vectors):
+        centroids, assignments = build_ivf_lists(vectors, n_lists)
+    else:
+        centroids, assignments = np.zeros((0, vectors.shape[1]), dtype=np.float32), np.zeros(0, dtype=np.int32)
+    order = np.argsort(assignments, kind='stable')
+    list_offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+    list_offsets[1:] = np.cumsum(np.bincount(assignments, minlength=len(centroids)))
+
+    np.save(os.path.join(tmp_dir, 'vectors.npy'), vectors[order])
+    np.save(os.path.join(tmp_dir, 'article_ids.npy'), article_ids[order])
+    np.save(os.path.join(tmp_dir, 'centroids.npy'), centroids.astype(np.float32))
+    np.save(os.path.join(tmp_dir, 'list_offsets.npy'), list_offsets)
+    with open(os.path.join(tmp_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump({
+            'analysis_day': day_str,
+            'articles': int(len(article_ids)),
+            'dim': int(vectors.shape[1]),
+            'lists': int(len(centroids)),
+            'model': model_name,
+            'created_at': datetime.now().isoformat()
+        }, f)
+
+    replace_day_directory(directory, day_str, tmp_dir)
+    return os.path.join(directory, day_str)
+
+# --- 날짜 간 토픽 연결 (topic lineage) ---
+def build_topic_descriptors(doc_topic_df, embeddings, topic_keyword_weights):
+    """
+    오늘의 토픽별 (중심 임베딩, c-TF-IDF 키워드 가중치)를 {topic_id: {'centroid', 'keywords'}}로 반환합니다.
+    중심은 토픽에 할당된 문서의 정규화된 임베딩 평균입니다. (노이즈 토픽 제외)
+    """
+    vectors = normalize_rows(embeddings)
+    topics = np.asarray(doc_topic_df['topic'], dtype=np.int64)
+    descriptors = {}
+    for topic_id in np.unique(topics):
+        if topic_id == -1:
+            continue
+        centroid = vectors[topics == topic_id].mean(axis=0)
+        descriptors[int(topic_id)] = {
+            'centroid': centroid / (np.linalg.norm(centroid) or 1.0),
+            'keywords': {word: float(weight) for word, weight in topic_keyword_weights.get(int(topic_id), []) if word}
+        }
+    return descriptors
+
+def keyword_matrix(keyword_dicts, vocabulary):
+    """키워드 가중치 사전 목록을 공통 어휘 기준의 L2 정규화된 행렬로 변환합니다."""
+    matrix = np.zeros((len(keyword_dicts), len(vocabulary)), dtype=np.float32)
+    for row, keywords in enumerate(keyword_dicts):
+        for word, weight in keywords.items():
+            matrix[row, vocabulary[word]] = weight
+    return normalize_rows(matrix)
+
+def match_topics(day_centroids, day_keywords, global_centroids, global_keywords,
+                 threshold=TOPIC_LINEAGE_MATCH_THRESHOLD, centroid_weight=TOPIC_LINEAGE_CENTROID_WEIGHT):
+    """
+    오늘의 토픽과 전역 토픽의 유사도 행렬을 한 번에 계산한 뒤, 유사도가 높은 쌍부터 1:1로 연결합니다.
+    [(오늘 토픽 위치, 전역 토픽 위치 또는 None, 유사도), ...]를 오늘 토픽 순서대로 반환합니다.
+    """
+    matches = [(i, None, 0.0) for i in range(len(day_centroids))]
+    if not len(day_centroids) or not len(global_centroids):
+        return matches
+    vocabulary = {}
+    for keywords in list(day_keywords) + list(global_keywords):
+        for word in keywords:
+            vocabulary.setdefault(word, len(vocabulary))
+    similarity = centroid_weight * (np.asarray(day_centroids) @ np.asarray(global_centroids).T)
+    if vocabulary:
+        similarity += (1 - centroid_weight) * (keyword_matrix(day_keywords, vocabulary) @ keyword_matrix(global_keywords, vocabulary).T)
+
+    used_day, used_global = set(), set()
+    for flat_position in np.argsort(-similarity, axis=None):
+        i, j = np.unravel_index(flat_position, similarity.shape)
+        if similarity[i, j] < threshold:
+            break
+        if i in used_day or j in used_global:
+            continue
+        used_day.add(i)
+        used_global.add(j)
+        matches[i] = (int(i), int(j), float(similarity[i, j]))
+    return matches
+
+def assign_global_topics(cursor, analysis_day, topic_descriptors, topic_names):
+    """
+    오늘의 토픽을 최근 전역 토픽(global_topics)과 연결하고, 연결되지 않은 토픽은 새 전역 토픽으로 등록합니다.
+    topic_lineage에 (분석 날짜, 토픽 ID) -> global_topic_id를 저장하고 {topic_id: global_topic_id}를 반환합니다.
+    전역 토픽은 오늘 반영하기 전의 상태(previous_*)를 함께 저장하므로, 같은 날짜에 다시 실행하면
+    먼저 그 상태로 되돌린 뒤 다시 계산합니다. (중심 임베딩 이동 평균을 하루에 한 번만 적용)
+    그 날짜에 새로 만든 전역 토픽은 다시 실행해도 ID를 유지하도록 비교 대상에 남기고, 다시 연결되지 않은 것만 삭제합니다.
+    """
+    cursor.execute("DELETE FROM topic_lineage WHERE analysis_day = %s;", (analysis_day,))
+    cursor.execute("""
+    UPDATE global_topics
+    SET label = previous_label, last_seen = previous_last_seen, centroid = previous_centroid, keywords = previous_keywords
+    WHERE last_seen = %s AND first_seen < %s AND previous_centroid IS NOT NULL;
+    """, (analysis_day, analysis_day))
+    if not topic_descriptors:
+        cursor.execute("DELETE FROM global_topics WHERE first_seen = %s;", (analysis_day,))
+        return {}
+
+    cursor.execute("""
+    SELECT global_topic_id, label, first_seen, last_seen, centroid, keywords FROM global_topics
+    WHERE last_seen >= %s;
+    """, (analysis_day - timedelta(days=TOPIC_LINEAGE_LOOKBACK_DAYS),))
+    day_topic_ids = sorted(topic_descriptors)
+    dim = len(topic_descriptors[day_topic_ids[0]]['centroid'])
+    global_rows = []
+    for row in cursor.fetchall():
+        centroid = np.frombuffer(row['centroid'], dtype=np.float32)
+        if len(centroid) == dim: # 임베딩 모델이 바뀌어 차원이 다르면 비교하지 않음
+            row['keywords'] = json.loads(row['keywords']) if row['keywords'] else {}
+            row['centroid'] = centroid
+            global_rows.append(row)
+
+    matches = match_topics(
+        [topic_descriptors[t]['centroid'] for t in day_topic_ids],
+        [topic_descriptors[t]['keywords'] for t in day_topic_ids],
+        [row['centroid'] for row in global_rows],
+        [row['keywords'] for row in global_rows]
+    )
+
+    global_topic_map = {}
+    lineage_rows = []
+    for day_position, global_position, similarity in matches:
+        topic_id = day_topic_ids[day_position]
+        descriptor = topic_descriptors[topic_id]
+        day_centroid = np.asarray(descriptor['centroid'], dtype=np.float32)
+        keywords_json = json.dumps(descriptor['keywords'], ensure_ascii=False)
+        if global_position is None:
+            cursor.execute("""
+            INSERT INTO global_topics (label, first_seen, last_seen, centroid, keywords)
+            VALUES (%s, %s, %s, %s, %s);
+            """, (topic_names.get(topic_id), analysis_day, analysis_day, day_centroid.tobytes(), keywords_json))
+            global_topic_id = cursor.lastrowid
+        elif global_rows[global_position]['first_seen'] == analysis_day:
+            # 이전 실행에서 오늘 새로 만든 전역 토픽: 이전 상태가 없으므로 오늘의 토픽으로 다시 채움
+            global_topic_id = global_rows[global_position]['global_topic_id']
+            cursor.execute("""
+            UPDATE global_topics SET label = %s, centroid = %s, keywords = %s
+            WHERE global_topic_id = %s;
+            """, (topic_names.get(topic_id), day_centroid.tobytes(), keywords_json, global_topic_id))
         else:
-            representation_str = json.dumps(representation, ensure_ascii=False)
-        info_to_insert.append((
-            int(row['Topic']), int(row['Count']), row['Name'], representation_str, current_analysis_date
-        ))
-    
-    if info_to_insert:
-        cursor.executemany(insert_topic_info_sql, info_to_insert)
-    conn.commit()
-    print(f"{len(info_to_insert)}개의 토픽 정보 저장 완료.")
-    
-    cursor.close()
+            previous = global_rows[global_position]
+            global_topic_id = previous['global_topic_id']
+            centroid = TOPIC_LINEAGE_CENTROID_MOMENTUM * previous['centroid'] + (1 - TOPIC_LINEAGE_CENTROID_MOMENTUM) * day_centroid
+            centroid = centroid / (np.linalg.norm(centroid) or 1.0)
+            cursor.execute("""
+            UPDATE global_topics
+            SET label = %s, last_seen = %s, centroid = %s, keywords = %s,
+                previous_label = %s, previous_last_seen = %s, previous_centroid = %s, previous_keywords = %s
+            WHERE global_topic_id = %s;
+            """, (topic_names.get(topic_id), analysis_day, centroid.astype(np.float32).tobytes(), keywords_json,
+                  previous['label'], previous['last_seen'], previous['centroid'].tobytes(),
+                  json.dumps(previous['keywords'], ensure_ascii=False), global_topic_id))
+        global_topic_map[topic_id] = global_topic_id
+        lineage_rows.append((analysis_day, topic_id, global_topic_id, similarity))
+
+    cursor.executemany("""
+    INSERT INTO topic_lineage (analysis_day, topic_id, global_topic_id, similarity)
+    VALUES (%s, %s, %s, %s);
+    """, lineage_rows)
+    # 이전 실행에서 오늘 새로 만들었지만 이번에는 연결되지 않은 전역 토픽 삭제
+    placeholders = ', '.join(['%s'] * len(global_topic_map))
+    cursor.execute(
+        f"DELETE FROM global_topics WHERE first_seen = %s AND global_topic_id NOT IN ({placeholders});",
+        [analysis_day] + list(global_topic_map.values())
+    )
+    matched = sum(
+        1 for _, global_position, _ in matches
+        if global_position is not None and global_rows[global_position]['first_seen'] < analysis_day
+    )
+    print(f"토픽 연결 완료: 기존 전역 토픽 연결 {matched}개, 새 전역 토픽 {len(matches) - matched}개")
+    return global_topic_map
 
 # --- 메인 분석 함수 ---
-def run_daily_analysis():
+def record_stage(stats, stage, started, on_stage=None, **counts):
+    """
+    단계별 소요 시간(초)과 처리 건수를 stats에 기록합니다. (stats가 None이면 무시)
+    on_stage(stage, stats)가 주어지면 기록한 뒤 호출합니다. (실행 중 진행 상황 전달용)
+    """
+    if stats is None:
+        return
+    stats.setdefault('stages', {})[stage] = round(time.perf_counter() - started, 3)
+    stats.setdefault('counts', {}).update(counts)
+    if on_stage is not None:
+        on_stage(stage, stats)
+
+def run_daily_analysis(stats=None, on_stage=None):
+    """
+    뉴스 수집부터 DB 저장까지 전체 분석을 실행합니다.
+    stats(dict)가 주어지면 단계별 소요 시간, 처리 건수, 모델 로드 시간, 오류를 기록하고,
+    on_stage(stage, stats)가 주어지면 단계(collect, preprocess, embed, topic_model, save)가 끝날 때마다 호출합니다.
+    """
     current_analysis_date = datetime.now() # 분석이 수행된 날짜 및 시간 기록
     print(f"[{current_analysis_date.strftime('%Y-%m-%d %H:%M:%S')}] 일일 뉴스 분석 시작...")
+    model_registry = get_model_registry()
 
     conn = None
     try:
@@ -198,60 +1419,27 @@ def run_daily_analysis():
 
         # 주요 뉴스 키워드
         queries = ['경제', '사회', '정치', '국제', '문화', 'IT', '과학', '부동산', '증시', '인공지능', '환경', '교육', '건강']
-        all_articles = []
-        
         kst_timezone = pytz.timezone('Asia/Seoul')
         
         # 지난 24시간 이내 기사만 필터링 (Naver API의 pubDate는 RFC 2822 포맷, KST 기준)
         filter_start_time = datetime.now(kst_timezone) - timedelta(hours=24)
 
-        for q in queries:
-            current_start = 1
-            # 각 쿼리당 최대 1000개 기사 (네이버 API 제한)를 가져오면서 24시간 필터링
-            while current_start <= 1000:
-                items = get_naver_news_articles(q, display=100, start=current_start, sort='date')
-                if not items:
-                    break # 더 이상 기사가 없으면 중단
-                
-                new_articles_in_window = 0
-                for item in items:
-                    pub_date_str = item.get('pubDate')
-                    if pub_date_str:
-                        try:
-                            # 날짜 파싱 (RFC 2822 포맷)
-                            pub_date = datetime.strptime(pub_date_str, '%a, %d %b %Y %H:%M:%S %z')
-                            # 한국 시간대 +0900으로 변환 (네이버 기본)
-                            pub_date_kst = pub_date.astimezone(kst_timezone)
-                            
-                            # 24시간 이내 기사만 필터링
-                            if pub_date_kst >= filter_start_time:
-                                # HTML 엔티티를 일반 문자로 디코딩
-                                decoded_title = item.get('title', '').replace('&quot;', '"').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-                                decoded_description = item.get('description', '').replace('&quot;', '"').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-                                
-                                all_articles.append({
-                                    'title': decoded_title,
-                                    'link': item.get('link', ''),
-                                    'description': decoded_description, # description을 원문으로 사용
-                                    'pubDate': pub_date_kst.isoformat(), # ISO 포맷으로 저장
-                                    'original_text': decoded_description
-                                })
-                                new_articles_in_window += 1
-                            else:
-                                # 날짜순 정렬이므로, 24시간 범위를 벗어나면 이 쿼리에선 더 이상 최신 기사가 없음
-                                # 다음 쿼리로 넘어가거나, 굳이 더 이상 검색할 필요 없음 (효율성)
-                                pass 
-                        except ValueError as ve:
-                            print(f"날짜 파싱 오류: {pub_date_str} - {ve}")
-                        except Exception as ex:
-                            print(f"기사 처리 중 알 수 없는 오류: {ex}")
-                
-                # 현재 페이지에서 24시간 이내 기사가 없으면 다음 쿼리로 이동
-                if new_articles_in_window == 0:
-                    break
-                    
-                current_start += 100
-                time.sleep(0.1) # API 요청 간 지연
+        collection_state = load_collection_state(conn, kst_timezone) if INCREMENTAL_COLLECTION else {}
+
+        collect_started = time.perf_counter()
+        all_articles, new_collection_state = collect_news_articles(queries, filter_start_time, collection_state=collection_state)
+        print(f"뉴스 수집 완료: 신규 {len(all_articles)}개 ({time.perf_counter() - collect_started:.1f}초)")
+
+        collected_count = len(all_articles)
+
+        if INCREMENTAL_COLLECTION:
+            # 다시 수집하지 않은 24시간 이내 기사는 DB에서 가져와 분석에 포함
+            # 저장된 기사를 앞에 두어 중복 제거 시 기존 article_id가 유지되도록 함
+            stored_articles = load_stored_window_articles(conn, filter_start_time, current_analysis_date.date())
+            print(f"DB에 저장된 24시간 이내 기사 {len(stored_articles)}개 재사용")
+            all_articles = stored_articles + all_articles
+        record_stage(stats, 'collect', collect_started, on_stage, collected_articles=collected_count,
+                     reused_articles=len(all_articles) - collected_count)
 
         # 중복 기사 제거 (링크 기준으로)
         articles_df = pd.DataFrame(all_articles).drop_duplicates(subset=['link'])
@@ -264,39 +1452,69 @@ def run_daily_analysis():
         article_titles_final = articles_df_filtered_24h['title'].tolist()
         article_links_final = articles_df_filtered_24h['link'].tolist()
         article_pubdates_final = articles_df_filtered_24h['pubDate'].tolist() # ISO 포맷 문자열 그대로 전달
+        if 'article_id' in articles_df_filtered_24h.columns:
+            article_ids_final = articles_df_filtered_24h['article_id'].tolist() # 신규 기사는 NaN
+        else:
+            article_ids_final = [None] * len(original_documents_final)
 
         if not original_documents_final:
             print("수집된 뉴스 기사가 없습니다. 분석을 건너뜜.")
+            if stats is not None:
+                stats['skipped'] = "수집된 뉴스 기사가 없습니다."
             return
 
         print(f"총 {len(original_documents_final)}개의 24시간 이내 기사 수집 완료. 전처리 시작...")
 
-        processed_documents = [preprocess_korean_text(doc) for doc in original_documents_final]
+        preprocess_started = time.perf_counter()
+        preprocess_cache = get_preprocess_cache()
+        processed_documents = preprocess_documents(original_documents_final, pool=model_registry.get_preprocess_pool(), cache=preprocess_cache)
+        # 제목 토큰은 키워드 검색 색인(article_terms)에만 사용 (토픽 모델 입력에는 포함하지 않음)
+        processed_titles = preprocess_documents(article_titles_final, pool=model_registry.get_preprocess_pool(), cache=preprocess_cache)
+        print(f"전처리 완료 ({time.perf_counter() - preprocess_started:.1f}초)")
+        if preprocess_cache is not None:
+            print(f"전처리 캐시 통계: {preprocess_cache.stats()}")
+        record_stage(stats, 'preprocess', preprocess_started, on_stage, window_articles=len(original_documents_final))
 
         # 전처리 후 빈 문서 제거
         valid_original_docs = []
         valid_processed_docs = []
         valid_titles = []
+        valid_processed_titles = []
         valid_links = []
         valid_pubdates = []
+        valid_article_ids = []
         
         for i, doc in enumerate(processed_documents):
             if doc.strip(): # 빈 문자열이 아닌 경우에만 포함
                 valid_processed_docs.append(doc)
                 valid_original_docs.append(original_documents_final[i])
                 valid_titles.append(article_titles_final[i])
+                valid_processed_titles.append(processed_titles[i])
                 valid_links.append(article_links_final[i])
                 valid_pubdates.append(article_pubdates_final[i])
+                valid_article_ids.append(article_ids_final[i])
         
         if not valid_processed_docs:
             print("전처리 후 유효한 문서가 없습니다. 분석을 건너뜜.")
+            if stats is not None:
+                stats['skipped'] = "전처리 후 유효한 문서가 없습니다."
             return
 
         print(f"유효한 문서 {len(valid_processed_docs)}개로 토픽 모델링 시작...")
 
-        embedding_model = SentenceTransformer('jhgan/ko-sbert-nli')
+        # 모델 로드는 프로세스당 한 번만 수행되고 이후 실행에서는 재사용됨 (로드 시간은 추론 시간과 별도로 보고)
+        embedding_model = model_registry.get_embedding_model()
+        print(f"모델 로드 시간: {model_registry.load_times}")
+        if stats is not None:
+            stats['model_load_times'] = dict(model_registry.load_times)
+        # 이전 실행에서 계산한 임베딩은 저장소에서 읽고 새 문서만 인코딩
         # show_progress_bar는 터미널 실행 시 True로 두면 진행 상황을 볼 수 있음
-        embeddings = embedding_model.encode(valid_processed_docs, show_progress_bar=True)
+        embed_started = time.perf_counter()
+        embeddings, encoded_count = encode_with_store(embedding_model, valid_processed_docs, get_embedding_store(), show_progress_bar=True)
+        print(f"임베딩 완료: 신규 인코딩 {encoded_count}개 / 전체 {len(valid_processed_docs)}개 ({time.perf_counter() - embed_started:.1f}초)")
+        record_stage(stats, 'embed', embed_started, on_stage, valid_documents=len(valid_processed_docs), encoded_documents=encoded_count)
+
+        topic_started = time.perf_counter()
 
         topic_model = BERTopic(
             language="korean",
@@ -332,24 +1550,40 @@ def run_daily_analysis():
 
 
         freq = topic_model.get_topic_info()
+        record_stage(stats, 'topic_model', topic_started, on_stage, topics=int((freq['Topic'] != -1).sum()))
 
         doc_topic_df_for_db = pd.DataFrame({
+            'article_id': valid_article_ids, # 이전 실행에서 저장된 기사의 ID (신규 기사는 NaN)
             'title': valid_titles,
             'link': valid_links,
             'pubDate': valid_pubdates, # ISO 포맷 문자열
             'original_text': valid_original_docs,
             'processed_text': valid_processed_docs,
+            'processed_title': valid_processed_titles,
             'topic': topics, # reduce_outliers로 업데이트된 topics
             'probability': assigned_probabilities # 단일 확률 값 리스트
         })
 
         # DB에 결과 저장
-        save_results_to_mysql(conn, doc_topic_df_for_db, freq, current_analysis_date)
+        save_started = time.perf_counter()
+        saved_counts = save_results_to_mysql(
+            conn, doc_topic_df_for_db, freq, current_analysis_date,
+            embeddings=embeddings, topic_keyword_weights=topic_model.get_topics()
+        )
+
+        # 저장까지 끝난 뒤에만 high-water mark를 전진시켜, 실패한 실행의 기사는 다음 실행에서 다시 수집
+        if INCREMENTAL_COLLECTION:
+            save_collection_state(conn, new_collection_state)
+        record_stage(stats, 'save', save_started, on_stage, **saved_counts)
 
     except pymysql.Error as e:
         print(f"MySQL DB 연결 또는 작업 중 오류 발생: {e}")
+        if stats is not None:
+            stats['error'] = f"MySQL 오류: {e}"
     except Exception as e:
         print(f"분석 또는 DB 저장 중 심각한 오류 발생: {e}")
+        if stats is not None:
+            stats['error'] = str(e)
     finally:
         if conn:
             conn.close()
@@ -363,4 +1597,5 @@ if __name__ == "__main__":
     # print(os.path.exists('/System/Library/Fonts/AppleSDGothicNeo.ttc')) # macOS
     # print(os.path.exists('C:/Windows/Fonts/malgun.ttf')) # Windows
 
-    run_daily_analysis()
\ No newline at end of file
+    run_daily_analysis()
+    get_model_registry().shutdown()
\ No newline at end of file
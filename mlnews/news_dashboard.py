@@ -43,7 +43,7 @@ def fetch_analysis_dates(conn):
     try:
         with conn.cursor() as cursor:
             # 실제 기사가 존재하는 날짜만 고려합니다.
-            cursor.execute("SELECT DISTINCT DATE(analysis_date) AS analysis_date FROM news_articles ORDER BY analysis_date DESC;")
+            cursor.execute("SELECT DISTINCT analysis_day AS analysis_date FROM news_articles ORDER BY analysis_day DESC;")
             results = cursor.fetchall()
             return [row['analysis_date'] for row in results]
     except pymysql.Error as e:
@@ -61,10 +61,10 @@ def fetch_articles_and_topics_by_date_range(conn, start_date, end_date):
         with conn.cursor() as cursor:
             sql = """
             SELECT
-                DATE(na.analysis_date) AS analysis_day,
+                na.id AS article_id,
+                na.analysis_day,
                 na.title,
                 na.link,
-                na.description,
                 na.pub_date,
                 tr.topic_id,
                 tr.probability,
@@ -73,11 +73,11 @@ def fetch_articles_and_topics_by_date_range(conn, start_date, end_date):
             FROM
                 news_articles na
             JOIN
-                topic_results tr ON na.id = tr.article_id
+                topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
             LEFT JOIN
-                topic_info ti ON tr.topic_id = ti.topic_id AND DATE(ti.analysis_date) = DATE(na.analysis_date)
+                topic_info ti ON ti.analysis_day = na.analysis_day AND ti.topic_id = tr.topic_id
             WHERE
-                DATE(na.analysis_date) BETWEEN %s AND %s
+                na.analysis_day BETWEEN %s AND %s
             ORDER BY
                 na.analysis_date DESC, tr.probability DESC;
             """
@@ -94,9 +94,56 @@ def fetch_articles_and_topics_by_date_range(conn, start_date, end_date):
         st.error(f"기간별 기사 데이터 조회 오류: {e}")
         return pd.DataFrame()
 
+def fetch_topic_daily_rollup(conn, start_date, end_date):
+    """
+    지정된 날짜 범위의 날짜 x 토픽 집계(topic_daily_rollup)를 가져옵니다. (노이즈 토픽 제외)
+    기사 행을 읽지 않으므로 기간이 길어도 날짜 수 x 토픽 수만큼만 조회합니다.
+    trend_topic 컬럼은 날짜 간 같은 토픽을 묶는 이름입니다. (전역 토픽이 있으면 전역 토픽 기준, 없으면 토픽 이름)
+    """
+    if not conn:
+        return pd.DataFrame()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+            SELECT r.analysis_day, r.topic_id, r.global_topic_id, r.topic_name, r.article_count, r.mean_probability, r.top_keywords,
+                   g.label AS global_label
+            FROM topic_daily_rollup r
+            LEFT JOIN global_topics g ON g.global_topic_id = r.global_topic_id
+            WHERE r.analysis_day BETWEEN %s AND %s AND r.topic_id != -1
+            ORDER BY r.analysis_day;
+            """, (start_date, end_date))
+            df = pd.DataFrame(cursor.fetchall())
+            if 'top_keywords' in df.columns:
+                df['top_keywords'] = df['top_keywords'].apply(lambda x: json.loads(x) if x else [])
+            if not df.empty:
+                df['trend_topic'] = [
+                    f"[{int(global_topic_id)}] {global_label or topic_name}" if pd.notna(global_topic_id) else topic_name
+                    for global_topic_id, global_label, topic_name in zip(df['global_topic_id'], df['global_label'], df['topic_name'])
+                ]
+            return df
+    except pymysql.Error as e:
+        st.error(f"토픽 집계 데이터 조회 오류: {e}")
+        return pd.DataFrame()
+
+def fetch_article_body(conn, article_id, analysis_day):
+    """기사 한 건의 본문을 news_article_bodies에서 가져옵니다. (기사를 펼쳐 볼 때만 호출)"""
+    if not conn:
+        return None
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT original_text FROM news_article_bodies WHERE article_id = %s AND analysis_day = %s;",
+                (article_id, analysis_day)
+            )
+            row = cursor.fetchone()
+            return row['original_text'] if row else None
+    except pymysql.Error as e:
+        st.error(f"기사 본문 조회 오류: {e}")
+        return None
+
 # --- Streamlit 애플리케이션 함수 ---
 
-def display_topic_analysis_results(df, selected_date_for_display):
+def display_topic_analysis_results(conn, df, selected_date_for_display):
     """선택된 날짜의 토픽 분석 결과를 표시합니다 (막대 그래프, 키워드, 기사 목록)."""
     
     if df.empty:
@@ -170,7 +217,13 @@ def display_topic_analysis_results(df, selected_date_for_display):
         for index, row in display_articles_df.iterrows():
             with st.expander(f"**[{row['title']}]** (토픽: {row['topic_name']}, 확률: {row['probability']:.2f}) - {pd.to_datetime(row['pub_date']).strftime('%Y-%m-%d %H:%M:%S')}"):
                 st.markdown(f"**원본 링크**: [{row['link']}]({row['link']})")
-                st.markdown(f"**기사 요약**: {row['description']}")
+                # 본문은 목록 조회에 포함하지 않고, 버튼을 누른 기사만 페이지의 연결로 따로 조회
+                # (조회한 본문은 session_state에 보관하여 다른 위젯 조작으로 다시 실행되어도 계속 표시)
+                body_key = f"body_{row['article_id']}_{row['analysis_day']}"
+                if body_key not in st.session_state and st.button("기사 요약 보기", key=f"button_{body_key}"):
+                    st.session_state[body_key] = fetch_article_body(conn, row['article_id'], row['analysis_day'])
+                if body_key in st.session_state:
+                    st.markdown(f"**기사 요약**: {st.session_state[body_key] or '본문이 없습니다.'}")
             st.markdown("---")
     else:
         st.info("선택된 토픽에 해당하는 기사가 없습니다.")
@@ -190,7 +243,7 @@ def page_todays_topics(conn):
     st.info(f"분석 날짜: **{most_recent_date.strftime('%Y년 %m월 %d일')}**")
 
     recent_day_df = fetch_articles_and_topics_by_date_range(conn, most_recent_date, most_recent_date)
-    display_topic_analysis_results(recent_day_df, most_recent_date)
+    display_topic_analysis_results(conn, recent_day_df, most_recent_date)
 
 
 def page_topic_trend_over_time(conn):
@@ -228,34 +281,26 @@ def page_topic_trend_over_time(conn):
 
     st.info(f"분석 기간: **{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}**")
     
-    trend_df = fetch_articles_and_topics_by_date_range(conn, start_date, end_date)
+    # 날짜별, 토픽별 기사 수는 분석 시점에 집계된 topic_daily_rollup에서 가져옴 (노이즈 토픽 제외)
+    topic_daily_counts = fetch_topic_daily_rollup(conn, start_date, end_date)
 
-    if trend_df.empty:
-        st.warning("선택된 기간에 대한 뉴스 데이터가 없습니다.")
-        return
-
-    # 노이즈 토픽(-1) 필터링
-    trend_df_filtered = trend_df[trend_df['topic_id'] != -1].copy()
-
-    if not trend_df_filtered.empty:
-        # 날짜별, 토픽별 기사 수 집계
-        topic_daily_counts = trend_df_filtered.groupby(['analysis_day', 'topic_name']).size().reset_index(name='article_count')
-        
+    if not topic_daily_counts.empty:
         # 기간 내 전체 기사 수 기준으로 상위 10개 토픽 선정
-        top_topics_in_period = topic_daily_counts.groupby('topic_name')['article_count'].sum().nlargest(10).index.tolist()
+        # (토픽 ID는 날짜마다 새로 매겨지므로 날짜 간 같은 토픽은 전역 토픽 기준으로 묶음)
+        top_topics_in_period = topic_daily_counts.groupby('trend_topic')['article_count'].sum().nlargest(10).index.tolist()
         
         # 상위 토픽만 필터링
-        topic_daily_counts_top = topic_daily_counts[topic_daily_counts['topic_name'].isin(top_topics_in_period)]
+        topic_daily_counts_top = topic_daily_counts[topic_daily_counts['trend_topic'].isin(top_topics_in_period)]
 
         if not topic_daily_counts_top.empty:
             fig_trend = px.line(
                 topic_daily_counts_top,
                 x='analysis_day',
                 y='article_count',
-                color='topic_name',
+                color='trend_topic',
                 title='기간별 주요 토픽 기사 수 추이 (상위 10개 토픽)', # 제목 유지 (이미 상위 10개만 필터링)
-                labels={'analysis_day': '날짜', 'article_count': '기사 수', 'topic_name': '토픽 이름'},
-                hover_data={'topic_name': True, 'article_count': True}
+                labels={'analysis_day': '날짜', 'article_count': '기사 수', 'trend_topic': '토픽', 'topic_name': '토픽 이름'},
+                hover_data={'topic_name': True, 'article_count': True, 'mean_probability': ':.2f'}
             )
             fig_trend.update_layout(hovermode="x unified")
             st.plotly_chart(fig_trend, use_container_width=True)
@@ -284,7 +329,7 @@ def page_past_topics_from_db(conn):
     st.info(f"선택된 과거 분석 날짜: **{selected_past_date.strftime('%Y년 %m월 %d일')}**")
 
     past_day_df = fetch_articles_and_topics_by_date_range(conn, selected_past_date, selected_past_date)
-    display_topic_analysis_results(past_day_df, selected_past_date)
+    display_topic_analysis_results(conn, past_day_df, selected_past_date)
 
 
 # --- 메인 애플리케이션 실행 ---
@@ -44,16 +44,16 @@ def load_analysis_results_from_mysql(analysis_date_str):
         # analysis_date를 기준으로 데이터를 가져옴
         select_articles_sql = """
         SELECT
+            na.id AS article_id,
             na.title,
             na.link,
-            na.original_text,
             tr.topic_id AS topic,
             tr.probability,
             na.pub_date,
             na.analysis_date
         FROM news_articles na
-        JOIN topic_results tr ON na.id = tr.article_id
-        WHERE DATE(na.analysis_date) = %s;
+        JOIN topic_results tr ON tr.article_id = na.id AND tr.analysis_day = na.analysis_day
+        WHERE na.analysis_day = %s;
         """
         # read_sql의 params는 튜플 형태로 전달해야 함
         doc_topic_df = pd.read_sql(select_articles_sql, conn, params=(analysis_date.strftime('%Y-%m-%d'),))
@@ -66,7 +66,7 @@ def load_analysis_results_from_mysql(analysis_date_str):
             topic_name AS Name,
             representation AS Representation
         FROM topic_info
-        WHERE DATE(analysis_date) = %s;
+        WHERE analysis_day = %s;
         """
         freq_df = pd.read_sql(select_topic_info_sql, conn, params=(analysis_date.strftime('%Y-%m-%d'),))
         
@@ -94,6 +94,36 @@ def load_analysis_results_from_mysql(analysis_date_str):
         if conn:
             conn.close()
 
+# --- 화면에 표시할 기사의 본문만 가져오기 ---
+@st.cache_data(ttl=300)
+def load_article_bodies_from_mysql(article_ids, analysis_date_str):
+    """news_article_bodies에서 지정된 기사들의 본문을 {article_id: original_text}로 가져옵니다."""
+    if not article_ids:
+        return {}
+    conn = None
+    try:
+        conn = pymysql.connect(
+            host=MYSQL_HOST,
+            user=MYSQL_USER,
+            password=MYSQL_PASSWORD,
+            db=MYSQL_DB,
+            charset='utf8mb4',
+            cursorclass=pymysql.cursors.DictCursor
+        )
+        placeholders = ', '.join(['%s'] * len(article_ids))
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"SELECT article_id, original_text FROM news_article_bodies WHERE analysis_day = %s AND article_id IN ({placeholders});",
+                [analysis_date_str] + list(article_ids)
+            )
+            return {row['article_id']: row['original_text'] for row in cursor.fetchall()}
+    except pymysql.Error as e:
+        st.error(f"MySQL에서 기사 본문을 가져오는 중 오류 발생: {e}")
+        return {}
+    finally:
+        if conn:
+            conn.close()
+
 # --- MySQL에서 분석이 수행된 날짜 목록 가져오기 ---
 @st.cache_data(ttl=3600) # 1시간마다 갱신 (새로운 분석 날짜가 추가될 수 있으므로)
 def get_available_analysis_dates():
@@ -109,7 +139,7 @@ def get_available_analysis_dates():
         )
         cursor = conn.cursor()
         # analysis_date가 있는 모든 고유한 날짜를 최신순으로 가져옴
-        cursor.execute("SELECT DISTINCT DATE(analysis_date) AS distinct_date FROM news_articles ORDER BY distinct_date DESC;")
+        cursor.execute("SELECT DISTINCT analysis_day AS distinct_date FROM news_articles ORDER BY distinct_date DESC;")
         dates = [row['distinct_date'].strftime('%Y-%m-%d') for row in cursor.fetchall()]
         return dates
     except pymysql.Error as e:
@@ -263,9 +293,14 @@ def main():
             
             if not topic_articles_df.empty:
                 num_display_articles = st.slider("표시할 기사 수", 1, min(10, len(topic_articles_df)), 3)
-                for i, row in topic_articles_df.head(num_display_articles).iterrows():
+                display_articles_df = topic_articles_df.head(num_display_articles)
+                # 본문은 화면에 표시할 기사만 따로 조회
+                bodies = load_article_bodies_from_mysql(
+                    tuple(int(article_id) for article_id in display_articles_df['article_id']), selected_date_str
+                )
+                for i, row in display_articles_df.iterrows():
                     # st.expander를 사용하여 기사 내용을 숨기고 펼칠 수 있게 함
-                    st.expander(f"**{row['title']}** (확률: {row['probability']:.2f})").markdown(f"*{row['link']}*\n\n{row['original_text']}")
+                    st.expander(f"**{row['title']}** (확률: {row['probability']:.2f})").markdown(f"*{row['link']}*\n\n{bodies.get(row['article_id'], '')}")
             else:
                 st.info(f"토픽 {selected_topic}에 해당하는 기사가 없습니다.")
 
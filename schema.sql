@@ -0,0 +1,148 @@
+-- 뉴스 토픽 분석 시스템 스키마 (MySQL 8.0+)
+-- 새로 설치하는 경우 이 파일을 실행하고, 기존 DB는 migrations/ 디렉토리의 파일을 순서대로 적용하세요.
+
+CREATE DATABASE IF NOT EXISTS news_analysis_db CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
+USE news_analysis_db;
+
+-- news_articles, news_article_bodies, topic_results, article_terms는 analysis_day 기준 일 단위 RANGE 파티션 (pYYYYMMDD)
+-- 설치 후 `python mlnews/db_maintenance.py add-partitions`로 날짜 파티션을 만들고 매일 실행하세요.
+-- 파티션 테이블은 외래 키를 쓸 수 없고, 모든 PRIMARY/UNIQUE 키에 analysis_day가 포함되어야 합니다.
+-- analysis_day는 DATE(analysis_date) 생성 컬럼입니다. 새 스키마에서는 analysis_date와 값이 같지만,
+-- analysis_date를 DATETIME으로 만든 기존 DB(분석 작업은 실행 시각을 저장)와 같은 키·쿼리를 쓰기 위해 유지합니다.
+CREATE TABLE IF NOT EXISTS news_articles (
+    id INT AUTO_INCREMENT,
+    title VARCHAR(512) NOT NULL,
+    link VARCHAR(512) NOT NULL,
+    pub_date DATETIME,
+    analysis_date DATE NOT NULL,
+    analysis_day DATE AS (DATE(analysis_date)) STORED, -- 날짜 범위 조회용 (DATE() 함수 없이 인덱스 사용)
+    PRIMARY KEY (id, analysis_day),
+    UNIQUE KEY uq_news_articles_link_day (link, analysis_day),
+    INDEX(analysis_date),
+    INDEX idx_news_articles_pub_date (pub_date),
+    INDEX idx_news_articles_day_pub (analysis_day, pub_date)
+)
+PARTITION BY RANGE COLUMNS (analysis_day) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
+
+-- 기사 본문 (news_articles와 같은 (id, analysis_day) 키로 1:1 대응)
+-- 목록 조회가 본문 페이지를 읽지 않도록 메타데이터와 분리하고, 본문은 기사를 열어 볼 때만 조회
+-- 압축 행 포맷을 쓰지 않으려면 ROW_FORMAT, KEY_BLOCK_SIZE를 제거하세요. (innodb_file_per_table 필요)
+CREATE TABLE IF NOT EXISTS news_article_bodies (
+    article_id INT NOT NULL,
+    analysis_day DATE NOT NULL,
+    original_text MEDIUMTEXT, -- 네이버 API의 description (원문으로 사용)
+    processed_text MEDIUMTEXT,
+    PRIMARY KEY (article_id, analysis_day)
+)
+ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8
+PARTITION BY RANGE COLUMNS (analysis_day) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
+
+-- 키워드 검색용 역색인: 분석 날짜별 (토큰, 기사 ID, 빈도)
+-- 토큰은 분석 작업의 Okt 전처리 결과 (본문 + 제목)와 제목·본문의 소문자 영문 토큰. LIKE '%키워드%' 전체 스캔 대신 (term, analysis_day) 범위만 읽음
+-- (파티션 테이블에는 FULLTEXT 인덱스를 만들 수 없으므로 토큰 테이블로 구현)
+CREATE TABLE IF NOT EXISTS article_terms (
+    analysis_day DATE NOT NULL,
+    term VARCHAR(100) NOT NULL,
+    article_id INT NOT NULL,
+    tf SMALLINT UNSIGNED NOT NULL,
+    PRIMARY KEY (term, analysis_day, article_id)
+)
+PARTITION BY RANGE COLUMNS (analysis_day) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
+
+CREATE TABLE IF NOT EXISTS topic_info (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    analysis_date DATE NOT NULL,
+    topic_id INT NOT NULL,
+    topic_name VARCHAR(255),
+    representation JSON,
+    topic_count INT,
+    article_count INT, -- 노이즈 재할당 후 topic_results에 저장된 기사 수
+    analysis_day DATE AS (DATE(analysis_date)) STORED,
+    UNIQUE (analysis_date, topic_id),
+    INDEX idx_topic_info_day_topic (analysis_day, topic_id, topic_count)
+);
+
+-- 토픽별 상위 본문 키워드 빈도 (분석 시점에 계산, 제목 토큰 제외, 키워드 빈도 조회는 이 테이블만 읽음)
+CREATE TABLE IF NOT EXISTS topic_keywords (
+    analysis_day DATE NOT NULL,
+    topic_id INT NOT NULL,
+    keyword_rank SMALLINT NOT NULL,
+    keyword VARCHAR(100) NOT NULL,
+    frequency INT NOT NULL,
+    PRIMARY KEY (analysis_day, topic_id, keyword_rank)
+);
+
+CREATE TABLE IF NOT EXISTS topic_results (
+    id INT AUTO_INCREMENT,
+    article_id INT NOT NULL,
+    topic_id INT NOT NULL,
+    probability DOUBLE,
+    analysis_date DATE NOT NULL,
+    pub_date DATETIME, -- news_articles.pub_date와 같은 값 (토픽별 최신 기사 조회용)
+    analysis_day DATE AS (DATE(analysis_date)) STORED,
+    PRIMARY KEY (id, analysis_day),
+    UNIQUE KEY uq_topic_results_article_run (article_id, analysis_date, analysis_day),
+    INDEX idx_topic_results_article (article_id),
+    INDEX(analysis_date, topic_id),
+    INDEX idx_topic_results_day_topic (analysis_day, topic_id, probability),
+    INDEX idx_topic_results_day_topic_pub (analysis_day, topic_id, pub_date)
+)
+PARTITION BY RANGE COLUMNS (analysis_day) (
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
+
+-- 날짜 x 토픽 집계 (분석 실행이 끝날 때 해당 날짜 행만 교체)
+-- 트렌드 차트/도구는 topic_results를 다시 집계하지 않고 이 테이블만 읽음
+CREATE TABLE IF NOT EXISTS topic_daily_rollup (
+    analysis_day DATE NOT NULL,
+    topic_id INT NOT NULL,
+    global_topic_id INT, -- topic_lineage와 같은 값 (날짜 간 같은 토픽 추적용)
+    topic_name VARCHAR(255),
+    article_count INT NOT NULL,
+    mean_probability DOUBLE,
+    top_keywords JSON, -- topic_info.representation과 같은 키워드 목록
+    PRIMARY KEY (analysis_day, topic_id),
+    INDEX idx_topic_daily_rollup_day_count (analysis_day, article_count),
+    INDEX idx_topic_daily_rollup_global (global_topic_id, analysis_day)
+);
+
+-- 날짜 간 같은 토픽을 가리키는 전역 토픽 (분석 실행이 최근 전역 토픽과 중심 임베딩/키워드 유사도로 연결)
+CREATE TABLE IF NOT EXISTS global_topics (
+    global_topic_id INT AUTO_INCREMENT PRIMARY KEY,
+    label VARCHAR(255), -- 마지막으로 연결된 날짜의 토픽 이름
+    first_seen DATE NOT NULL,
+    last_seen DATE NOT NULL,
+    centroid MEDIUMBLOB NOT NULL, -- L2 정규화된 float32 중심 임베딩
+    keywords JSON, -- 마지막으로 연결된 날짜의 c-TF-IDF 키워드 가중치 {키워드: 가중치}
+    -- last_seen 날짜를 반영하기 전의 상태 (같은 날짜를 다시 분석할 때 되돌리는 용도)
+    previous_label VARCHAR(255),
+    previous_last_seen DATE,
+    previous_centroid MEDIUMBLOB,
+    previous_keywords JSON,
+    INDEX idx_global_topics_last_seen (last_seen),
+    INDEX idx_global_topics_first_seen (first_seen)
+);
+
+-- 날짜별 토픽 ID -> 전역 토픽 ID 연결 (분석 실행이 끝날 때 해당 날짜 행만 교체)
+CREATE TABLE IF NOT EXISTS topic_lineage (
+    analysis_day DATE NOT NULL,
+    topic_id INT NOT NULL,
+    global_topic_id INT NOT NULL,
+    similarity DOUBLE NOT NULL, -- 연결된 전역 토픽과의 유사도 (새 전역 토픽이면 0)
+    PRIMARY KEY (analysis_day, topic_id),
+    INDEX idx_topic_lineage_global_day (global_topic_id, analysis_day)
+);
+
+-- 증분 수집 상태: 쿼리별로 마지막으로 수집한 기사의 pubDate(KST)와 link
+CREATE TABLE IF NOT EXISTS collection_state (
+    search_query VARCHAR(100) PRIMARY KEY,
+    last_pub_date DATETIME NOT NULL,
+    last_link VARCHAR(512),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);